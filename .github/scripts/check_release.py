@@ -17,22 +17,80 @@ from __future__ import annotations
 
 import argparse
 import copy
+import gzip
+import hashlib
+import http.client
 import json
 import os
 import re
+import sqlite3
+import statistics
 import sys
+import threading
 import time
-from dataclasses import asdict, dataclass
-from datetime import datetime, timezone
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+# Optional codecs, resolved once at import. orjson only speeds up (de)serialization and
+# produces the same bytes as json; zstandard is needed only when a .zst file is touched.
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+try:
+    import zstandard  # type: ignore
+except ModuleNotFoundError:
+    zstandard = None
 
 CACHE_PATH = Path(".cache/releases.json")
+SQLITE_SUFFIXES = {".sqlite", ".sqlite3", ".db"}
 LAST_NOTIFICATION_PATH = Path(".cache/last_notification.txt")
 REPOS_FILE = Path("repos.txt")
 CONFIG_PATH = Path("config.yaml")
 FEED_PATH = Path(".cache/release-feed.json")
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+FEED_DELTAS_DIR_NAME = "feed-deltas"
+FEED_MANIFEST_SCHEMA = "github-stars-release-feed-manifest/v1"
+STARRED_PAGES_PATH = Path(".cache/starred-pages.json")
+STARRED_PER_PAGE = 100
+EVENT_CURSOR_PATH = Path(".cache/event-cursor.json")
+WATCHED_PAGES_PATH = Path(".cache/watched-pages.json")
+SLACK_RECEIPTS_PATH = Path(".cache/slack-receipts.jsonl")
+SLACK_RECEIPT_TTL = timedelta(days=14)
+CHECKPOINT_PATH = Path(".cache/scan-checkpoint.json")
+CHECKPOINT_EVERY = 500
+CHECKPOINT_VERSION = 1
+EVENT_PAGES = 3
+RELEASE_TIMES_KEPT = 10
+CATCH_UP_PER_PAGE = 10
+CATCH_UP_MAX_PAGES = 5
+# Minimum time between checks per polling tier. Slightly under a day/week so that the
+# fixed cron slots (08/14/17 KST) do not drift a tier check by one extra run.
+POLLING_TIER_INTERVALS = {
+    "hot": timedelta(0),
+    "daily": timedelta(hours=20),
+    "weekly": timedelta(days=6, hours=12),
+}
 MAX_TEXT_LENGTH = 35_000
+SLACK_LENGTH_UNITS = ("chars", "bytes")
+SLACK_FORMATS = ("text", "blocks")
+# Slack rejects section blocks with more than 3,000 characters of text.
+SLACK_SECTION_TEXT_LIMIT = 3_000
+DEFAULT_CONCURRENCY = 4
+GITHUB_API_URL = "https://api.github.com"
+GRAPHQL_BATCH_SIZE = 50
+USER_AGENT = "github-stars-notification"
+DEFAULT_MAX_REQUESTS_PER_SECOND = 10.0
 
 DEFAULT_CONFIG: dict[str, Any] = {
     "special_projects": [],
@@ -41,10 +99,20 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "special_project_always_notify": True,
         "first_run_notify": True,
         "max_slack_text_length": MAX_TEXT_LENGTH,
+        "slack_length_unit": "chars",
+        "slack_format": "text",
     },
     "feed": {
         "output_path": str(FEED_PATH),
     },
+    "polling": {
+        "tiered": False,
+        "hot_max_interval_days": 14,
+        "daily_max_interval_days": 90,
+        "full_sweep_days": 7,
+        "fresh_within_hours": 0,
+        "unstarred_ttl_days": 30,
+    },
     "llm": {
         "enabled": False,
         "provider": "local",
@@ -73,13 +141,27 @@ class Release:
         }
 
 
+@dataclass(frozen=True)
+class StarredRepo:
+    """One starred repository as listed by `/user/starred` (only the fields the detector uses)."""
+
+    full_name: str
+    pushed_at: str = ""
+    archived: bool = False
+
+
 @dataclass(frozen=True)
 class DetectionResult:
     first_run: bool
     releases: list[Release]
-    current_cache: dict[str, dict[str, str]]
+    current_cache: dict[str, dict[str, Any]]
     scanned_repos: int
     repos_with_release: int
+    skipped_repos: int = 0
+    # Repos that still failed after the retry queue; they kept their previous cache entry.
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    # Previous entries of repos absent from this run, kept until their TTL (see `retain_unstarred`).
+    retained_repos: int = 0
 
 
 @dataclass(frozen=True)
@@ -89,6 +171,440 @@ class NotificationDecision:
 
 
 ReleaseFetcher = Callable[[str], dict[str, Any] | None]
+# `(repo, previous_cache_entry) -> raw releases published after the cached tag, newest first`
+MissedReleaseFetcher = Callable[[str, dict[str, Any]], list[dict[str, Any]]]
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchReleaseFetcher:
+    """ReleaseFetcher that can also resolve many repos with one API call.
+
+    `detect_releases` groups repos into `batch_size` chunks and calls `fetch_many`;
+    calling the object with a single repo keeps the plain `ReleaseFetcher` contract.
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[list[str]], dict[str, dict[str, Any] | None]],
+        batch_size: int,
+    ) -> None:
+        self.fetch_many = fetch_many
+        self.batch_size = max(1, batch_size)
+
+    def __call__(self, repo: str) -> dict[str, Any] | None:
+        return self.fetch_many([repo]).get(repo)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+@dataclass
+class FaultPolicy:
+    """Per-repo fault isolation for `detect_releases`.
+
+    A failed fetch no longer aborts the scan: the repo goes to a retry queue that is
+    drained after the main pass, `retry_attempts` rounds with exponential backoff. After
+    `breaker_threshold` consecutive failures the circuit opens and fetches are deferred
+    (not sent) until `breaker_cooldown` seconds have passed.
+    """
+
+    retry_attempts: int = 3
+    backoff_base: float = 2.0
+    max_backoff: float = 60.0
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 30.0
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], None] = time.sleep
+
+
+@dataclass(frozen=True)
+class FetchFailure:
+    """Stand-in for a raw release when fetching a repo failed under a `FaultPolicy`."""
+
+    error: str
+    message: str
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by the fetch workers of one scan."""
+
+    def __init__(self, threshold: int, cooldown: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """False while open; after the cooldown, requests pass again (half-open)."""
+        with self._lock:
+            return self.opened_at is None or self.clock() - self.opened_at >= self.cooldown
+
+    def wait_time(self) -> float:
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown - (self.clock() - self.opened_at))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = self.clock()
+
+
+class RunMetrics:
+    """Per-run phase timings, API call counts, sleep time and rate-limit headroom.
+
+    Shared by the API client, the scheduler and the fetch loop; thread-safe so
+    concurrent fetch workers can record into it. `snapshot()` is the feed `metrics` block.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.phases: dict[str, float] = {}
+        self.api_calls = 0
+        self.not_modified = 0
+        self.rate_limited = 0
+        self.status_counts: dict[str, int] = {}
+        self.fetch_latencies: list[float] = []
+        self.sleep_seconds = 0.0
+        self.throttled_seconds = 0.0
+        self.rate_limit: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.add_phase(name, self.clock() - started)
+
+    def timed_iter(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Charge the time spent producing each item (e.g. listing star pages lazily) to `name`."""
+        iterator = iter(items)
+        while True:
+            started = self.clock()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_phase(name, self.clock() - started)
+                return
+            self.add_phase(name, self.clock() - started)
+            yield item
+
+    def record_request(self, status: int, headers: dict[str, str], rate_limited: bool = False) -> None:
+        with self._lock:
+            self.api_calls += 1
+            self.status_counts[str(status)] = self.status_counts.get(str(status), 0) + 1
+            if status == 304:
+                self.not_modified += 1
+            if rate_limited:
+                self.rate_limited += 1
+        self.record_rate_limit(headers)
+
+    def record_rate_limit(self, headers: dict[str, str]) -> None:
+        remaining = parse_int(headers.get("x-ratelimit-remaining"), -1)
+        if remaining < 0:
+            return
+        with self._lock:
+            self.rate_limit["remaining"] = remaining
+            self.rate_limit["min_remaining"] = min(remaining, self.rate_limit.get("min_remaining", remaining))
+            limit = parse_int(headers.get("x-ratelimit-limit"), 0)
+            if limit > 0:
+                self.rate_limit["limit"] = limit
+            reset_at = parse_int(headers.get("x-ratelimit-reset"), 0)
+            if reset_at > 0:
+                self.rate_limit["reset_at"] = reset_at
+
+    def record_fetch(self, seconds: float) -> None:
+        with self._lock:
+            self.fetch_latencies.append(seconds)
+
+    def record_sleep(self, seconds: float, throttled: bool = False) -> None:
+        with self._lock:
+            if throttled:
+                self.throttled_seconds += seconds
+            else:
+                self.sleep_seconds += seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            latencies = list(self.fetch_latencies)
+            limit = self.rate_limit.get("limit", 0)
+            rate_limit: dict[str, Any] = dict(self.rate_limit)
+            if limit > 0 and "min_remaining" in rate_limit:
+                rate_limit["min_headroom_ratio"] = round(rate_limit["min_remaining"] / limit, 4)
+            return {
+                "phases_seconds": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+                "api": {
+                    "calls": self.api_calls,
+                    "not_modified": self.not_modified,
+                    "rate_limited": self.rate_limited,
+                    "status_counts": dict(sorted(self.status_counts.items())),
+                },
+                "fetch_latency_ms": {
+                    "count": len(latencies),
+                    **{
+                        name: round(percentile(latencies, fraction) * 1000, 2)
+                        for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0))
+                    },
+                },
+                "sleep_seconds": round(self.sleep_seconds, 4),
+                "throttled_seconds": round(self.throttled_seconds, 4),
+                "rate_limit": rate_limit,
+            }
+
+
+class RateLimitScheduler:
+    """Token bucket that paces GitHub requests from the rate-limit headers it observes.
+
+    While more than `low_watermark` of the quota is left, requests run at `max_rate`.
+    Below that, the remaining budget (minus `reserve`) is spread evenly until
+    `X-RateLimit-Reset`. `Retry-After` and 403/429 responses pause every worker.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
+        burst: int = 10,
+        reserve: int = 50,
+        low_watermark: float = 0.2,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        metrics: RunMetrics | None = None,
+    ) -> None:
+        self.max_rate = max(max_rate, 0.001)
+        self.rate = self.max_rate
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.reserve = reserve
+        self.low_watermark = low_watermark
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.sleep = sleep
+        self.metrics = metrics
+        self.paused_until = 0.0
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until one request may be sent."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._refill(now)
+                wait = self.paused_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            if self.metrics is not None:
+                self.metrics.record_sleep(wait, throttled=True)
+            self.sleep(wait)
+
+    def observe(self, headers: dict[str, str]) -> None:
+        """Update pacing from `X-RateLimit-Remaining`/`Limit`/`Reset` response headers."""
+        remaining = parse_int(headers.get("x-ratelimit-remaining"), -1)
+        reset_at = parse_int(headers.get("x-ratelimit-reset"), -1)
+        if remaining < 0 or reset_at < 0:
+            return
+        limit = parse_int(headers.get("x-ratelimit-limit"), 0)
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            budget = remaining - self.reserve
+            if budget <= 0:
+                self.paused_until = max(self.paused_until, float(reset_at))
+                return
+            if limit > 0 and remaining / limit > self.low_watermark:
+                self.rate = self.max_rate
+            else:
+                self.rate = min(self.max_rate, budget / max(1.0, reset_at - now))
+
+    def backoff(self, headers: dict[str, str], attempt: int) -> None:
+        """Pause all requests after a 403/429: honor `Retry-After`, then the reset time, then exponential backoff."""
+        retry_after = parse_int(headers.get("retry-after"), -1)
+        with self._lock:
+            now = self.clock()
+            if retry_after >= 0:
+                until = now + retry_after
+            elif headers.get("x-ratelimit-remaining") == "0" and parse_int(headers.get("x-ratelimit-reset"), 0) > now:
+                until = float(parse_int(headers.get("x-ratelimit-reset"), 0))
+            else:
+                until = now + min(self.max_backoff, self.backoff_base * 2**attempt)
+            self.paused_until = max(self.paused_until, until)
+
+
+def is_rate_limited_response(status: int, headers: dict[str, str], body: Any) -> bool:
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    message = str(body.get("message", "")).lower() if isinstance(body, dict) else ""
+    return "retry-after" in headers or headers.get("x-ratelimit-remaining") == "0" or "rate limit" in message
+
+
+class GitHubApiError(RuntimeError):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(f"GitHub API error {status}: {message}")
+        self.status = status
+
+
+@dataclass(frozen=True)
+class ApiResponse:
+    status: int
+    headers: dict[str, str]
+    body: Any
+
+
+def decode_api_body(status: int, headers: dict[str, str], raw_body: bytes, url: str) -> Any:
+    """Decode a JSON body; a non-JSON error page becomes None so the status alone is reported."""
+    if not raw_body.strip():
+        return None
+    content_type = headers.get("content-type", "")
+    if "json" not in content_type:
+        if status >= 400:
+            return None
+        raise GitHubApiError(status, f"{url}: expected JSON, got {content_type or 'no Content-Type'}")
+    try:
+        return json.loads(raw_body)
+    except ValueError as exc:
+        raise GitHubApiError(status, f"{url}: response body is not valid JSON") from exc
+
+
+class GitHubApiClient:
+    """Minimal urllib-based GitHub REST/GraphQL client used by the non-PyGithub fetchers."""
+
+    def __init__(
+        self,
+        token: str,
+        api_url: str = GITHUB_API_URL,
+        timeout: float = 30.0,
+        scheduler: RateLimitScheduler | None = None,
+        metrics: RunMetrics | None = None,
+        faults: FaultPolicy | None = None,
+    ) -> None:
+        self.token = token
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.scheduler = scheduler
+        self.metrics = metrics
+        # With a FaultPolicy, 5xx and transport errors are retried here; used for whole-run
+        # calls (star list, events) that have no per-repo retry queue behind them.
+        self.faults = faults
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        url = path if path.startswith(("http://", "https://")) else f"{self.api_url}/{path.lstrip('/')}"
+        request_headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {self.token}",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        request_headers.update(headers or {})
+        data = None
+        if payload is not None:
+            data = json.dumps(payload).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+
+        request = urllib.request.Request(url, data=data, headers=request_headers, method=method)
+        attempt = 0
+        transient_attempt = 0
+        while True:
+            try:
+                status, response_headers, body = self._send(request)
+            except GitHubApiError as exc:
+                if self.metrics is not None:
+                    self.metrics.record_request(exc.status, {}, False)
+                if not self._retry_transient(transient_attempt):
+                    raise
+                transient_attempt += 1
+                continue
+            rate_limited = is_rate_limited_response(status, response_headers, body)
+            if self.metrics is not None:
+                self.metrics.record_request(status, response_headers, rate_limited)
+            if status >= 500 and self._retry_transient(transient_attempt):
+                transient_attempt += 1
+                continue
+            if self.scheduler is None:
+                break
+            self.scheduler.observe(response_headers)
+            if not rate_limited or attempt >= self.scheduler.max_retries:
+                break
+            self.scheduler.backoff(response_headers, attempt)
+            self.scheduler.acquire()
+            attempt += 1
+
+        if status >= 400 and status != 404:
+            message = body.get("message", "") if isinstance(body, dict) else ""
+            raise GitHubApiError(status, message or url)
+        return ApiResponse(status=status, headers=response_headers, body=body)
+
+    def _retry_transient(self, attempt: int) -> bool:
+        if self.faults is None or attempt >= self.faults.retry_attempts:
+            return False
+        self.faults.sleep(min(self.faults.max_backoff, self.faults.backoff_base * 2**attempt))
+        if self.scheduler is not None:
+            self.scheduler.acquire()
+        return True
+
+    def _send(self, request: urllib.request.Request) -> tuple[int, dict[str, str], Any]:
+        """Send once; transport failures and undecodable bodies surface as `GitHubApiError`.
+
+        Status 0 means no HTTP response was received.
+        """
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status = response.status
+                response_headers = {key.lower(): value for key, value in response.headers.items()}
+                raw_body = response.read()
+        except urllib.error.HTTPError as exc:
+            status = exc.code
+            response_headers = {key.lower(): value for key, value in exc.headers.items()}
+            raw_body = exc.read()
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as exc:
+            raise GitHubApiError(0, f"{request.full_url}: {getattr(exc, 'reason', exc)}") from exc
+        return status, response_headers, decode_api_body(status, response_headers, raw_body, request.full_url)
+
+    def graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        response = self.request("POST", "graphql", payload={"query": query, "variables": variables or {}})
+        if not isinstance(response.body, dict):
+            raise GitHubApiError(response.status, "GraphQL response must be an object")
+        return response.body
 
 
 def utc_now() -> str:
@@ -233,10 +749,22 @@ def normalize_config(raw_config: dict[str, Any]) -> dict[str, Any]:
         DEFAULT_CONFIG["notification"]["max_slack_text_length"],
         minimum=1_000,
     )
+    for key, choices in (("slack_length_unit", SLACK_LENGTH_UNITS), ("slack_format", SLACK_FORMATS)):
+        value = str(notification.get(key) or DEFAULT_CONFIG["notification"][key]).strip().lower()
+        if value not in choices:
+            raise ValueError(f"notification.{key} must be one of {', '.join(choices)}")
+        notification[key] = value
 
     feed = config.setdefault("feed", {})
     feed["output_path"] = str(feed.get("output_path") or FEED_PATH)
 
+    polling = config.setdefault("polling", {})
+    polling["tiered"] = parse_bool(polling.get("tiered"), DEFAULT_CONFIG["polling"]["tiered"])
+    for key in ("hot_max_interval_days", "daily_max_interval_days", "full_sweep_days"):
+        polling[key] = parse_int(polling.get(key), DEFAULT_CONFIG["polling"][key], minimum=1)
+    for key in ("fresh_within_hours", "unstarred_ttl_days"):
+        polling[key] = parse_int(polling.get(key), DEFAULT_CONFIG["polling"][key], minimum=0)
+
     llm = config.setdefault("llm", {})
     llm["enabled"] = parse_bool(llm.get("enabled"), DEFAULT_CONFIG["llm"]["enabled"])
     llm["provider"] = str(llm.get("provider") or DEFAULT_CONFIG["llm"]["provider"])
@@ -254,40 +782,327 @@ def load_config(path: Path = CONFIG_PATH) -> dict[str, Any]:
     return normalize_config(load_yaml(raw))
 
 
+def dumps_json(data: Any, compact: bool = False) -> bytes:
+    """Key-sorted UTF-8 JSON, through orjson when it is installed (same output, much faster)."""
+    if orjson is None:
+        if compact:
+            return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return (json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    if compact:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+
+def loads_json(raw: bytes | str) -> Any:
+    return json.loads(raw) if orjson is None else orjson.loads(raw)
+
+
+def zstandard_module() -> Any:
+    if zstandard is None:
+        raise RuntimeError("zstandard is required for .zst files: pip install zstandard")
+    return zstandard
+
+
+def serialization_format(path: Path, raw: bytes | None = None) -> tuple[str | None, str]:
+    """Return `(compression, layout)` from magic bytes when reading, else from the extension.
+
+    Compression is None, `gzip` or `zstd`; layout is `json` (pretty), `compact` or `ndjson`.
+    Names: `.json`, `.min.json`, `.ndjson`/`.jsonl`, each optionally followed by `.gz` or `.zst`.
+    """
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    compression = {".gz": "gzip", ".zst": "zstd"}.get(suffixes[-1] if suffixes else "")
+    if raw is not None:
+        compression = "gzip" if raw[:2] == GZIP_MAGIC else "zstd" if raw[:4] == ZSTD_MAGIC else None
+    if compression and suffixes and suffixes[-1] in {".gz", ".zst"}:
+        suffixes = suffixes[:-1]
+    if suffixes and suffixes[-1] in {".ndjson", ".jsonl"}:
+        return compression, "ndjson"
+    if compression or suffixes[-2:] == [".min", ".json"]:
+        return compression, "compact"
+    return compression, "json"
+
+
+def encode_ndjson(data: Any) -> bytes:
+    """One line per top-level key (`{"k", "v"}`); list values get one `{"k", "i"}` line per item."""
+    lines: list[bytes] = []
+    items = data.items() if isinstance(data, dict) else [(None, data)]
+    for key, value in items:
+        if isinstance(value, list) and value:
+            lines.extend(dumps_json({"k": key, "i": item}, compact=True) for item in value)
+        else:
+            lines.append(dumps_json({"k": key, "v": value}, compact=True))
+    return b"".join(line + b"\n" for line in lines)
+
+
+def decode_ndjson(raw: bytes) -> Any:
+    data: dict[str, Any] = {}
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        record = loads_json(line)
+        if "i" in record:
+            data.setdefault(record["k"], []).append(record["i"])
+        else:
+            data[record["k"]] = record["v"]
+    return data.get(None, data) if set(data) == {None} else data
+
+
+def decode_document(path: Path, raw: bytes) -> Any:
+    compression, layout = serialization_format(path, raw)
+    if compression == "gzip":
+        raw = gzip.decompress(raw)
+    elif compression == "zstd":
+        raw = zstandard_module().ZstdDecompressor().decompressobj().decompress(raw)
+    return decode_ndjson(raw) if layout == "ndjson" else loads_json(raw)
+
+
+def encode_document(path: Path, data: Any) -> bytes:
+    compression, layout = serialization_format(path)
+    raw = encode_ndjson(data) if layout == "ndjson" else dumps_json(data, compact=layout == "compact")
+    if compression == "gzip":
+        # mtime=0 keeps the bytes reproducible for cache keys and artifact diffs.
+        return gzip.compress(raw, compresslevel=6, mtime=0)
+    if compression == "zstd":
+        return zstandard_module().ZstdCompressor(level=10).compress(raw)
+    return raw
+
+
 def load_json_file(path: Path, default: Any) -> Any:
+    """Read JSON in any supported layout/compression (see `serialization_format`)."""
     if not path.exists():
         return default
-    return json.loads(path.read_text(encoding="utf-8"))
+    return decode_document(path, path.read_bytes())
 
 
 def write_json_file(path: Path, data: Any) -> None:
+    """Write JSON in the layout/compression named by the file extension (plain `.json` stays pretty)."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    path.write_bytes(encode_document(path, data))
+
 
+class ReleaseHistoryStore:
+    """SQLite (WAL) release history with the per-repo cache state as a view on top.
 
-def load_cache(path: Path = CACHE_PATH) -> dict[str, dict[str, str]]:
+    `release_observations` is append-only with one row per (repo, tag) ever observed;
+    `cache_entries` holds the current cache entry per repo and is written row by row,
+    so a run only touches repos whose entry actually changed.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS cache_entries (repo TEXT PRIMARY KEY, entry TEXT NOT NULL)",
+        """CREATE TABLE IF NOT EXISTS release_observations (
+            repo TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            name TEXT NOT NULL DEFAULT '',
+            published TEXT NOT NULL,
+            html_url TEXT NOT NULL DEFAULT '',
+            is_special INTEGER NOT NULL DEFAULT 0,
+            observed_at TEXT NOT NULL,
+            PRIMARY KEY (repo, tag)
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_release_observations_repo ON release_observations (repo)",
+        "CREATE INDEX IF NOT EXISTS idx_release_observations_published ON release_observations (published)",
+        "CREATE INDEX IF NOT EXISTS idx_release_observations_is_special ON release_observations (is_special)",
+    )
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in self.SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    def load_cache(self) -> dict[str, dict[str, Any]]:
+        with closing(self.connect()) as connection:
+            rows = connection.execute("SELECT repo, entry FROM cache_entries ORDER BY rowid").fetchall()
+        return {repo: json.loads(entry) for repo, entry in rows}
+
+    def save_cache(self, data: dict[str, dict[str, Any]], releases: Iterable[Release] = ()) -> None:
+        encoded = {
+            repo: json.dumps(entry, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+            for repo, entry in data.items()
+        }
+        with closing(self.connect()) as connection, connection:
+            stored = dict(connection.execute("SELECT repo, entry FROM cache_entries").fetchall())
+            connection.executemany(
+                "INSERT INTO cache_entries (repo, entry) VALUES (?, ?) "
+                "ON CONFLICT(repo) DO UPDATE SET entry = excluded.entry",
+                [(repo, entry) for repo, entry in encoded.items() if stored.get(repo) != entry],
+            )
+            connection.executemany(
+                "DELETE FROM cache_entries WHERE repo = ?",
+                [(repo,) for repo in stored if repo not in encoded],
+            )
+            self._record(connection, releases)
+
+    def record_releases(self, releases: Iterable[Release]) -> None:
+        with closing(self.connect()) as connection, connection:
+            self._record(connection, releases)
+
+    @staticmethod
+    def _record(connection: sqlite3.Connection, releases: Iterable[Release]) -> None:
+        observed_at = utc_now()
+        connection.executemany(
+            "INSERT INTO release_observations (repo, tag, name, published, html_url, is_special, observed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(repo, tag) DO UPDATE SET is_special = max(is_special, excluded.is_special)",
+            [
+                (
+                    release.repo,
+                    release.tag,
+                    release.name,
+                    release.published,
+                    release.html_url,
+                    int(release.is_special),
+                    observed_at,
+                )
+                for release in releases
+            ],
+        )
+
+    def history(self, repo: str) -> list[Release]:
+        """Observed releases of one repo, newest first."""
+        with closing(self.connect()) as connection:
+            rows = connection.execute(
+                "SELECT repo, tag, name, published, html_url, is_special FROM release_observations "
+                "WHERE repo = ? ORDER BY published DESC",
+                (normalize_repo_name(repo),),
+            ).fetchall()
+        return [Release(*row[:5], is_special=bool(row[5])) for row in rows]
+
+    def import_json_cache(self, json_path: Path) -> int:
+        """One-time import of a legacy `releases.json`; returns the number of repos imported."""
+        data = load_json_file(json_path, {})
+        if not isinstance(data, dict):
+            return 0
+        releases = [
+            raw_release_to_release(repo, entry, set())
+            for repo, entry in data.items()
+            if isinstance(entry, dict) and entry.get("tag") and entry.get("published")
+        ]
+        self.save_cache({**self.load_cache(), **data}, releases)
+        return len(data)
+
+
+def is_sqlite_cache(path: Path) -> bool:
+    return path.suffix.lower() in SQLITE_SUFFIXES
+
+
+def load_cache(path: Path = CACHE_PATH) -> dict[str, dict[str, Any]]:
+    if is_sqlite_cache(path):
+        legacy_json = path.with_suffix(".json")
+        if not path.exists() and legacy_json.exists():
+            ReleaseHistoryStore(path).import_json_cache(legacy_json)
+        if not path.exists():
+            return {}
+        return ReleaseHistoryStore(path).load_cache()
     data = load_json_file(path, {})
     if not isinstance(data, dict):
         return {}
     return data
 
 
-def save_cache(data: dict[str, dict[str, str]], path: Path = CACHE_PATH) -> None:
+def save_cache(data: dict[str, dict[str, Any]], path: Path = CACHE_PATH, releases: Iterable[Release] = ()) -> None:
+    """Persist the cache; SQLite paths also append `releases` to the release history."""
+    if is_sqlite_cache(path):
+        ReleaseHistoryStore(path).save_cache(data, releases)
+        return
     write_json_file(path, data)
 
 
-def read_repos(path: Path = REPOS_FILE) -> list[str]:
-    repos: list[str] = []
+def parse_starred_line(line: str) -> StarredRepo | None:
+    """Parse one `repos.txt` line: a bare `owner/repo` or a JSON object from `/user/starred`."""
+    stripped = line.strip()
+    if not stripped:
+        return None
+    if not stripped.startswith("{"):
+        return StarredRepo(normalize_repo_name(stripped))
+    item = json.loads(stripped)
+    return StarredRepo(
+        full_name=normalize_repo_name(str(item.get("full_name") or "")),
+        pushed_at=str(item.get("pushed_at") or ""),
+        archived=parse_bool(item.get("archived")),
+    )
+
+
+def read_starred_repos(path: Path = REPOS_FILE) -> list[StarredRepo]:
+    repos: list[StarredRepo] = []
     seen: set[str] = set()
     for line in path.read_text(encoding="utf-8").splitlines():
-        repo = normalize_repo_name(line)
-        if not repo or repo in seen:
+        starred = parse_starred_line(line)
+        if starred is None or not starred.full_name or starred.full_name in seen:
             continue
-        repos.append(repo)
-        seen.add(repo)
+        repos.append(starred)
+        seen.add(starred.full_name)
     return repos
 
 
+def read_repos(path: Path = REPOS_FILE) -> list[str]:
+    return [starred.full_name for starred in read_starred_repos(path)]
+
+
+def iter_starred_repos(
+    client: GitHubApiClient,
+    page_cache: dict[str, Any],
+    per_page: int = STARRED_PER_PAGE,
+    starred_path: str = "user/starred",
+) -> Iterator[StarredRepo]:
+    """Stream `/user/starred` (or another user's `users/{login}/starred`) page by page, oldest star first.
+
+    `sort=created&direction=asc` keeps earlier pages stable as new stars are appended,
+    so each page is requested with its saved ETag and a 304 replays the cached items.
+    `page_cache` is updated in place (`{page: {"etag", "items"}}`) and pages past the
+    end of the list are dropped once the last page has been read.
+    """
+    seen: set[str] = set()
+    page = 1
+    while True:
+        cached = page_cache.get(str(page)) or {}
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") else {}
+        if client.scheduler is not None:
+            client.scheduler.acquire()
+        response = client.request(
+            "GET",
+            f"{starred_path}?sort=created&direction=asc&per_page={per_page}&page={page}",
+            headers=headers,
+        )
+        if response.status == 304 and "items" in cached:
+            items = cached["items"]
+        elif isinstance(response.body, list):
+            items = [
+                asdict(
+                    StarredRepo(
+                        full_name=normalize_repo_name(str(item.get("full_name") or "")),
+                        pushed_at=str(item.get("pushed_at") or ""),
+                        archived=parse_bool(item.get("archived")),
+                    )
+                )
+                for item in response.body
+                if isinstance(item, dict)
+            ]
+            page_cache[str(page)] = {"etag": response.headers.get("etag", ""), "items": items}
+        else:
+            raise GitHubApiError(response.status, "/user/starred must return a list")
+
+        for item in items:
+            starred = StarredRepo(**item)
+            if starred.full_name and starred.full_name not in seen:
+                seen.add(starred.full_name)
+                yield starred
+
+        if len(items) < per_page:
+            break
+        page += 1
+
+    for stale in [key for key in page_cache if parse_int(key, 0) > page]:
+        del page_cache[stale]
+
+
 def raw_release_to_release(repo: str, raw: dict[str, Any], special_projects: set[str]) -> Release:
     tag = str(raw.get("tag_name") or raw.get("tag") or "").strip()
     published = str(raw.get("published_at") or raw.get("published") or "").strip()
@@ -303,7 +1118,12 @@ def raw_release_to_release(repo: str, raw: dict[str, Any], special_projects: set
     )
 
 
-def get_github_release_fetcher(token: str) -> ReleaseFetcher:
+def get_github_release_fetcher(
+    token: str,
+    scheduler: RateLimitScheduler | None = None,
+    metrics: RunMetrics | None = None,
+    api_url: str = GITHUB_API_URL,
+) -> ReleaseFetcher:
     try:
         from github import Github  # type: ignore
         from github.GithubException import GithubException  # type: ignore
@@ -313,12 +1133,31 @@ def get_github_release_fetcher(token: str) -> ReleaseFetcher:
             "Install .github/scripts/requirements.txt or use --fixture-releases for local tests."
         ) from exc
 
-    gh = Github(token)
+    # PyGithub sleeps 0.25s between requests by default; the scheduler already paces them.
+    throttle = {"seconds_between_requests": None} if scheduler is not None else {}
+    gh = Github(token, base_url=api_url.rstrip("/"), **throttle)
+
+    def observe_rate_limit() -> None:
+        if scheduler is None and metrics is None:
+            return
+        remaining, limit = gh.rate_limiting
+        headers = {
+            "x-ratelimit-remaining": str(remaining),
+            "x-ratelimit-limit": str(limit),
+            "x-ratelimit-reset": str(gh.rate_limiting_resettime),
+        }
+        if scheduler is not None:
+            scheduler.observe(headers)
+        if metrics is not None:
+            # get_repo + get_latest_release
+            for _ in range(2):
+                metrics.record_request(200, headers)
 
     def fetch(repo: str) -> dict[str, Any] | None:
         try:
             repository = gh.get_repo(repo)
             latest_release = repository.get_latest_release()
+            observe_rate_limit()
             return {
                 "tag_name": latest_release.tag_name,
                 "name": latest_release.title,
@@ -326,6 +1165,7 @@ def get_github_release_fetcher(token: str) -> ReleaseFetcher:
                 "html_url": latest_release.html_url,
             }
         except GithubException as exc:  # pragma: no cover - exercised in Actions/live use
+            observe_rate_limit()
             if exc.status == 404:
                 return None
             raise
@@ -333,27 +1173,304 @@ def get_github_release_fetcher(token: str) -> ReleaseFetcher:
     return fetch
 
 
-def load_fixture_fetcher(path: Path) -> ReleaseFetcher:
+def format_github_timestamp(value: str) -> str:
+    """Render an ISO-8601 GitHub timestamp like the PyGithub fetcher (`YYYY-MM-DD HH:MM:SS`, UTC)."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def build_latest_release_query(repos: list[str]) -> tuple[str, dict[str, str]]:
+    """Build one aliased GraphQL query that asks for `latestRelease` of every repo."""
+    declarations: list[str] = []
+    fields: list[str] = []
+    variables: dict[str, str] = {}
+    for index, repo in enumerate(repos):
+        owner, name = repo.split("/", 1)
+        variables[f"o{index}"] = owner
+        variables[f"n{index}"] = name
+        declarations.append(f"$o{index}: String!, $n{index}: String!")
+        fields.append(
+            f"r{index}: repository(owner: $o{index}, name: $n{index}) "
+            "{ latestRelease { tagName name publishedAt url } }"
+        )
+    query = f"query({', '.join(declarations)}) {{\n  " + "\n  ".join(fields) + "\n}"
+    return query, variables
+
+
+def get_graphql_release_fetcher(
+    token: str,
+    api_url: str = GITHUB_API_URL,
+    batch_size: int = GRAPHQL_BATCH_SIZE,
+    scheduler: RateLimitScheduler | None = None,
+    metrics: RunMetrics | None = None,
+) -> BatchReleaseFetcher:
+    client = GitHubApiClient(token, api_url, scheduler=scheduler, metrics=metrics)
+
+    def fetch_many(repos: list[str]) -> dict[str, dict[str, Any] | None]:
+        results: dict[str, dict[str, Any] | None] = {repo: None for repo in repos}
+        queryable = [repo for repo in repos if "/" in normalize_repo_name(repo)]
+        if not queryable:
+            return results
+
+        query, variables = build_latest_release_query([normalize_repo_name(repo) for repo in queryable])
+        body = client.graphql(query, variables)
+        fatal_errors = [error for error in body.get("errors") or [] if error.get("type") != "NOT_FOUND"]
+        if fatal_errors:
+            raise GitHubApiError(200, "; ".join(str(error.get("message", error)) for error in fatal_errors))
+
+        data = body.get("data") or {}
+        for index, repo in enumerate(queryable):
+            node = (data.get(f"r{index}") or {}).get("latestRelease")
+            if not node or not node.get("tagName") or not node.get("publishedAt"):
+                continue
+            results[repo] = {
+                "tag_name": node["tagName"],
+                "name": node.get("name") or "",
+                "published_at": format_github_timestamp(node["publishedAt"]),
+                "html_url": node.get("url") or "",
+            }
+        return results
+
+    return BatchReleaseFetcher(fetch_many, min(batch_size, 100))
+
+
+def cache_validators(raw: dict[str, Any]) -> dict[str, str]:
+    """HTTP validators a fetcher attached to a raw release, stored next to the cache entry."""
+    return {key: str(raw[key]) for key in ("etag", "last_modified") if raw.get(key)}
+
+
+def get_rest_release_fetcher(
+    token: str,
+    previous_cache: dict[str, dict[str, Any]],
+    api_url: str = GITHUB_API_URL,
+    scheduler: RateLimitScheduler | None = None,
+    metrics: RunMetrics | None = None,
+) -> ReleaseFetcher:
+    """Fetch `/releases/latest` with `If-None-Match`/`If-Modified-Since` from the previous cache.
+
+    A 304 reuses the cached entry (GitHub does not charge 304s against the rate limit);
+    a 200 returns the fresh release together with its `etag`/`last_modified` validators.
+    """
+    client = GitHubApiClient(token, api_url, scheduler=scheduler, metrics=metrics)
+
+    def fetch(repo: str) -> dict[str, Any] | None:
+        repo = normalize_repo_name(repo)
+        previous = previous_cache.get(repo) or {}
+        headers: dict[str, str] = {}
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+        response = client.request("GET", f"repos/{repo}/releases/latest", headers=headers)
+        if response.status == 304 and previous.get("tag"):
+            return dict(previous)
+        if response.status == 404 or not isinstance(response.body, dict):
+            return None
+
+        body = response.body
+        published = body.get("published_at")
+        raw: dict[str, Any] = {
+            "tag_name": body.get("tag_name"),
+            "name": body.get("name") or "",
+            "published_at": format_github_timestamp(published) if published else "",
+            "html_url": body.get("html_url") or "",
+        }
+        if response.headers.get("etag"):
+            raw["etag"] = response.headers["etag"]
+        if response.headers.get("last-modified"):
+            raw["last_modified"] = response.headers["last-modified"]
+        return raw
+
+    return fetch
+
+
+def releases_since(candidates: Iterable[dict[str, Any]], previous: dict[str, Any]) -> list[dict[str, Any]]:
+    """Take releases (newest first) until the cached tag or anything not newer than it.
+
+    Drafts and prereleases are ignored to match `/releases/latest`. Consumption stops
+    at the first cached release, so lazily paged `candidates` stop fetching early.
+    """
+    stop_tag = previous.get("tag")
+    stop_published = parse_timestamp(previous.get("published"))
+    missed: list[dict[str, Any]] = []
+    for raw in candidates:
+        if raw.get("draft") or raw.get("prerelease"):
+            continue
+        tag = raw.get("tag_name") or raw.get("tag")
+        published = parse_timestamp(raw.get("published_at") or raw.get("published"))
+        if tag == stop_tag or (stop_published is not None and published is not None and published <= stop_published):
+            break
+        missed.append(raw)
+    return missed
+
+
+def get_missed_release_fetcher(
+    token: str,
+    api_url: str = GITHUB_API_URL,
+    scheduler: RateLimitScheduler | None = None,
+    per_page: int = CATCH_UP_PER_PAGE,
+    max_pages: int = CATCH_UP_MAX_PAGES,
+    metrics: RunMetrics | None = None,
+) -> MissedReleaseFetcher:
+    """Page `/repos/{repo}/releases` newest first and stop at the cached tag (usually one page)."""
+    client = GitHubApiClient(token, api_url, scheduler=scheduler, metrics=metrics)
+
+    def candidates(repo: str) -> Iterator[dict[str, Any]]:
+        for page in range(1, max_pages + 1):
+            if scheduler is not None:
+                scheduler.acquire()
+            body = client.request("GET", f"repos/{repo}/releases?per_page={per_page}&page={page}").body
+            if not isinstance(body, list):
+                return
+            for item in body:
+                if isinstance(item, dict) and item.get("tag_name") and item.get("published_at"):
+                    yield {
+                        "tag_name": item["tag_name"],
+                        "name": item.get("name") or "",
+                        "published_at": format_github_timestamp(item["published_at"]),
+                        "html_url": item.get("html_url") or "",
+                        "draft": bool(item.get("draft")),
+                        "prerelease": bool(item.get("prerelease")),
+                    }
+            if len(body) < per_page:
+                return
+
+    def fetch_missed(repo: str, previous: dict[str, Any]) -> list[dict[str, Any]]:
+        return releases_since(candidates(normalize_repo_name(repo)), previous)
+
+    return fetch_missed
+
+
+def load_fixture_releases(path: Path) -> dict[str, list[dict[str, Any]]]:
+    """Load fixture releases as `{repo: [release, ...]}`, newest first.
+
+    A repo maps to one release object, a list of releases (newest first), or null.
+    """
     fixture = load_json_file(path, {})
     if isinstance(fixture, list):
         fixture = {normalize_repo_name(str(item["repo"])): item for item in fixture}
     if not isinstance(fixture, dict):
         raise ValueError("fixture releases must be a mapping or a list of objects with repo")
 
-    normalized = {normalize_repo_name(str(repo)): value for repo, value in fixture.items()}
+    normalized: dict[str, list[dict[str, Any]]] = {}
+    for repo, value in fixture.items():
+        if value in (None, False):
+            value = []
+        values = value if isinstance(value, list) else [value]
+        if not all(isinstance(item, dict) for item in values):
+            raise ValueError(f"fixture release for {repo} must be an object, a list of objects, or null")
+        normalized[normalize_repo_name(str(repo))] = values
+    return normalized
+
+
+def load_fixture_fetcher(path: Path) -> ReleaseFetcher:
+    releases = load_fixture_releases(path)
 
     def fetch(repo: str) -> dict[str, Any] | None:
-        value = normalized.get(normalize_repo_name(repo))
-        if value in (None, False):
-            return None
-        if not isinstance(value, dict):
-            raise ValueError(f"fixture release for {repo} must be an object or null")
-        return value
+        values = releases.get(normalize_repo_name(repo)) or []
+        return next((value for value in values if not value.get("draft") and not value.get("prerelease")), None)
+
+    return fetch
+
+
+def load_fixture_missed_fetcher(path: Path) -> MissedReleaseFetcher:
+    releases = load_fixture_releases(path)
+
+    def fetch_missed(repo: str, previous: dict[str, Any]) -> list[dict[str, Any]]:
+        return releases_since(releases.get(normalize_repo_name(repo)) or [], previous)
+
+    return fetch_missed
+
+
+class SharedFetches:
+    """Fetch results shared by key across callers and threads.
+
+    The first caller of a key owns the fetch; concurrent callers of the same key wait
+    on its `Future` instead of fetching again. A failed fetch is not kept, so a later
+    call tries again.
+    """
+
+    def __init__(self) -> None:
+        self._futures: dict[Any, Future] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, keys: Iterable[Any]) -> tuple[list[Any], dict[Any, Future]]:
+        """Return the keys this caller must fetch (and then `resolve`) and the futures of all `keys`."""
+        owned: list[Any] = []
+        futures: dict[Any, Future] = {}
+        with self._lock:
+            for key in keys:
+                if key not in self._futures:
+                    self._futures[key] = Future()
+                    owned.append(key)
+                futures[key] = self._futures[key]
+        return owned, futures
+
+    def resolve(self, results: dict[Any, Any]) -> None:
+        with self._lock:
+            futures = [(self._futures[key], result) for key, result in results.items()]
+        for future, result in futures:
+            future.set_result(result)
+
+    def fail(self, keys: Iterable[Any], exc: BaseException) -> None:
+        with self._lock:
+            futures = [self._futures.pop(key) for key in keys]
+        for future in futures:
+            future.set_exception(exc)
+
+    def get(self, key: Any, fetch: Callable[[], T]) -> T:
+        owned, futures = self.claim([key])
+        if owned:
+            try:
+                self.resolve({key: fetch()})
+            except BaseException as exc:
+                self.fail(owned, exc)
+        return futures[key].result()
+
+
+def memoize_fetcher(fetch_release: ReleaseFetcher) -> ReleaseFetcher:
+    """Share one fetch per repo across several detection passes (e.g. multiple accounts).
+
+    Batch fetchers stay batch-aware and only request the repos not fetched (or being
+    fetched) yet. See `SharedFetches`.
+    """
+    shared = SharedFetches()
+
+    if isinstance(fetch_release, BatchReleaseFetcher):
+        batch_fetcher = fetch_release
+
+        def fetch_many(repos: list[str]) -> dict[str, dict[str, Any] | None]:
+            owned, futures = shared.claim(repos)
+            if owned:
+                try:
+                    fetched = batch_fetcher.fetch_many(owned)
+                    shared.resolve({repo: fetched.get(repo) for repo in owned})
+                except BaseException as exc:
+                    shared.fail(owned, exc)
+            return {repo: futures[repo].result() for repo in repos}
+
+        return BatchReleaseFetcher(fetch_many, batch_fetcher.batch_size)
+
+    def fetch(repo: str) -> dict[str, Any] | None:
+        return shared.get(repo, lambda: fetch_release(repo))
+
+    return fetch
+
+
+def memoize_missed_fetcher(fetch_missed: MissedReleaseFetcher) -> MissedReleaseFetcher:
+    """Share one catch-up lookup per `(repo, cached tag)` across several detection passes."""
+    shared = SharedFetches()
+
+    def fetch(repo: str, previous: dict[str, Any]) -> list[dict[str, Any]]:
+        return shared.get((repo, previous.get("tag")), lambda: fetch_missed(repo, previous))
 
     return fetch
 
 
-def is_new_release(repo: str, release: Release, previous_cache: dict[str, dict[str, str]], first_run: bool) -> bool:
+def is_new_release(repo: str, release: Release, previous_cache: dict[str, dict[str, Any]], first_run: bool) -> bool:
     if first_run:
         return True
     previous = previous_cache.get(normalize_repo_name(repo))
@@ -362,45 +1479,594 @@ def is_new_release(repo: str, release: Release, previous_cache: dict[str, dict[s
     return previous.get("tag") != release.tag or previous.get("published") != release.published
 
 
-def detect_releases(
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def map_in_order(func: Callable[[T], R], items: Iterable[T], concurrency: int) -> Iterator[tuple[T, R]]:
+    """Yield `(item, func(item))` in input order with up to `concurrency` calls in flight.
+
+    Submission is bounded to a small window ahead of the consumer, so `items` may be a
+    lazy iterable and memory stays proportional to `concurrency`, not to the item count.
+    """
+    if concurrency <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+
+    window = concurrency * 2
+    pending: deque[tuple[T, Future[R]]] = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="release-fetch")
+    try:
+        for item in items:
+            pending.append((item, executor.submit(func, item)))
+            if len(pending) >= window:
+                done_item, future = pending.popleft()
+                yield done_item, future.result()
+        while pending:
+            done_item, future = pending.popleft()
+            yield done_item, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_fetched_releases(
     repos: Iterable[str],
     fetch_release: ReleaseFetcher,
-    previous_cache: dict[str, dict[str, str]],
+    concurrency: int = 1,
+    sleep_seconds: float = 0,
+    scheduler: RateLimitScheduler | None = None,
+    metrics: RunMetrics | None = None,
+    breaker: CircuitBreaker | None = None,
+) -> Iterator[tuple[str, dict[str, Any] | FetchFailure | None]]:
+    """Yield `(repo, raw_release)` in input order, batching when the fetcher supports it.
+
+    With a `scheduler`, every fetch call first waits for a request token; `sleep_seconds`
+    is the legacy fixed delay after each hit. `metrics` records each fetch call's latency
+    (excluding the token wait) and the fixed delays. With a `breaker`, a failed call
+    yields a `FetchFailure` instead of raising, and calls are skipped while it is open.
+    """
+
+    def guarded(call: Callable[[T], R], arg: T) -> R | FetchFailure:
+        if breaker is None:
+            return timed(call, arg)
+        if not breaker.allow():
+            return FetchFailure("CircuitOpen", "skipped while the API looked degraded")
+        try:
+            result = timed(call, arg)
+        except Exception as exc:  # noqa: BLE001 - any per-repo failure is isolated and retried
+            breaker.record_failure()
+            return FetchFailure(type(exc).__name__, str(exc))
+        breaker.record_success()
+        return result
+
+    def pause() -> None:
+        if metrics is not None:
+            metrics.record_sleep(sleep_seconds)
+        time.sleep(sleep_seconds)
+
+    def timed(call: Callable[[T], R], arg: T) -> R:
+        if metrics is None:
+            return call(arg)
+        started = time.perf_counter()
+        try:
+            return call(arg)
+        finally:
+            metrics.record_fetch(time.perf_counter() - started)
+
+    if isinstance(fetch_release, BatchReleaseFetcher):
+
+        def fetch_batch(batch: list[str]) -> dict[str, dict[str, Any] | None] | FetchFailure:
+            if scheduler is not None and (breaker is None or breaker.allow()):
+                scheduler.acquire()
+            results = guarded(fetch_release.fetch_many, batch)
+            if sleep_seconds > 0:
+                pause()
+            return results
+
+        for batch, results in map_in_order(fetch_batch, chunked(repos, fetch_release.batch_size), concurrency):
+            for repo in batch:
+                yield repo, results if isinstance(results, FetchFailure) else results.get(repo)
+        return
+
+    def fetch(repo: str) -> dict[str, Any] | FetchFailure | None:
+        if scheduler is not None and (breaker is None or breaker.allow()):
+            scheduler.acquire()
+        raw = guarded(fetch_release, repo)
+        if raw and sleep_seconds > 0:
+            pause()
+        return raw
+
+    yield from map_in_order(fetch, repos, concurrency)
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    """Parse cache/feed timestamps (`YYYY-MM-DD HH:MM:SS` or ISO-8601) as aware UTC datetimes."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def polling_tier(entry: dict[str, Any], is_special: bool, now: datetime, polling: dict[str, Any]) -> str:
+    """Classify a repo as `hot`, `daily` or `weekly` from its observed release cadence.
+
+    The cadence is the median gap between the release timestamps kept in the cache
+    entry; with a single observation, the age of that release is used instead.
+    Special projects are always hot.
+    """
+    if is_special:
+        return "hot"
+    times = sorted(filter(None, (parse_timestamp(value) for value in entry.get("release_times") or [])))
+    if len(times) >= 2:
+        cadence = statistics.median(later - earlier for earlier, later in zip(times, times[1:]))
+    elif times:
+        cadence = now - times[0]
+    else:
+        return "weekly"
+    if cadence <= timedelta(days=polling["hot_max_interval_days"]):
+        return "hot"
+    if cadence <= timedelta(days=polling["daily_max_interval_days"]):
+        return "daily"
+    return "weekly"
+
+
+def skip_reason(
+    starred: StarredRepo,
+    previous: dict[str, Any] | None,
+    first_run: bool,
+    is_special: bool = False,
+    polling: dict[str, Any] | None = None,
+    now: datetime | None = None,
+) -> str | None:
+    """Return why a repo needs no release fetch this run, or None to fetch it.
+
+    With a `polling` policy, a repo unchecked for `full_sweep_days` is always fetched,
+    a non-special repo checked within `fresh_within_hours` is skipped, and `tiered`
+    polling skips repos that are not yet due for their cadence tier.
+    """
+    if starred.archived:
+        return "archived"
+    if first_run or not previous:
+        return None
+    if polling is not None and now is not None:
+        last_checked = parse_timestamp(previous.get("last_checked_at"))
+        if last_checked is not None:
+            age = now - last_checked
+            if age >= timedelta(days=polling["full_sweep_days"]):
+                return None
+            if not is_special and age < timedelta(hours=polling.get("fresh_within_hours", 0)):
+                return "checked_recently"
+            tier = polling_tier(previous, is_special, now, polling)
+            if polling["tiered"] and age < POLLING_TIER_INTERVALS[tier]:
+                return f"not_due_{tier}"
+    if starred.pushed_at and previous.get("pushed_at") == starred.pushed_at:
+        return "not_pushed_since_last_check"
+    return None
+
+
+def build_cache_entry(
+    previous: dict[str, Any] | None,
+    release: Release,
+    raw: dict[str, Any],
+    starred: StarredRepo,
+    checked_at: str,
+    missed: Iterable[Release] = (),
+) -> dict[str, Any]:
+    """Merge a fetched release into the repo's cache entry, keeping its release cadence history.
+
+    `missed` are releases found by catch-up between the cached and the latest tag; their
+    publish times join the history too. `last_checked_at` is this run; `last_changed_at`
+    moves only when the latest tag changes.
+    """
+    previous = previous or {}
+    observed = [*(previous.get("release_times") or []), *(item.published for item in missed), release.published]
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    release_times = sorted(set(observed), key=lambda value: parse_timestamp(value) or oldest)[-RELEASE_TIMES_KEPT:]
+    entry = {key: value for key, value in previous.items() if key not in {"etag", "last_modified"}}
+    entry.update(release.cache_entry())
+    entry.update(cache_validators(raw))
+    if starred.pushed_at:
+        entry["pushed_at"] = starred.pushed_at
+    entry["release_times"] = release_times
+    entry["last_checked_at"] = checked_at
+    if previous.get("tag") != release.tag:
+        entry["last_changed_at"] = checked_at
+    return entry
+
+
+def retain_unstarred(
+    current_cache: dict[str, dict[str, Any]],
+    previous_cache: dict[str, dict[str, Any]],
+    polling: dict[str, Any] | None,
+    now: datetime,
+) -> int:
+    """Carry over cache entries for repos absent from this run until `unstarred_ttl_days` pass.
+
+    A repo that drops out of the star list (unstarred, or missing from a partial list)
+    keeps its entry, so it is not reported as new if it comes back. The TTL counts from
+    `last_checked_at`; legacy entries without it are stamped now. Returns how many were kept.
+    """
+    if polling is None or polling.get("unstarred_ttl_days", 0) <= 0:
+        return 0
+    ttl = timedelta(days=polling["unstarred_ttl_days"])
+    checked_at = now.isoformat(timespec="seconds").replace("+00:00", "Z")
+    retained = 0
+    for repo, entry in previous_cache.items():
+        if repo in current_cache:
+            continue
+        last_checked = parse_timestamp(entry.get("last_checked_at"))
+        if last_checked is None:
+            entry = {**entry, "last_checked_at": checked_at}
+        elif now - last_checked >= ttl:
+            continue
+        current_cache[repo] = entry
+        retained += 1
+    return retained
+
+
+def detect_releases(
+    repos: Iterable[str | StarredRepo],
+    fetch_release: ReleaseFetcher,
+    previous_cache: dict[str, dict[str, Any]],
     special_projects: set[str],
     first_run: bool,
     sleep_seconds: float,
+    concurrency: int = 1,
+    scheduler: RateLimitScheduler | None = None,
+    skip_unchanged: bool = True,
+    polling: dict[str, Any] | None = None,
+    now: datetime | None = None,
+    fetch_missed: MissedReleaseFetcher | None = None,
+    metrics: RunMetrics | None = None,
+    checkpoint: Callable[[dict[str, Any]], None] | None = None,
+    checkpoint_every: int = CHECKPOINT_EVERY,
+    resume: dict[str, Any] | None = None,
+    faults: FaultPolicy | None = None,
+    event_releases: dict[str, dict[str, Any] | None] | None = None,
 ) -> DetectionResult:
-    current_cache: dict[str, dict[str, str]] = {}
-    new_releases: list[Release] = []
-    scanned = 0
-    repos_with_release = 0
+    """Fetch latest releases and keep the ones that differ from `previous_cache`.
+
+    With `fetch_missed`, a repo whose latest release changed is also asked for the
+    releases published between the cached tag and the new latest one, and each of
+    them is reported as its own `Release`.
+
+    Repos given as `StarredRepo` carry `pushed_at`/`archived`; with `skip_unchanged`,
+    archived repos, repos whose `pushed_at` matches the cache and (with a tiered
+    `polling` policy) repos not yet due for their tier are not fetched and keep their
+    previous cache entry. See `skip_reason`.
 
-    for repo in repos:
+    Repos in `event_releases` (see `collect_release_events`) that were checked before
+    are settled from the event stream without a fetch: a release there is recorded
+    like a fetched one, None confirms the cached entry as of this run.
+
+    Every `checkpoint_every` repos, `checkpoint` receives the partial scan state (cursor
+    into `repos`, repo-list digest, partial cache, releases, counters). Passing that state
+    back as `resume` together with the repos after the cursor (see `resume_repos`)
+    finishes with the same result as an uninterrupted scan.
+
+    Without `faults`, the first fetch error propagates. With a `FaultPolicy`, failed
+    repos keep their previous cache entry, are retried after the main pass, and the
+    ones that never succeed are reported in `DetectionResult.errors`.
+    """
+    if resume is not None:
+        now = parse_timestamp(resume["checked_at"]) or now
+        first_run = bool(resume["first_run"])
+    now = now or datetime.now(timezone.utc)
+    checked_at = now.isoformat(timespec="seconds").replace("+00:00", "Z")
+    current_cache: dict[str, dict[str, Any]] = dict(resume["current_cache"]) if resume else {}
+    new_releases: list[Release] = [Release(**release) for release in resume["releases"]] if resume else []
+    scanned = resume["scanned"] if resume else 0
+    repos_with_release = resume["repos_with_release"] if resume else 0
+    skipped = resume["skipped"] if resume else 0
+    cursor = resume["cursor"] if resume else 0
+    repos_digest = resume["repos_digest"] if resume else ""
+    planned: deque[tuple[StarredRepo, str | None]] = deque()
+    # Retry queue: repo -> (starred, last failure, attempts so far).
+    failed: dict[str, tuple[StarredRepo, FetchFailure, int]] = {}
+    for item in (resume or {}).get("failed", []):
+        starred = StarredRepo(**item["starred"])
+        failed[starred.full_name] = (starred, FetchFailure(item["error"], item["message"]), item["attempts"])
+    breaker = CircuitBreaker(faults.breaker_threshold, faults.breaker_cooldown, faults.clock) if faults else None
+
+    def repos_to_fetch() -> Iterator[str]:
+        for item in repos:
+            starred = item if isinstance(item, StarredRepo) else StarredRepo(normalize_repo_name(item))
+            previous = previous_cache.get(starred.full_name)
+            reason = None
+            if event_releases is not None and starred.full_name in event_releases:
+                if previous is not None or event_releases[starred.full_name]:
+                    reason = "release_event"
+            elif skip_unchanged:
+                is_special = starred.full_name in special_projects
+                reason = skip_reason(starred, previous, first_run, is_special, polling, now)
+            planned.append((starred, reason))
+            if reason is None:
+                yield starred.full_name
+
+    def advance(starred: StarredRepo) -> None:
+        """Move the cursor past a fully processed repo and checkpoint on schedule."""
+        nonlocal cursor, repos_digest
+        cursor += 1
+        repos_digest = chain_repo_digest(repos_digest, starred.full_name)
+        if checkpoint is not None and checkpoint_every > 0 and cursor % checkpoint_every == 0:
+            checkpoint(
+                {
+                    "version": CHECKPOINT_VERSION,
+                    "cursor": cursor,
+                    "repos_digest": repos_digest,
+                    "checked_at": checked_at,
+                    "first_run": first_run,
+                    "current_cache": current_cache,
+                    "releases": [asdict(release) for release in new_releases],
+                    "scanned": scanned,
+                    "repos_with_release": repos_with_release,
+                    "skipped": skipped,
+                    "failed": [
+                        {"starred": asdict(item), "error": failure.error, "message": failure.message, "attempts": count}
+                        for item, failure, count in failed.values()
+                    ],
+                }
+            )
+
+    def keep_previous(starred: StarredRepo) -> None:
+        nonlocal skipped, repos_with_release
+        skipped += 1
+        previous = previous_cache.get(starred.full_name)
+        if previous:
+            current_cache[starred.full_name] = previous
+            if previous.get("tag"):
+                repos_with_release += 1
+        advance(starred)
+
+    def settle_from_event(starred: StarredRepo) -> None:
+        nonlocal scanned
         scanned += 1
-        raw = fetch_release(repo)
+        failure = record(starred.full_name, starred, (event_releases or {}).get(starred.full_name))
+        if failure is not None:
+            defer(starred, failure, 1)
+        advance(starred)
+
+    def drain_skipped() -> None:
+        while planned and planned[0][1] is not None:
+            starred, reason = planned.popleft()
+            if reason == "release_event":
+                settle_from_event(starred)
+            else:
+                keep_previous(starred)
+
+    def record(repo: str, starred: StarredRepo, raw: dict[str, Any] | None) -> FetchFailure | None:
+        """Fold one fetched repo into the cache and releases; a failed catch-up leaves both untouched."""
+        nonlocal repos_with_release
         if not raw:
-            continue
+            # No release (or a 404): keep what we knew, so a release that reappears is not "new".
+            entry = dict(previous_cache.get(starred.full_name) or {})
+            if starred.pushed_at:
+                entry["pushed_at"] = starred.pushed_at
+            entry["last_checked_at"] = checked_at
+            current_cache[starred.full_name] = entry
+            # Counted like a kept entry on the skip and error paths, so the totals don't depend on how it failed.
+            if entry.get("tag"):
+                repos_with_release += 1
+            return None
 
-        release = raw_release_to_release(repo, raw, special_projects)
-        current_cache[release.repo] = release.cache_entry()
+        try:
+            release = raw_release_to_release(repo, raw, special_projects)
+        except ValueError as exc:
+            if faults is None:
+                raise
+            return FetchFailure(type(exc).__name__, str(exc))
+        previous = previous_cache.get(release.repo)
+        found = [release]
+        if is_new_release(release.repo, release, previous_cache, first_run):
+            if fetch_missed is not None and not first_run and previous and previous.get("tag"):
+                try:
+                    found.extend(
+                        raw_release_to_release(release.repo, missed, special_projects)
+                        for missed in fetch_missed(release.repo, previous)
+                        if (missed.get("tag_name") or missed.get("tag")) != release.tag
+                    )
+                except Exception as exc:
+                    if faults is None:
+                        raise
+                    return FetchFailure(type(exc).__name__, f"catch-up: {exc}")
+            new_releases.extend(found)
+        current_cache[release.repo] = build_cache_entry(previous, release, raw, starred, checked_at, found[1:])
         repos_with_release += 1
+        return None
 
-        if is_new_release(release.repo, release, previous_cache, first_run):
-            new_releases.append(release)
+    def defer(starred: StarredRepo, failure: FetchFailure, attempts: int) -> None:
+        failed[starred.full_name] = (starred, failure, attempts)
+        previous = previous_cache.get(starred.full_name)
+        if previous:
+            current_cache[starred.full_name] = previous
 
-        if sleep_seconds > 0:
-            time.sleep(sleep_seconds)
+    fetched = iter_fetched_releases(
+        repos_to_fetch(), fetch_release, concurrency, sleep_seconds, scheduler, metrics, breaker
+    )
+    for repo, raw in fetched:
+        drain_skipped()
+        starred, _ = planned.popleft()
+        scanned += 1
+        failure = raw if isinstance(raw, FetchFailure) else record(repo, starred, raw)
+        if failure is not None:
+            defer(starred, failure, 1)
+        advance(starred)
+    drain_skipped()
+
+    for attempt in range(faults.retry_attempts if faults and breaker else 0):
+        if not failed:
+            break
+        delay = min(faults.max_backoff, faults.backoff_base * 2**attempt)
+        faults.sleep(max(delay, breaker.wait_time()))
+        retry = dict(failed)
+        failed.clear()
+        names = list(retry)
+        for repo, raw in iter_fetched_releases(names, fetch_release, concurrency, 0, scheduler, metrics, breaker):
+            starred, _, attempts = retry[repo]
+            failure = raw if isinstance(raw, FetchFailure) else record(repo, starred, raw)
+            if failure is not None:
+                defer(starred, failure, attempts + 1)
+
+    retained = retain_unstarred(current_cache, previous_cache, polling, now)
+
+    errors = []
+    for starred, failure, attempts in sorted(failed.values(), key=lambda item: item[0].full_name):
+        if (previous_cache.get(starred.full_name) or {}).get("tag"):
+            repos_with_release += 1
+        errors.append(
+            {"repo": starred.full_name, "error": failure.error, "message": failure.message, "attempts": attempts}
+        )
 
     new_releases.sort(key=lambda item: item.published, reverse=True)
     return DetectionResult(
         first_run=first_run,
         releases=new_releases,
         current_cache=current_cache,
-        scanned_repos=scanned,
+        scanned_repos=scanned + skipped,
         repos_with_release=repos_with_release,
+        skipped_repos=skipped,
+        errors=errors,
+        retained_repos=retained,
     )
 
 
+def chain_repo_digest(digest: str, repo: str) -> str:
+    """Extend a running digest of the repo list by one repo, so a checkpoint can be matched against any prefix."""
+    return hashlib.sha256(f"{digest}\n{repo}".encode("utf-8")).hexdigest()
+
+
+def load_checkpoint(path: Path) -> dict[str, Any] | None:
+    checkpoint = load_json_file(path, None)
+    if not isinstance(checkpoint, dict) or checkpoint.get("version") != CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+
+def save_checkpoint(path: Path, checkpoint: dict[str, Any]) -> None:
+    """Write the checkpoint atomically so a run killed mid-write leaves the previous one intact."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(checkpoint, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def resume_repos(
+    repos: Iterable[str | StarredRepo],
+    checkpoint: dict[str, Any] | None,
+) -> tuple[Iterable[str | StarredRepo], dict[str, Any] | None]:
+    """Skip the repos a checkpoint already covers; return `(remaining_repos, usable_checkpoint)`.
+
+    The first `cursor` repos must hash to the checkpoint's `repos_digest`; stars added
+    after that prefix are fine. On a mismatch the full list is returned with no checkpoint.
+    """
+    if not checkpoint:
+        return repos, None
+    iterator = iter(repos)
+    prefix = list(islice(iterator, parse_int(checkpoint.get("cursor"), 0, minimum=0)))
+    digest = ""
+    for item in prefix:
+        repo = item.full_name if isinstance(item, StarredRepo) else normalize_repo_name(item)
+        digest = chain_repo_digest(digest, repo)
+    if len(prefix) != checkpoint.get("cursor") or digest != checkpoint.get("repos_digest"):
+        print("DEBUG: Scan checkpoint does not match the repo list; starting over")
+        return chain(prefix, iterator), None
+    return iterator, checkpoint
+
+
+def iter_received_events(
+    client: GitHubApiClient,
+    username: str,
+    event_state: dict[str, Any],
+) -> Iterator[dict[str, Any]] | None:
+    """Yield received events newest first, or return None when page 1 is unchanged (304).
+
+    GitHub keeps at most 300 events (3 pages of 100) in this stream.
+    """
+    headers = {"If-None-Match": event_state["etag"]} if event_state.get("etag") else {}
+    if client.scheduler is not None:
+        client.scheduler.acquire()
+    first = client.request("GET", f"users/{username}/received_events?per_page=100&page=1", headers=headers)
+    if first.status == 304:
+        return None
+    event_state["etag"] = first.headers.get("etag", "")
+
+    def events() -> Iterator[dict[str, Any]]:
+        body = first.body
+        for page in range(1, EVENT_PAGES + 1):
+            if page > 1:
+                if client.scheduler is not None:
+                    client.scheduler.acquire()
+                body = client.request("GET", f"users/{username}/received_events?per_page=100&page={page}").body
+            if not isinstance(body, list) or not body:
+                return
+            yield from (event for event in body if isinstance(event, dict))
+
+    return events()
+
+
+def collect_release_events(
+    client: GitHubApiClient,
+    username: str,
+    watched: Iterable[str],
+    first_run: bool,
+    event_state: dict[str, Any],
+) -> dict[str, dict[str, Any] | None] | None:
+    """Map each watched repo to its newest `ReleaseEvent` release newer than the saved high-water mark.
+
+    `received_events` only carries events of repos the user watches, so only `watched`
+    repos are answered from it (None: no release since the mark) and the other stars
+    must still be polled. Cost scales with the number of new events instead of the
+    number of stars. Returns None when there is no usable mark (first run) or when the
+    stream no longer reaches back to the mark (a gap), so the caller must fall back to
+    full polling. In every case `event_state["last_event_id"]` is advanced to the newest
+    event seen.
+    """
+    high_water = parse_int(event_state.get("last_event_id"), 0)
+    events = iter_received_events(client, username, event_state)
+
+    latest_by_repo: dict[str, dict[str, Any]] = {}
+    reached_mark = events is None
+    newest_id = high_water
+    for event in events or ():
+        event_id = parse_int(event.get("id"), 0)
+        newest_id = max(newest_id, event_id)
+        if event_id <= high_water:
+            reached_mark = True
+            break
+        if event.get("type") != "ReleaseEvent":
+            continue
+        payload = event.get("payload") or {}
+        release = payload.get("release") or {}
+        if payload.get("action") not in {"published", "released"} or release.get("draft") or release.get("prerelease"):
+            continue
+        repo = normalize_repo_name(str((event.get("repo") or {}).get("name") or ""))
+        if repo and repo not in latest_by_repo and release.get("tag_name") and release.get("published_at"):
+            latest_by_repo[repo] = {
+                "tag_name": release["tag_name"],
+                "name": release.get("name") or "",
+                "published_at": format_github_timestamp(release["published_at"]),
+                "html_url": release.get("html_url") or "",
+            }
+    event_state["last_event_id"] = str(newest_id)
+
+    if first_run or not high_water or not reached_mark:
+        return None
+    return {repo: latest_by_repo.get(repo) for repo in map(normalize_repo_name, watched)}
+
+
 def decide_notification(releases: list[Release], first_run: bool, config: dict[str, Any]) -> NotificationDecision:
     policy = config["notification"]
     if not releases:
@@ -465,12 +2131,60 @@ def format_release_line(release: Release) -> str:
     return f"{title} {' - '.join(description_parts)}"
 
 
+def slack_text_measure(unit: str) -> Callable[[str], int]:
+    """Length function for the Slack budget: code points (`chars`) or UTF-8 `bytes`."""
+    if unit == "bytes":
+        return lambda text: len(text.encode("utf-8"))
+    return len
+
+
+def pack_slack_lines(
+    lines: list[str],
+    first_prefix: str,
+    continuation_prefix: str,
+    max_length: int,
+    measure: Callable[[str], int],
+) -> list[list[str]]:
+    """Greedily pack lines into messages in one pass; returns the lines of each message.
+
+    Each message is `prefix + "\n".join(lines)`. Lengths are summed per line instead of
+    re-measuring the growing message, so packing is linear in the total text size.
+    Prefixes should be measured at their longest final form so that renumbered
+    headers never push a message past `max_length`. A single line longer than the
+    budget still gets a message of its own.
+    """
+    line_lengths = [measure(line) + 1 for line in lines]
+    chunks: list[list[str]] = []
+    start = 0
+    current_length = measure(first_prefix)
+    for index, line_length in enumerate(line_lengths):
+        if index > start and current_length + line_length - 1 > max_length:
+            chunks.append(lines[start:index])
+            start = index
+            current_length = measure(continuation_prefix)
+        current_length += line_length
+    if start < len(lines):
+        chunks.append(lines[start:])
+    return chunks
+
+
+def slack_blocks_payload(header: str, guide_text: str | None, lines: list[str]) -> dict[str, Any]:
+    """Render one message for the Slack blocks API, splitting lines into <=3,000-char sections."""
+    blocks: list[dict[str, Any]] = [{"type": "section", "text": {"type": "mrkdwn", "text": header}}]
+    if guide_text:
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": guide_text}})
+    blocks.append({"type": "divider"})
+    for section_lines in pack_slack_lines(lines, "", "", SLACK_SECTION_TEXT_LIMIT, len):
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "\n".join(section_lines)}})
+    return {"text": header, "blocks": blocks}
+
+
 def build_slack_payloads(
     releases: list[Release],
     first_run: bool,
     config: dict[str, Any],
     decision: NotificationDecision,
-) -> list[dict[str, str]]:
+) -> list[dict[str, Any]]:
     if not decision.should_notify:
         return []
 
@@ -487,50 +2201,149 @@ def build_slack_payloads(
         "• `notification` 정책으로 임계값과 첫 실행 동작을 조정할 수 있습니다"
     )
 
-    max_text_length = config["notification"]["max_slack_text_length"]
+    policy = config["notification"]
+    max_text_length = policy["max_slack_text_length"]
+    measure = slack_text_measure(policy["slack_length_unit"])
     release_lines = [format_release_line(release) for release in releases]
-    messages: list[dict[str, str]] = []
-    current_text = f"{header_text}\n\n{guide_text}\n\n---\n\n"
-    current_count = 0
-
-    for release_line in release_lines:
-        candidate = current_text + release_line + "\n"
-        if len(candidate) > max_text_length and current_count > 0:
-            messages.append({"text": current_text.rstrip()})
-            current_text = f"🚀 *새로운 릴리스 (계속) - {len(messages) + 1}*\n\n{release_line}\n"
-            current_count = 1
-        else:
-            current_text = candidate
-            current_count += 1
-
-    if current_count > 0:
-        messages.append({"text": current_text.rstrip()})
-
-    if len(messages) > 1:
-        for index, message in enumerate(messages, start=1):
-            if index == 1:
-                message["text"] = message["text"].replace(
-                    header_text,
-                    f"🚀 *새로운 릴리스 ({len(releases)}개) - {index}/{len(messages)}*",
-                    1,
-                )
-            else:
-                message["text"] = re.sub(
-                    r"^🚀 \*새로운 릴리스 \(계속\) - \d+\*",
-                    f"🚀 *새로운 릴리스 ({len(releases)}개) - {index}/{len(messages)}*",
-                    message["text"],
-                    count=1,
-                )
+    if not release_lines:
+        return []
+
+    def split_header(index: int, total: int) -> str:
+        return f"🚀 *새로운 릴리스 ({len(releases)}개) - {index}/{total}*"
+
+    guide_suffix = f"\n\n{guide_text}\n\n---\n\n"
+    single_length = measure(header_text + guide_suffix) + sum(measure(line) + 1 for line in release_lines) - 1
+    if single_length <= max_text_length:
+        chunks = [release_lines]
+    else:
+        # There are never more messages than releases, so N/N is the longest header.
+        longest_header = split_header(len(releases), len(releases))
+        chunks = pack_slack_lines(
+            release_lines,
+            first_prefix=longest_header + guide_suffix,
+            continuation_prefix=longest_header + "\n\n",
+            max_length=max_text_length,
+            measure=measure,
+        )
+
+    total = len(chunks)
+    payloads: list[dict[str, Any]] = []
+    for index, lines in enumerate(chunks, start=1):
+        header = header_text if total == 1 else split_header(index, total)
+        if policy["slack_format"] == "blocks":
+            payloads.append(slack_blocks_payload(header, guide_text if index == 1 else None, lines))
+            continue
+        prefix = header + guide_suffix if index == 1 else f"{header}\n\n"
+        payloads.append({"text": (prefix + "\n".join(lines)).rstrip()})
+    return payloads
+
+
+class SlackDeliveryError(RuntimeError):
+    pass
+
 
-    return messages
+def slack_payload_digest(payload: dict[str, Any]) -> str:
+    return "sha256:" + hashlib.sha256(
+        json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def load_slack_receipts(path: Path, ttl: timedelta = SLACK_RECEIPT_TTL, now: datetime | None = None) -> set[str]:
+    """Return digests sent within `ttl`, rewriting the log without older receipts.
+
+    Receipts only guard against re-posting when a run is retried, so entries past the
+    dedup window are dropped instead of being reloaded on every run forever.
+    """
+    if not path.exists():
+        return set()
+    cutoff = (now or datetime.now(timezone.utc)) - ttl
+    lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    kept: dict[str, str] = {}
+    for line in lines:
+        receipt = json.loads(line)
+        sent_at = parse_timestamp(receipt.get("sent_at"))
+        if sent_at is not None and sent_at >= cutoff:
+            kept[str(receipt.get("digest", ""))] = line
+    if len(kept) < len(lines):
+        temp_path = path.with_name(f".{path.name}.tmp")
+        temp_path.write_text("".join(f"{line}\n" for line in kept.values()), encoding="utf-8")
+        os.replace(temp_path, path)
+    return set(kept)
+
+
+def deliver_slack_payloads(
+    payloads: list[dict[str, Any]],
+    webhook_url: str,
+    receipt_path: Path = SLACK_RECEIPTS_PATH,
+    max_retries: int = 5,
+    min_interval: float = 1.0,
+    timeout: float = 30.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """POST payloads to a Slack webhook in order over one keep-alive connection.
+
+    Every delivered payload is appended to `receipt_path` by content digest, and
+    payloads already in the log are skipped, so re-running a notification never
+    double-posts. 429 responses wait for `Retry-After`, 5xx responses, dropped
+    connections and timeouts back off exponentially, and delivery stops at the first payload that still fails so
+    later messages are never posted out of order. Returns the number of posts sent.
+    """
+    url = urllib.parse.urlsplit(webhook_url)
+    if url.scheme not in {"http", "https"} or not url.hostname:
+        raise SlackDeliveryError("Slack webhook URL must be an http(s) URL")
+    connection_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+    path = url.path or "/"
+    if url.query:
+        path = f"{path}?{url.query}"
+
+    receipts = load_slack_receipts(receipt_path)
+    receipt_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = connection_class(url.hostname, url.port, timeout=timeout)
+    sent = 0
+    try:
+        for index, payload in enumerate(payloads):
+            digest = slack_payload_digest(payload)
+            if digest in receipts:
+                continue
+            if sent:
+                sleep(min_interval)
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            for attempt in range(max_retries + 1):
+                try:
+                    connection.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+                    response = connection.getresponse()
+                    response_body = response.read().decode("utf-8", errors="replace")
+                # OSError covers resets and socket read timeouts (`TimeoutError`) on a stalled response.
+                except (http.client.HTTPException, OSError):
+                    connection.close()
+                    if attempt >= max_retries:
+                        raise
+                    sleep(min(60.0, 2.0**attempt))
+                    continue
+                if response.status == 200:
+                    break
+                if attempt < max_retries and (response.status == 429 or response.status >= 500):
+                    retry_after = parse_int(response.getheader("Retry-After"), -1)
+                    sleep(float(retry_after) if retry_after >= 0 else min(60.0, 2.0**attempt))
+                    continue
+                raise SlackDeliveryError(
+                    f"Slack webhook rejected message {index + 1}/{len(payloads)}: {response.status} {response_body}"
+                )
+            with receipt_path.open("a", encoding="utf-8") as receipt_log:
+                receipt_log.write(json.dumps({"digest": digest, "sent_at": utc_now()}) + "\n")
+            receipts.add(digest)
+            sent += 1
+    finally:
+        connection.close()
+    return sent
 
 
 def build_release_feed(
     result: DetectionResult,
     decision: NotificationDecision,
-    payloads: list[dict[str, str]],
+    payloads: list[dict[str, Any]],
     config: dict[str, Any],
-    repos_file: Path,
+    repos_file: Path | str,
     cache_path: Path,
 ) -> dict[str, Any]:
     releases = [asdict(release) for release in result.releases]
@@ -546,7 +2359,11 @@ def build_release_feed(
         },
         "first_run": result.first_run,
         "scanned_repos": result.scanned_repos,
+        "skipped_repos": result.skipped_repos,
         "repos_with_release": result.repos_with_release,
+        "retained_repos": result.retained_repos,
+        "error_count": len(result.errors),
+        "errors": result.errors,
         "release_count": len(result.releases),
         "special_release_count": special_release_count,
         "notify": decision.should_notify,
@@ -579,10 +2396,63 @@ def build_release_feed(
     }
 
 
+def load_feed_manifest(deltas_dir: Path) -> dict[str, Any]:
+    manifest = load_json_file(deltas_dir / "manifest.json", None)
+    if not isinstance(manifest, dict) or manifest.get("schema_version") != FEED_MANIFEST_SCHEMA:
+        return {"schema_version": FEED_MANIFEST_SCHEMA, "latest_sequence": 0, "deltas": []}
+    return manifest
+
+
+def append_feed_delta(deltas_dir: Path, feed: dict[str, Any]) -> dict[str, Any] | None:
+    """Append this run's feed as `YYYY/MM/DD/<sequence>.json` and register it in `manifest.json`.
+
+    The feed already holds only this run's new releases, so each file is a delta.
+    Runs without releases are not recorded. The delta is written before the manifest,
+    which is replaced atomically, so readers never see a sequence without its file.
+    """
+    if not feed.get("releases"):
+        return None
+    manifest = load_feed_manifest(deltas_dir)
+    sequence = parse_int(manifest.get("latest_sequence"), 0) + 1
+    generated = parse_timestamp(feed.get("generated_at")) or datetime.now(timezone.utc)
+    relative_path = f"{generated:%Y/%m/%d}/{sequence:08d}.json"
+    text = json.dumps({**feed, "sequence": sequence}, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    raw = text.encode("utf-8")
+    delta_path = deltas_dir / relative_path
+    delta_path.parent.mkdir(parents=True, exist_ok=True)
+    delta_path.write_bytes(raw)
+
+    entry = {
+        "sequence": sequence,
+        "path": relative_path,
+        "generated_at": feed.get("generated_at"),
+        "release_count": len(feed["releases"]),
+        "bytes": len(raw),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+    }
+    manifest["latest_sequence"] = sequence
+    manifest["deltas"] = [*manifest.get("deltas", []), entry]
+    temp_path = deltas_dir / ".manifest.json.tmp"
+    write_json_file(temp_path, manifest)
+    os.replace(temp_path, deltas_dir / "manifest.json")
+    return entry
+
+
+def iter_feed_deltas(deltas_dir: Path, after_sequence: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield the delta feeds with a sequence above `after_sequence`, oldest first, checking their hashes."""
+    for entry in load_feed_manifest(deltas_dir)["deltas"]:
+        if entry["sequence"] <= after_sequence:
+            continue
+        raw = (deltas_dir / entry["path"]).read_bytes()
+        if hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+            raise ValueError(f"feed delta {entry['path']} does not match its manifest hash")
+        yield json.loads(raw)
+
+
 def write_github_outputs(
     output_path: Path,
     decision: NotificationDecision,
-    payloads: list[dict[str, str]],
+    payloads: list[dict[str, Any]],
     feed_path: Path,
     release_count: int,
     special_release_count: int,
@@ -601,8 +2471,91 @@ def write_github_outputs(
             output.write(f"payload={safe}\n")
 
 
+def write_step_summary(
+    path: Path,
+    result: DetectionResult,
+    decision: NotificationDecision,
+    metrics: dict[str, Any],
+    account: str | None = None,
+) -> None:
+    """Append a Markdown run report to `GITHUB_STEP_SUMMARY`."""
+    latency = metrics["fetch_latency_ms"]
+    rate_limit = metrics["rate_limit"]
+    lines = [
+        "### Starred release check" + (f": {account}" if account else ""),
+        "",
+        f"- New releases: {len(result.releases)} (notify: {decision.should_notify}, {decision.reason})",
+        f"- Scanned repos: {result.scanned_repos}, skipped: {result.skipped_repos}, failed: {len(result.errors)}",
+        f"- API calls: {metrics['api']['calls']} (304: {metrics['api']['not_modified']}, "
+        f"rate limited: {metrics['api']['rate_limited']})",
+        f"- Fetch latency p50/p90/p99: {latency['p50']}/{latency['p90']}/{latency['p99']} ms "
+        f"over {latency['count']} calls",
+        f"- Sleep: {metrics['sleep_seconds']}s, throttled: {metrics['throttled_seconds']}s",
+    ]
+    if "min_remaining" in rate_limit:
+        lines.append(f"- Rate limit headroom: {rate_limit['min_remaining']}/{rate_limit.get('limit', '?')} at lowest")
+    lines += ["", "| Phase | Seconds |", "| --- | ---: |"]
+    lines += [f"| {name} | {seconds} |" for name, seconds in metrics["phases_seconds"].items()]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as summary:
+        summary.write("\n".join(lines) + "\n")
+
+
+def write_metrics_textfile(path: Path, results: dict[str, DetectionResult], metrics: dict[str, Any]) -> None:
+    """Write Prometheus text exposition for the node_exporter textfile collector (atomic rename).
+
+    `results` maps account name to its detection result; the per-result gauges get an
+    `account` label unless the name is empty (single-account runs). The API and timing
+    series cover the whole run, since lookups are shared between accounts.
+    """
+    prefix = "github_stars_release"
+
+    def per_result(name: str, value: Callable[[DetectionResult], int]) -> list[str]:
+        return [f"# TYPE {prefix}_{name} gauge"] + [
+            f'{prefix}_{name}{{account="{account}"}} {value(result)}' if account else f"{prefix}_{name} {value(result)}"
+            for account, result in results.items()
+        ]
+
+    lines = [
+        f"# TYPE {prefix}_phase_seconds gauge",
+        *(f'{prefix}_phase_seconds{{phase="{name}"}} {seconds}' for name, seconds in metrics["phases_seconds"].items()),
+        f"# TYPE {prefix}_api_calls gauge",
+        f"{prefix}_api_calls {metrics['api']['calls']}",
+        f"# TYPE {prefix}_api_not_modified gauge",
+        f"{prefix}_api_not_modified {metrics['api']['not_modified']}",
+        f"# TYPE {prefix}_api_rate_limited gauge",
+        f"{prefix}_api_rate_limited {metrics['api']['rate_limited']}",
+        f"# TYPE {prefix}_fetch_latency_seconds summary",
+        *(
+            f'{prefix}_fetch_latency_seconds{{quantile="{quantile}"}} {metrics["fetch_latency_ms"][name] / 1000}'
+            for name, quantile in (("p50", "0.5"), ("p90", "0.9"), ("p99", "0.99"))
+        ),
+        f"{prefix}_fetch_latency_seconds_count {metrics['fetch_latency_ms']['count']}",
+        f"# TYPE {prefix}_sleep_seconds gauge",
+        f"{prefix}_sleep_seconds {metrics['sleep_seconds']}",
+        f"# TYPE {prefix}_throttled_seconds gauge",
+        f"{prefix}_throttled_seconds {metrics['throttled_seconds']}",
+        *per_result("new_releases", lambda result: len(result.releases)),
+        *per_result("scanned_repos", lambda result: result.scanned_repos),
+        *per_result("failed_repos", lambda result: len(result.errors)),
+    ]
+    if "min_remaining" in metrics["rate_limit"]:
+        lines += [
+            f"# TYPE {prefix}_rate_limit_min_remaining gauge",
+            f"{prefix}_rate_limit_min_remaining {metrics['rate_limit']['min_remaining']}",
+        ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(temp_path, path)
+
+
 def print_summary(result: DetectionResult, decision: NotificationDecision, feed_path: Path) -> None:
     print(f"DEBUG: Scanned repos: {result.scanned_repos}")
+    print(f"DEBUG: Skipped repos (archived or not pushed): {result.skipped_repos}")
+    print(f"DEBUG: Failed repos (kept previous cache entry): {len(result.errors)}")
+    for error in result.errors[:5]:
+        print(f"  ! {error['repo']}: {error['error']} after {error['attempts']} attempts ({error['message']})")
     print(f"DEBUG: Repos with release: {result.repos_with_release}")
     print(f"DEBUG: New releases: {len(result.releases)}")
     print(f"DEBUG: First run: {result.first_run}")
@@ -616,52 +2569,270 @@ def print_summary(result: DetectionResult, decision: NotificationDecision, feed_
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Detect new releases from GitHub starred repositories.")
     parser.add_argument("--repos-file", type=Path, default=REPOS_FILE)
-    parser.add_argument("--cache-path", type=Path, default=CACHE_PATH)
+    parser.add_argument(
+        "--repos-source",
+        choices=("file", "api"),
+        default="file",
+        help="Read starred repos from --repos-file or stream them from /user/starred",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=CACHE_PATH,
+        help="Release cache: JSON file, or a .sqlite/.db history store (imports a sibling .json once)",
+    )
     parser.add_argument("--config", type=Path, default=CONFIG_PATH)
+    parser.add_argument(
+        "--metrics-textfile",
+        type=Path,
+        default=None,
+        help="Also write run metrics in Prometheus text format (node_exporter textfile collector)",
+    )
+    parser.add_argument(
+        "--accounts-file",
+        type=Path,
+        default=None,
+        help="JSON file listing several accounts to scan with shared, deduplicated release lookups",
+    )
     parser.add_argument("--feed-path", type=Path, default=None)
+    parser.add_argument(
+        "--feed-deltas-dir",
+        type=Path,
+        default=None,
+        help=f"Append-only per-run feed deltas and manifest.json (default: {FEED_DELTAS_DIR_NAME}/ next to the feed)",
+    )
+    parser.add_argument("--no-feed-deltas", action="store_true", help="Only write the single-file feed")
     parser.add_argument("--github-output", type=Path, default=None)
+    parser.add_argument(
+        "--deliver-slack",
+        action="store_true",
+        help="POST Slack payloads to SLACK_WEBHOOK_URL before saving the cache",
+    )
     parser.add_argument("--fixture-releases", type=Path, default=None, help="JSON fixture for token-free local tests")
-    parser.add_argument("--sleep-seconds", type=float, default=0.3)
-    parser.add_argument("--no-sleep", action="store_true")
+    parser.add_argument(
+        "--mode",
+        choices=("poll", "events"),
+        default="poll",
+        help="poll every starred repo, or read ReleaseEvents since the saved high-water mark",
+    )
+    parser.add_argument("--github-user", default=None, help="Login for --mode events (default: the token owner)")
+    parser.add_argument(
+        "--catch-up",
+        action="store_true",
+        help="Also report releases published between the cached tag and the new latest release",
+    )
+    parser.add_argument(
+        "--fetcher",
+        choices=("pygithub", "rest", "graphql"),
+        default="pygithub",
+        help="Live release fetcher: PyGithub, conditional REST with cached ETags, or batched GraphQL",
+    )
+    parser.add_argument("--graphql-batch-size", type=int, default=GRAPHQL_BATCH_SIZE)
+    parser.add_argument("--api-url", default=os.environ.get("GITHUB_API_URL", GITHUB_API_URL))
+    parser.add_argument(
+        "--sleep-seconds",
+        type=float,
+        default=None,
+        help="Legacy fixed delay after each release hit; replaces the adaptive rate-limit scheduler",
+    )
+    parser.add_argument("--no-sleep", action="store_true", help="Disable all request pacing (fixtures/local tests)")
+    parser.add_argument(
+        "--full-scan",
+        action="store_true",
+        help="Fetch every repo even when its pushed_at has not moved since the last check",
+    )
+    parser.add_argument(
+        "--retry-attempts",
+        type=int,
+        default=FaultPolicy.retry_attempts,
+        help="Retry rounds for repos whose fetch failed; repos still failing keep their previous cache entry",
+    )
+    parser.add_argument(
+        "--checkpoint-path",
+        type=Path,
+        default=None,
+        help="Partial scan state written during the scan (default: scan-checkpoint.json next to --cache-path, "
+        "or next to each account cache with --accounts-file)",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=CHECKPOINT_EVERY,
+        help="Write the scan checkpoint after this many repos (0 disables)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the scan checkpoint left by an interrupted run, if it matches the repo list",
+    )
+    parser.add_argument(
+        "--max-requests-per-second",
+        type=float,
+        default=DEFAULT_MAX_REQUESTS_PER_SECOND,
+        help="Ceiling for the adaptive rate-limit scheduler",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum release fetches in flight (default: {DEFAULT_CONCURRENCY})",
+    )
     return parser
 
 
+def run_faults(args: argparse.Namespace) -> FaultPolicy:
+    return FaultPolicy(retry_attempts=max(0, args.retry_attempts))
+
+
+def build_scheduler(args: argparse.Namespace, metrics: RunMetrics | None = None) -> RateLimitScheduler | None:
+    if args.no_sleep or args.sleep_seconds is not None:
+        return None
+    return RateLimitScheduler(max_rate=args.max_requests_per_second, metrics=metrics)
+
+
+def build_release_fetchers(
+    args: argparse.Namespace,
+    token: str,
+    previous_cache: dict[str, dict[str, Any]],
+    scheduler: RateLimitScheduler | None,
+    metrics: RunMetrics | None = None,
+) -> tuple[ReleaseFetcher, MissedReleaseFetcher | None]:
+    """Pick the latest-release fetcher (and the `--catch-up` fetcher) from the CLI options."""
+    fetch_missed: MissedReleaseFetcher | None = None
+    if args.catch_up:
+        if args.fixture_releases:
+            fetch_missed = load_fixture_missed_fetcher(args.fixture_releases)
+        else:
+            fetch_missed = get_missed_release_fetcher(token, args.api_url, scheduler, metrics=metrics)
+
+    if args.fixture_releases:
+        return load_fixture_fetcher(args.fixture_releases), fetch_missed
+    if args.fetcher == "graphql":
+        fetch_release = get_graphql_release_fetcher(token, args.api_url, args.graphql_batch_size, scheduler, metrics)
+        return fetch_release, fetch_missed
+    if args.fetcher == "rest":
+        return get_rest_release_fetcher(token, previous_cache, args.api_url, scheduler, metrics), fetch_missed
+    return get_github_release_fetcher(token, scheduler, metrics, args.api_url), fetch_missed
+
+
 def run(args: argparse.Namespace) -> int:
-    config = load_config(args.config)
+    if args.accounts_file is not None:
+        return run_accounts(args)
+
+    metrics = RunMetrics()
+    with metrics.phase("load"):
+        config = load_config(args.config)
+        previous_cache = load_cache(args.cache_path)
     feed_path = args.feed_path or Path(config["feed"]["output_path"])
     github_output_env = os.environ.get("GITHUB_OUTPUT")
     output_path = args.github_output or (Path(github_output_env) if github_output_env else None)
+    step_summary_env = os.environ.get("GITHUB_STEP_SUMMARY")
 
-    repos = read_repos(args.repos_file)
-    previous_cache = load_cache(args.cache_path)
     first_run = not args.cache_path.exists()
     special_projects = set(config["special_projects"])
 
-    if args.fixture_releases:
-        fetch_release = load_fixture_fetcher(args.fixture_releases)
+    sleep_seconds = 0 if args.no_sleep or args.sleep_seconds is None else args.sleep_seconds
+    scheduler = build_scheduler(args, metrics)
+
+    token = os.getenv("GH_TOKEN") or ""
+    if not token and (args.repos_source == "api" or args.mode == "events" or not args.fixture_releases):
+        print("GH_TOKEN env required for live GitHub API calls", file=sys.stderr)
+        return 1
+
+    starred_pages_path = args.cache_path.parent / STARRED_PAGES_PATH.name
+    starred_pages: dict[str, Any] = {}
+    repos: Iterable[StarredRepo]
+    if args.repos_source == "api":
+        starred_pages = load_json_file(starred_pages_path, {})
+        client = GitHubApiClient(token, args.api_url, scheduler=scheduler, metrics=metrics, faults=run_faults(args))
+        repos = metrics.timed_iter("list_starred", iter_starred_repos(client, starred_pages))
+        repos_source: Path | str = f"{args.api_url.rstrip('/')}/user/starred"
     else:
-        token = os.getenv("GH_TOKEN")
-        if not token:
-            print("GH_TOKEN env required for live GitHub API calls", file=sys.stderr)
+        with metrics.phase("list_starred"):
+            repos = read_starred_repos(args.repos_file)
+        repos_source = args.repos_file
+
+    fetch_release, fetch_missed = build_release_fetchers(args, token, previous_cache, scheduler, metrics)
+
+    event_state: dict[str, Any] = {}
+    event_releases: dict[str, dict[str, Any] | None] | None = None
+    event_cursor_path = args.cache_path.parent / EVENT_CURSOR_PATH.name
+    watched_pages_path = args.cache_path.parent / WATCHED_PAGES_PATH.name
+    watched_pages: dict[str, Any] = {}
+    if args.mode == "events":
+        with metrics.phase("events"):
+            client = GitHubApiClient(token, args.api_url, scheduler=scheduler, metrics=metrics, faults=run_faults(args))
+            username = args.github_user or str(client.request("GET", "user").body["login"])
+            watched_pages = load_json_file(watched_pages_path, {})
+            watched = [
+                repo.full_name
+                for repo in iter_starred_repos(client, watched_pages, starred_path=f"users/{username}/subscriptions")
+            ]
+            event_state = load_json_file(event_cursor_path, {})
+            event_releases = collect_release_events(client, username, watched, first_run, event_state)
+        if event_releases is None:
+            print("DEBUG: Event stream has no usable high-water mark or has a gap; falling back to full polling")
+        else:
+            print(f"DEBUG: {len(event_releases)} watched repos answered from events; polling the other stars")
+
+    checkpoint_path = args.checkpoint_path or args.cache_path.parent / CHECKPOINT_PATH.name
+    resume = None
+    if args.resume:
+        repos, resume = resume_repos(repos, load_checkpoint(checkpoint_path))
+        if resume is not None:
+            print(f"DEBUG: Resuming scan after {resume['cursor']} repos from {checkpoint_path}")
+    # Includes lazily listed star pages; `list_starred` reports that share separately.
+    with metrics.phase("detect_releases"):
+        result = detect_releases(
+            repos=repos,
+            fetch_release=fetch_release,
+            previous_cache=previous_cache,
+            special_projects=special_projects,
+            first_run=first_run,
+            sleep_seconds=sleep_seconds,
+            concurrency=max(1, args.concurrency),
+            scheduler=scheduler,
+            skip_unchanged=not args.full_scan,
+            polling=config["polling"],
+            fetch_missed=fetch_missed,
+            metrics=metrics,
+            checkpoint=lambda state: save_checkpoint(checkpoint_path, state),
+            checkpoint_every=args.checkpoint_every,
+            resume=resume,
+            faults=run_faults(args),
+            event_releases=event_releases,
+        )
+    with metrics.phase("build_notifications"):
+        decision = decide_notification(result.releases, result.first_run, config)
+        payloads = build_slack_payloads(result.releases, result.first_run, config, decision)
+        feed = build_release_feed(result, decision, payloads, config, repos_source, args.cache_path)
+
+    if args.deliver_slack and payloads:
+        webhook_url = os.getenv("SLACK_WEBHOOK_URL")
+        if not webhook_url:
+            print("SLACK_WEBHOOK_URL env required for --deliver-slack", file=sys.stderr)
             return 1
-        fetch_release = get_github_release_fetcher(token)
-
-    result = detect_releases(
-        repos=repos,
-        fetch_release=fetch_release,
-        previous_cache=previous_cache,
-        special_projects=special_projects,
-        first_run=first_run,
-        sleep_seconds=0 if args.no_sleep else args.sleep_seconds,
-    )
-    decision = decide_notification(result.releases, result.first_run, config)
-    payloads = build_slack_payloads(result.releases, result.first_run, config, decision)
-    feed = build_release_feed(result, decision, payloads, config, args.repos_file, args.cache_path)
-
-    save_cache(result.current_cache, args.cache_path)
+        with metrics.phase("deliver_slack"):
+            receipts_path = args.cache_path.parent / SLACK_RECEIPTS_PATH.name
+            sent = deliver_slack_payloads(payloads, webhook_url, receipts_path)
+        print(f"DEBUG: Slack messages sent: {sent}/{len(payloads)}")
+
+    with metrics.phase("save_state"):
+        save_cache(result.current_cache, args.cache_path, result.releases)
+        checkpoint_path.unlink(missing_ok=True)
+        if args.repos_source == "api":
+            write_json_file(starred_pages_path, starred_pages)
+        if args.mode == "events":
+            write_json_file(event_cursor_path, event_state)
+            write_json_file(watched_pages_path, watched_pages)
+        if decision.should_notify:
+            save_last_notification_time(result.releases, args.cache_path.parent / LAST_NOTIFICATION_PATH.name)
+    feed["metrics"] = metrics.snapshot()
     write_json_file(feed_path, feed)
-    if decision.should_notify:
-        save_last_notification_time(result.releases, args.cache_path.parent / LAST_NOTIFICATION_PATH.name)
+    if not args.no_feed_deltas:
+        delta = append_feed_delta(args.feed_deltas_dir or feed_path.parent / FEED_DELTAS_DIR_NAME, feed)
+        if delta is not None:
+            print(f"DEBUG: Feed delta #{delta['sequence']}: {delta['path']}")
 
     if output_path is not None:
         write_github_outputs(
@@ -672,8 +2843,203 @@ def run(args: argparse.Namespace) -> int:
             release_count=len(result.releases),
             special_release_count=feed["special_release_count"],
         )
+    if step_summary_env:
+        write_step_summary(Path(step_summary_env), result, decision, feed["metrics"])
+    if args.metrics_textfile is not None:
+        write_metrics_textfile(args.metrics_textfile, {"": result}, feed["metrics"])
 
     print_summary(result, decision, feed_path)
+    print(f"DEBUG: API calls: {feed['metrics']['api']['calls']}, phases: {feed['metrics']['phases_seconds']}")
+    return 0
+
+
+def load_accounts(path: Path) -> list[dict[str, Any]]:
+    """Load the multi-account file: `{"accounts": [{"name", "repos_file" | "github_user", ...}]}`.
+
+    Per-account defaults: cache `.cache/<name>/releases.json`, feed `release-feed.json`
+    next to that cache, Slack webhook env `SLACK_WEBHOOK_URL_<NAME>`.
+    `config` holds per-account overrides (`special_projects`, `notification`, `polling`)
+    merged over `--config`. The starred-pages cache, scan checkpoint, Slack receipts
+    and default feed live next to the cache, so every account needs its own cache
+    directory.
+    """
+    data = load_json_file(path, {})
+    accounts = data.get("accounts") if isinstance(data, dict) else data
+    if not isinstance(accounts, list) or not accounts:
+        raise ValueError("accounts file must contain a non-empty accounts[] list")
+
+    normalized: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    state_dirs: dict[Path, str] = {}
+    feed_paths: dict[Path, str] = {}
+    for account in accounts:
+        name = str(account.get("name") or "").strip() if isinstance(account, dict) else ""
+        if not re.fullmatch(r"[A-Za-z0-9_.-]+", name) or name in seen:
+            raise ValueError(f"account name must be unique and match [A-Za-z0-9_.-]+: {name!r}")
+        if not account.get("repos_file") and not account.get("github_user"):
+            raise ValueError(f"account {name} needs repos_file or github_user")
+        seen.add(name)
+        env_suffix = re.sub(r"[^A-Z0-9]", "_", name.upper())
+        cache_path = Path(account.get("cache_path") or CACHE_PATH.parent / name / CACHE_PATH.name)
+        feed_path = Path(account.get("feed_path") or cache_path.parent / FEED_PATH.name)
+        for paths, path, what in (
+            (state_dirs, cache_path.parent.resolve(), "cache directory"),
+            (feed_paths, feed_path.resolve(), "feed_path"),
+        ):
+            if path in paths:
+                raise ValueError(f"accounts {paths[path]} and {name} must not share a {what}: {path}")
+            paths[path] = name
+        normalized.append(
+            {
+                "name": name,
+                "repos_file": Path(account["repos_file"]) if account.get("repos_file") else None,
+                "github_user": account.get("github_user"),
+                "cache_path": cache_path,
+                "feed_path": feed_path,
+                "slack_webhook_env": str(account.get("slack_webhook_env") or f"SLACK_WEBHOOK_URL_{env_suffix}"),
+                "config": account.get("config") or {},
+            }
+        )
+    return normalized
+
+
+def run_accounts(args: argparse.Namespace) -> int:
+    """Scan several users' star lists, fetching each unique repo once.
+
+    Each account keeps its own cache, notification policy, feed and Slack webhook;
+    only the release lookups are shared, so API cost scales with unique repos.
+    """
+    if args.mode == "events":
+        print("--mode events is not supported with --accounts-file", file=sys.stderr)
+        return 1
+    metrics = RunMetrics()
+    with metrics.phase("load"):
+        base_config = load_config(args.config)
+        accounts = load_accounts(args.accounts_file)
+    github_output_env = os.environ.get("GITHUB_OUTPUT")
+    output_path = args.github_output or (Path(github_output_env) if github_output_env else None)
+    step_summary_env = os.environ.get("GITHUB_STEP_SUMMARY")
+    sleep_seconds = 0 if args.no_sleep or args.sleep_seconds is None else args.sleep_seconds
+    scheduler = build_scheduler(args, metrics)
+
+    token = os.getenv("GH_TOKEN") or ""
+    if not token and (not args.fixture_releases or any(account["github_user"] for account in accounts)):
+        print("GH_TOKEN env required for live GitHub API calls", file=sys.stderr)
+        return 1
+    client = GitHubApiClient(token, args.api_url, scheduler=scheduler, metrics=metrics, faults=run_faults(args))
+
+    previous_caches: dict[str, dict[str, dict[str, Any]]] = {}
+    starred_lists: dict[str, list[StarredRepo]] = {}
+    for account in accounts:
+        with metrics.phase("load"):
+            previous_caches[account["name"]] = load_cache(account["cache_path"])
+        with metrics.phase("list_starred"):
+            if account["repos_file"] is not None:
+                starred_lists[account["name"]] = read_starred_repos(account["repos_file"])
+                continue
+            pages_path = account["cache_path"].parent / STARRED_PAGES_PATH.name
+            pages = load_json_file(pages_path, {})
+            starred_path = f"users/{account['github_user']}/starred"
+            starred_lists[account["name"]] = list(iter_starred_repos(client, pages, starred_path=starred_path))
+            write_json_file(pages_path, pages)
+
+    union_cache: dict[str, dict[str, Any]] = {}
+    for cache in previous_caches.values():
+        union_cache.update(cache)
+    fetch_release, fetch_missed = build_release_fetchers(args, token, union_cache, scheduler, metrics)
+    fetch_release = memoize_fetcher(fetch_release)
+    if fetch_missed is not None:
+        fetch_missed = memoize_missed_fetcher(fetch_missed)
+    unique_repos = {starred.full_name for starred_list in starred_lists.values() for starred in starred_list}
+    print(f"DEBUG: Accounts: {len(accounts)}, unique starred repos: {len(unique_repos)}")
+
+    summaries: list[dict[str, Any]] = []
+    results: dict[str, DetectionResult] = {}
+    for account in accounts:
+        name = account["name"]
+        config = normalize_config(deep_merge(base_config, account["config"]))
+        first_run = not account["cache_path"].exists()
+        # One checkpoint per account, next to its cache; `--checkpoint-path` names a single file.
+        checkpoint_path = account["cache_path"].parent / CHECKPOINT_PATH.name
+        repos: Iterable[StarredRepo] = starred_lists[name]
+        resume = None
+        if args.resume:
+            repos, resume = resume_repos(repos, load_checkpoint(checkpoint_path))
+            if resume is not None:
+                print(f"DEBUG: [{name}] Resuming scan after {resume['cursor']} repos from {checkpoint_path}")
+        with metrics.phase("detect_releases"):
+            result = detect_releases(
+                repos=repos,
+                fetch_release=fetch_release,
+                previous_cache=previous_caches[name],
+                special_projects=set(config["special_projects"]),
+                first_run=first_run,
+                sleep_seconds=sleep_seconds,
+                concurrency=max(1, args.concurrency),
+                scheduler=scheduler,
+                skip_unchanged=not args.full_scan,
+                polling=config["polling"],
+                fetch_missed=fetch_missed,
+                metrics=metrics,
+                checkpoint=lambda state, path=checkpoint_path: save_checkpoint(path, state),
+                checkpoint_every=args.checkpoint_every,
+                resume=resume,
+                faults=run_faults(args),
+            )
+        results[name] = result
+        with metrics.phase("build_notifications"):
+            decision = decide_notification(result.releases, result.first_run, config)
+            payloads = build_slack_payloads(result.releases, result.first_run, config, decision)
+            source = account["repos_file"] or account["github_user"]
+            feed = build_release_feed(result, decision, payloads, config, source, account["cache_path"])
+            feed["account"] = name
+
+        if args.deliver_slack and payloads:
+            webhook_url = os.getenv(account["slack_webhook_env"])
+            if not webhook_url:
+                print(f"{account['slack_webhook_env']} env required for --deliver-slack", file=sys.stderr)
+                return 1
+            with metrics.phase("deliver_slack"):
+                receipts = account["cache_path"].parent / SLACK_RECEIPTS_PATH.name
+                sent = deliver_slack_payloads(payloads, webhook_url, receipts)
+            print(f"DEBUG: [{name}] Slack messages sent: {sent}/{len(payloads)}")
+
+        with metrics.phase("save_state"):
+            save_cache(result.current_cache, account["cache_path"], result.releases)
+            checkpoint_path.unlink(missing_ok=True)
+            if decision.should_notify:
+                save_last_notification_time(result.releases, account["cache_path"].parent / LAST_NOTIFICATION_PATH.name)
+        # Lookups are shared, so this is the whole run's metrics up to this account.
+        feed["metrics"] = metrics.snapshot()
+        write_json_file(account["feed_path"], feed)
+        if not args.no_feed_deltas:
+            append_feed_delta(account["feed_path"].parent / FEED_DELTAS_DIR_NAME, feed)
+        if step_summary_env:
+            write_step_summary(Path(step_summary_env), result, decision, feed["metrics"], account=name)
+        print(f"DEBUG: [{name}]")
+        print_summary(result, decision, account["feed_path"])
+        summaries.append(
+            {
+                "account": name,
+                "notify": decision.should_notify,
+                "notify_reason": decision.reason,
+                "release_count": len(result.releases),
+                "special_release_count": feed["special_release_count"],
+                "message_count": len(payloads),
+                "feed_path": str(account["feed_path"]),
+            }
+        )
+
+    run_metrics = metrics.snapshot()
+    if args.metrics_textfile is not None:
+        write_metrics_textfile(args.metrics_textfile, results, run_metrics)
+    print(f"DEBUG: API calls: {run_metrics['api']['calls']}, phases: {run_metrics['phases_seconds']}")
+    if output_path is not None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open("a", encoding="utf-8") as output:
+            output.write(f"has_new={str(any(summary['notify'] for summary in summaries)).lower()}\n")
+            output.write(f"release_count={sum(summary['release_count'] for summary in summaries)}\n")
+            output.write(f"accounts={json.dumps(summaries, ensure_ascii=False)}\n")
     return 0
 
 
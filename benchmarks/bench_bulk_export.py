@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark bulk knowledge export over archived release feeds.
+
+Writes `--feeds` synthetic `release-feed.json` artifacts (each run re-reports part of
+the previous run's releases, so documents overlap across feeds) and times
+`bulk_export_documents` at several worker counts. Throughput should grow with workers
+up to the number of cores.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+STARTED_AT = datetime(2026, 6, 1, tzinfo=timezone.utc)
+SCRIPT = ROOT / "scripts" / "export_knowledge_jsonl.py"
+spec = importlib.util.spec_from_file_location("export_knowledge_jsonl", SCRIPT)
+export_knowledge_jsonl = importlib.util.module_from_spec(spec)
+assert spec.loader is not None
+sys.modules[spec.name] = export_knowledge_jsonl
+spec.loader.exec_module(export_knowledge_jsonl)
+
+
+def write_feeds(directory: Path, feeds: int, releases_per_feed: int, overlap: float, seed: int) -> None:
+    """Write one artifact directory per run; `overlap` of each feed repeats releases from the previous run."""
+    rng = random.Random(seed)
+    previous: list[dict[str, Any]] = []
+    next_repo = 0
+    for run in range(feeds):
+        repeated = rng.sample(previous, min(len(previous), int(releases_per_feed * overlap)))
+        fresh = []
+        for _ in range(releases_per_feed - len(repeated)):
+            fresh.append(
+                {
+                    "repo": f"org-{next_repo % 997}/repo-{next_repo}",
+                    "tag": f"v1.{next_repo % 50}.0",
+                    "name": f"Release v1.{next_repo % 50}.0",
+                    "published": "2026-06-20 10:00:00",
+                }
+            )
+            next_repo += 1
+        previous = repeated + fresh
+        feed = {
+            "generated_at": (STARTED_AT + timedelta(hours=run)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "notify_reason": "threshold_reached",
+            "releases": previous,
+            "schema_version": "github-stars-release-feed/v1",
+        }
+        path = directory / f"release-feed-{run:05d}" / "release-feed.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(feed, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def bench(directory: Path, workers: int, args: argparse.Namespace) -> dict[str, Any]:
+    started = time.perf_counter()
+    documents = export_knowledge_jsonl.bulk_export_documents([str(directory)], workers=workers)
+    seconds = time.perf_counter() - started
+    releases = args.feeds * args.releases_per_feed
+    return {
+        "workers": workers,
+        "feeds": args.feeds,
+        "releases": releases,
+        "documents": len(documents),
+        "seconds": round(seconds, 4),
+        "releases_per_second": round(releases / seconds, 1) if seconds else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=200)
+    parser.add_argument("--releases-per-feed", type=int, default=200)
+    parser.add_argument("--overlap", type=float, default=0.5, help="Share of each feed repeated from the previous run")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        write_feeds(Path(tmp_dir), args.feeds, args.releases_per_feed, args.overlap, args.seed)
+        results = [bench(Path(tmp_dir), workers, args) for workers in args.workers]
+    for result in results:
+        print(
+            f"x{result['workers']:<3} {result['feeds']:>6} feeds {result['releases']:>8} releases "
+            f"-> {result['documents']:>7} documents {result['seconds']:.3f}s "
+            f"({result['releases_per_second']} releases/s)"
+        )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
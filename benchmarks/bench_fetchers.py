@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark the live fetch paths against the bundled fake GitHub server.
+
+Starts `tests/fake_github_server.py` in-process with synthetic repos, per-request
+latency, an optional rate limit and 5xx fault rate, then runs `detect_releases` with
+the REST, GraphQL and (when installed) PyGithub fetchers at several concurrency
+levels. Reports wall time, requests sent, peak in-flight requests and run metrics.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_script(name: str, path: Path) -> Any:
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+check_release = load_script("check_release", ROOT / ".github" / "scripts" / "check_release.py")
+fake_github_server = load_script("fake_github_server", ROOT / "tests" / "fake_github_server.py")
+
+
+def bench(fetcher: str, concurrency: int, args: argparse.Namespace) -> dict[str, Any]:
+    releases, starred = fake_github_server.synthetic_data(args.repos, args.seed)
+    server = fake_github_server.FakeGitHubServer(
+        releases,
+        starred,
+        latency=args.latency_ms / 1000,
+        rate_limit=args.rate_limit,
+        fault_rate=args.fault_rate,
+        seed=args.seed,
+    )
+    metrics = check_release.RunMetrics()
+    scheduler = check_release.RateLimitScheduler(max_rate=args.max_requests_per_second, metrics=metrics)
+    with server:
+        if fetcher == "graphql":
+            fetch_release = check_release.get_graphql_release_fetcher(
+                "token", server.url, args.graphql_batch_size, scheduler, metrics
+            )
+        elif fetcher == "rest":
+            fetch_release = check_release.get_rest_release_fetcher("token", {}, server.url, scheduler, metrics)
+        else:
+            fetch_release = check_release.get_github_release_fetcher("token", scheduler, metrics, server.url)
+        started = time.perf_counter()
+        error = None
+        try:
+            result = check_release.detect_releases(
+                repos=[item["full_name"] for item in starred],
+                fetch_release=fetch_release,
+                previous_cache={},
+                special_projects=set(),
+                first_run=True,
+                sleep_seconds=0,
+                concurrency=concurrency,
+                scheduler=scheduler,
+                metrics=metrics,
+            )
+            releases_found = len(result.releases)
+        except check_release.GitHubApiError as exc:
+            error = str(exc)
+            releases_found = 0
+        seconds = time.perf_counter() - started
+
+    snapshot = metrics.snapshot()
+    return {
+        "fetcher": fetcher,
+        "concurrency": concurrency,
+        "repos": args.repos,
+        "latency_ms": args.latency_ms,
+        "seconds": round(seconds, 4),
+        "repos_per_second": round(args.repos / seconds, 1) if seconds else None,
+        "requests": len(server.requests),
+        "peak_in_flight": server.peak_in_flight,
+        "releases": releases_found,
+        "error": error,
+        "api": snapshot["api"],
+        "fetch_latency_ms": snapshot["fetch_latency_ms"],
+        "throttled_seconds": snapshot["throttled_seconds"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=500)
+    parser.add_argument("--fetchers", nargs="+", default=["rest", "graphql", "pygithub"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Fake server latency per request")
+    parser.add_argument("--rate-limit", type=int, default=None, help="Fake server quota per hour")
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="Share of requests answered with a 5xx")
+    parser.add_argument("--max-requests-per-second", type=float, default=1_000.0)
+    parser.add_argument("--graphql-batch-size", type=int, default=check_release.GRAPHQL_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    fetchers = [
+        fetcher for fetcher in args.fetchers if fetcher != "pygithub" or importlib.util.find_spec("github") is not None
+    ]
+    results = [bench(fetcher, concurrency, args) for fetcher in fetchers for concurrency in args.concurrency]
+    for result in results:
+        print(
+            f"{result['fetcher']:>8} x{result['concurrency']:<3} {result['seconds']:.3f}s "
+            f"{result['repos_per_second']:>8} repos/s {result['requests']:>6} requests "
+            f"peak {result['peak_in_flight']:>3} p90 {result['fetch_latency_ms']['p90']} ms"
+            + (f" error: {result['error']}" if result["error"] else "")
+        )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Benchmark the detection pipeline on synthetic star lists.
+
+Generates `repos.txt`, a `--fixture-releases` file, a prior cache and a config for
+1k/10k/100k repos (configurable churn and special-project ratios), then times
+`detect_releases`, `decide_notification`, `build_slack_payloads`,
+`build_release_feed` and the streaming knowledge export separately. `--fetch-latency-ms` adds a
+sleep to every release lookup to model API round-trips.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_script(name: str, path: Path) -> Any:
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+check_release = load_script("check_release", ROOT / ".github" / "scripts" / "check_release.py")
+export_knowledge_jsonl = load_script("export_knowledge_jsonl", ROOT / "scripts" / "export_knowledge_jsonl.py")
+
+
+def write_fixtures(directory: Path, count: int, churn: float, special_ratio: float, seed: int) -> dict[str, Path]:
+    """Write a star list, latest releases, a prior cache and a config for `count` repos.
+
+    `churn` is the share of repos whose latest release differs from the prior cache;
+    `special_ratio` is the share listed in `special_projects`. One repo in 20 has no
+    release at all.
+    """
+    rng = random.Random(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    repos = [f"org-{index % 997}/repo-{index}" for index in range(count)]
+    releases: dict[str, Any] = {}
+    cache: dict[str, Any] = {}
+    for index, repo in enumerate(repos):
+        if index % 20 == 19:
+            releases[repo] = None
+            cache[repo] = {"last_checked_at": "2026-06-19T00:00:00+00:00"}
+            continue
+        minor = rng.randrange(50)
+        tag = f"v1.{minor}.0"
+        releases[repo] = {
+            "tag_name": tag,
+            "name": f"Release {tag}",
+            "published_at": "2026-06-20 10:00:00",
+            "html_url": f"https://github.com/{repo}/releases/tag/{tag}",
+        }
+        changed = rng.random() < churn
+        cached_tag = f"v1.{minor}.0-previous" if changed else tag
+        cache[repo] = {
+            "tag": cached_tag,
+            "published": "2026-06-10 10:00:00" if changed else "2026-06-20 10:00:00",
+            "name": f"Release {cached_tag}",
+            "html_url": f"https://github.com/{repo}/releases/tag/{cached_tag}",
+        }
+    special = [repo for repo in repos if rng.random() < special_ratio]
+
+    paths = {
+        "repos": directory / "repos.txt",
+        "releases": directory / "releases.json",
+        "cache": directory / "cache.json",
+        "config": directory / "config.yaml",
+    }
+    paths["repos"].write_text("\n".join(repos) + "\n", encoding="utf-8")
+    paths["releases"].write_text(json.dumps(releases), encoding="utf-8")
+    paths["cache"].write_text(json.dumps(cache), encoding="utf-8")
+    special_lines = "".join(f"  - {repo}\n" for repo in special)
+    paths["config"].write_text(
+        f"special_projects:\n{special_lines}notification:\n  min_release_count: 5\n", encoding="utf-8"
+    )
+    return paths
+
+
+def with_latency(fetch_release: Any, latency_seconds: float) -> Any:
+    if latency_seconds <= 0:
+        return fetch_release
+
+    def fetch(repo: str) -> Any:
+        time.sleep(latency_seconds)
+        return fetch_release(repo)
+
+    return fetch
+
+
+def timed(timings: dict[str, float], phase: str, func: Any, *args: Any, **kwargs: Any) -> Any:
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    timings[phase] = round(time.perf_counter() - started, 6)
+    return result
+
+
+def bench(count: int, args: argparse.Namespace, directory: Path) -> dict[str, Any]:
+    paths = write_fixtures(directory / str(count), count, args.churn, args.special_ratio, args.seed)
+    config = check_release.load_config(paths["config"])
+    repos = check_release.read_starred_repos(paths["repos"])
+    previous_cache = check_release.load_cache(paths["cache"])
+    fetch_release = with_latency(check_release.load_fixture_fetcher(paths["releases"]), args.fetch_latency_ms / 1000)
+
+    timings: dict[str, float] = {}
+    result = timed(
+        timings,
+        "detect_releases",
+        check_release.detect_releases,
+        repos=repos,
+        fetch_release=fetch_release,
+        previous_cache=previous_cache,
+        special_projects=set(config["special_projects"]),
+        first_run=False,
+        sleep_seconds=0,
+        concurrency=args.concurrency,
+    )
+    decision = timed(
+        timings, "decide_notification", check_release.decide_notification, result.releases, result.first_run, config
+    )
+    payloads = timed(
+        timings,
+        "build_slack_payloads",
+        check_release.build_slack_payloads,
+        result.releases,
+        result.first_run,
+        config,
+        decision,
+    )
+    feed = timed(
+        timings,
+        "build_release_feed",
+        check_release.build_release_feed,
+        result,
+        decision,
+        payloads,
+        config,
+        paths["repos"],
+        paths["cache"],
+    )
+    feed_path = paths["cache"].with_name("release-feed.json")
+    check_release.write_json_file(feed_path, feed)
+    documents = timed(
+        timings,
+        "export_documents",
+        export_knowledge_jsonl.write_jsonl,
+        export_knowledge_jsonl.iter_documents(feed_path),
+        feed_path.with_name("knowledge.jsonl"),
+    )
+
+    return {
+        "repos": count,
+        "churn": args.churn,
+        "special_ratio": args.special_ratio,
+        "fetch_latency_ms": args.fetch_latency_ms,
+        "concurrency": args.concurrency,
+        "releases": len(result.releases),
+        "messages": len(payloads),
+        "documents": documents,
+        "seconds": timings,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--churn", type=float, default=0.05, help="Share of repos with a new release")
+    parser.add_argument("--special-ratio", type=float, default=0.01, help="Share of repos in special_projects")
+    parser.add_argument("--fetch-latency-ms", type=float, default=0.0, help="Sleep per release lookup")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--fixtures-dir", type=Path, default=None, help="Keep generated fixtures here")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = args.fixtures_dir or Path(tmp_dir)
+        results = [bench(size, args, directory) for size in args.sizes]
+    for result in results:
+        phases = " ".join(f"{phase}={seconds:.4f}s" for phase, seconds in result["seconds"].items())
+        print(f"{result['repos']:>7} repos {result['releases']:>6} releases {phases}")
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
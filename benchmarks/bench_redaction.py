@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark secret-marker redaction on large release-note bodies.
+
+Builds Kubernetes-style changelogs (sections of `- Fix ... (#12345, @user) [SIG Node]`
+bullets, code spans and URLs, with a few secret-like markers sprinkled in) from 10 KB
+to 500 KB, then times the previous per-marker `re.sub` loop against the compiled
+single-pass `redact_secret_like_text` and reports MB/s.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "scripts" / "export_knowledge_jsonl.py"
+spec = importlib.util.spec_from_file_location("export_knowledge_jsonl", SCRIPT)
+export_knowledge_jsonl = importlib.util.module_from_spec(spec)
+assert spec.loader is not None
+sys.modules[spec.name] = export_knowledge_jsonl
+spec.loader.exec_module(export_knowledge_jsonl)
+
+SIGS = ("API Machinery", "Apps", "Auth", "CLI", "Network", "Node", "Scheduling", "Storage")
+VERBS = ("Fixed", "Added", "Removed", "Deprecated", "Promoted", "Updated", "Graduated")
+SUBJECTS = (
+    "a race in the kubelet pod worker when a static pod is recreated",
+    "`kubectl apply --server-side` handling of managed fields for CRDs",
+    "the `--authorization-mode` flag validation in kube-apiserver",
+    "metrics for scheduler queue incoming pods to include the plugin name",
+    "a panic in the endpointslice controller on dual-stack services",
+    "golang.org/x/net to v0.23.0 to address CVE-2023-45288",
+    "the `ServiceAccountTokenNodeBinding` feature gate to beta",
+)
+SECRET_LINES = (
+    "- Redacted sample config: `api_key: <set me>` in the example manifest",
+    "- Documented that `Authorization: Bearer` headers are stripped from audit logs",
+    "- Example webhook_url= placeholder removed from docs",
+)
+
+
+def make_changelog(target_bytes: int, secret_every: int, seed: int) -> str:
+    rng = random.Random(seed)
+    lines: list[str] = []
+    size = 0
+    while size < target_bytes:
+        if not lines or rng.random() < 0.03:
+            line = f"\n### SIG {rng.choice(SIGS)}\n"
+        elif secret_every and rng.randrange(secret_every) == 0:
+            line = rng.choice(SECRET_LINES)
+        else:
+            pr = rng.randrange(100_000, 130_000)
+            line = (
+                f"- {rng.choice(VERBS)} {rng.choice(SUBJECTS)}. "
+                f"([#{pr}](https://github.com/kubernetes/kubernetes/pull/{pr}), @contributor-{pr % 997}) "
+                f"[SIG {rng.choice(SIGS)}]"
+            )
+        lines.append(line)
+        size += len(line.encode("utf-8")) + 1
+    return "\n".join(lines)
+
+
+def per_marker_redaction(text: str) -> str:
+    for marker in export_knowledge_jsonl.SECRET_MARKERS:
+        text = re.sub(marker, export_knowledge_jsonl.REDACTED_MARKER, text, flags=re.IGNORECASE)
+    return text
+
+
+def best_of(func: Callable[[str], str], text: str, repeat: int) -> tuple[float, str]:
+    best = float("inf")
+    result = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(text)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def bench(size: int, args: argparse.Namespace) -> dict[str, Any]:
+    text = make_changelog(size, args.secret_every, args.seed)
+    megabytes = len(text.encode("utf-8")) / 1_000_000
+    baseline, expected = best_of(per_marker_redaction, text, args.repeat)
+    compiled, redacted = best_of(export_knowledge_jsonl.redact_secret_like_text, text, args.repeat)
+    return {
+        "bytes": len(text.encode("utf-8")),
+        "redactions": redacted.count(export_knowledge_jsonl.REDACTED_MARKER),
+        "identical": redacted == expected,
+        "per_marker_seconds": round(baseline, 6),
+        "compiled_seconds": round(compiled, 6),
+        "per_marker_mb_per_second": round(megabytes / baseline, 1),
+        "compiled_mb_per_second": round(megabytes / compiled, 1),
+        "speedup": round(baseline / compiled, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000], help="Changelog bytes")
+    parser.add_argument("--secret-every", type=int, default=200, help="About one secret-like line per N lines")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = [bench(size, args) for size in args.sizes]
+    for result in results:
+        print(
+            f"{result['bytes']:>8} bytes {result['redactions']:>4} redactions "
+            f"per-marker {result['per_marker_mb_per_second']:>6} MB/s "
+            f"compiled {result['compiled_mb_per_second']:>6} MB/s "
+            f"x{result['speedup']}" + ("" if result["identical"] else " MISMATCH")
+        )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark Slack payload chunking at first-run bootstrap sizes.
+
+Times `build_slack_payloads` for growing release counts and reports the cost per
+release line; a linear chunker keeps that number roughly flat up to 50k lines.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / ".github" / "scripts" / "check_release.py"
+spec = importlib.util.spec_from_file_location("check_release", SCRIPT)
+check_release = importlib.util.module_from_spec(spec)
+assert spec.loader is not None
+sys.modules[spec.name] = check_release
+spec.loader.exec_module(check_release)
+
+
+def make_releases(count: int) -> list:
+    return [
+        check_release.Release(
+            repo=f"org-{index % 997}/repo-{index}",
+            tag=f"v{index % 50}.{index % 7}.0",
+            name=f"Release v{index % 50}.{index % 7}.0 — 릴리스",
+            published="2026-06-20 10:00:00",
+            html_url=f"https://github.com/org-{index % 997}/repo-{index}/releases/tag/v{index % 50}.{index % 7}.0",
+            is_special=index % 11 == 0,
+        )
+        for index in range(count)
+    ]
+
+
+def bench(count: int, unit: str, output_format: str, repeat: int) -> dict:
+    releases = make_releases(count)
+    config = check_release.normalize_config(
+        {"notification": {"slack_length_unit": unit, "slack_format": output_format}}
+    )
+    decision = check_release.NotificationDecision(True, "threshold_reached")
+    best = float("inf")
+    payloads: list = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        payloads = check_release.build_slack_payloads(releases, True, config, decision)
+        best = min(best, time.perf_counter() - started)
+    return {
+        "lines": count,
+        "unit": unit,
+        "format": output_format,
+        "messages": len(payloads),
+        "seconds": round(best, 6),
+        "microseconds_per_line": round(best / count * 1_000_000, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 5_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = [
+        bench(size, unit, output_format, args.repeat)
+        for unit, output_format in (("chars", "text"), ("bytes", "text"), ("chars", "blocks"))
+        for size in args.sizes
+    ]
+    for result in results:
+        print(
+            f"{result['format']:>6} {result['unit']:>5} {result['lines']:>7} lines "
+            f"{result['messages']:>5} msgs {result['seconds']:.4f}s "
+            f"({result['microseconds_per_line']:.2f} us/line)"
+        )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
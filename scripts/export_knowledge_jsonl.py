@@ -1,21 +1,53 @@
 #!/usr/bin/env python3
 """Export cached GitHub release feed as fordongdorrong Knowledge JSONL.
 
-This command is read-only. It consumes an existing `.cache/release-feed.json`
-or a supplied feed fixture and never calls the GitHub API or sends Slack
-notifications.
+This command is read-only. It consumes an existing `.cache/release-feed.json`,
+the per-run deltas listed in `.cache/feed-deltas/manifest.json`, or a supplied
+feed fixture and never calls the GitHub API or sends Slack notifications.
+
+The feed decoder below mirrors the read side of `.github/scripts/check_release.py`
+(`serialization_format`, `decode_ndjson`, `decode_document`) on purpose: this script
+runs outside the workflow without the detector, its YAML config or its imports, and it
+adds a streaming reader the detector does not need. tests/test_knowledge_export.py
+writes every format with check_release and reads it back here, so the two cannot drift.
 """
 from __future__ import annotations
 
 import argparse
+import glob
+import gzip
 import hashlib
+import io
 import json
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, TextIO
+
+# Optional codecs, resolved once at import (same policy as check_release).
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+try:
+    import zstandard  # type: ignore
+except ModuleNotFoundError:
+    zstandard = None
 
 DEFAULT_FEED = Path(".cache/release-feed.json")
+EXPORT_MANIFEST_SCHEMA = "github-stars-knowledge-export-manifest/v1"
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+STREAM_CHUNK_SIZE = 1 << 16
+STREAMED_ARRAY = "releases"
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+FEED_FILE_PATTERNS = ("*.json", "*.json.gz", "*.json.zst", "*.ndjson", "*.ndjson.gz", "*.ndjson.zst")
 SECRET_MARKERS = (
     r"authorization:\s*bearer",
     r"api[_-]?key\s*[=:]",
@@ -28,6 +60,8 @@ SECRET_MARKERS = (
     r"ghp_",
     r"xoxb-",
 )
+REDACTED_MARKER = "[redacted-sensitive-marker]"
+_LITERAL_START = re.compile(r"[\w-](?![?*{])")
 
 
 @dataclass(frozen=True)
@@ -50,15 +84,51 @@ class KnowledgeDocument:
         return json.dumps(self.__dict__, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
 
 
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
 def sha256_text(text: str) -> str:
     return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
-def redact_secret_like_text(text: str) -> str:
-    redacted = text
-    for marker in SECRET_MARKERS:
-        redacted = re.sub(marker, "[redacted-sensitive-marker]", redacted, flags=re.IGNORECASE)
-    return redacted
+def marker_first_chars(markers: Iterable[str]) -> str | None:
+    """Return the literal first characters of all markers, or None if any marker may start otherwise."""
+    chars: set[str] = set()
+    for marker in markers:
+        if "|" in marker or not _LITERAL_START.match(marker):
+            return None
+        chars.add(marker[0].lower())
+    return "".join(sorted(chars))
+
+
+@lru_cache(maxsize=32)
+def compile_markers(markers: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fold a marker set into one case-insensitive scanner, compiled once per set.
+
+    A bare alternation makes the engine try every branch at every offset, which is slower
+    than the old per-marker loop; a lookahead on the markers' first characters lets it
+    skip non-candidate offsets cheaply.
+    """
+    if not markers:
+        return None
+    alternation = "|".join(f"(?:{marker})" for marker in markers)
+    first_chars = marker_first_chars(markers)
+    if first_chars:
+        alternation = f"(?=[{re.escape(first_chars)}])(?:{alternation})"
+    return re.compile(alternation, re.IGNORECASE)
+
+
+def redact_secret_like_text(text: str, markers: tuple[str, ...] = SECRET_MARKERS) -> str:
+    """Replace every marker match in a single scan over `text`."""
+    pattern = compile_markers(markers)
+    return pattern.sub(REDACTED_MARKER, text) if pattern is not None else text
+
+
+def load_marker_set(path: Path) -> tuple[str, ...]:
+    """Read one regex marker per line; blank lines and `#` comments are ignored."""
+    lines = (line.strip() for line in path.read_text(encoding="utf-8").splitlines())
+    return tuple(line for line in lines if line and not line.startswith("#"))
 
 
 def normalize_timestamp(value: str | None) -> str:
@@ -69,8 +139,173 @@ def normalize_timestamp(value: str | None) -> str:
     return "1970-01-01T00:00:00Z"
 
 
+def loads_json(raw: bytes | str) -> Any:
+    return json.loads(raw) if orjson is None else orjson.loads(raw)
+
+
+def zstandard_module() -> Any:
+    if zstandard is None:
+        raise RuntimeError("zstandard is required for .zst feeds: pip install zstandard")
+    return zstandard
+
+
+def is_ndjson(path: Path) -> bool:
+    suffixes = [suffix.lower() for suffix in path.suffixes if suffix.lower() not in {".gz", ".zst"}]
+    return bool(suffixes) and suffixes[-1] in {".ndjson", ".jsonl"}
+
+
+def ndjson_field(record: dict[str, Any]) -> tuple[Any, Any, bool]:
+    """Return `(key, value, is_item)` for one NDJSON line written by check_release's `encode_ndjson`."""
+    return (record["k"], record["i"], True) if "i" in record else (record["k"], record["v"], False)
+
+
+def decode_ndjson(lines: Iterable[bytes | str]) -> dict[str, Any]:
+    feed: dict[str, Any] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        key, value, is_item = ndjson_field(loads_json(line))
+        if is_item:
+            feed.setdefault(key, []).append(value)
+        else:
+            feed[key] = value
+    return feed
+
+
+def decode_feed(path: Path, raw: bytes) -> dict[str, Any]:
+    """Decode a feed written by check_release in any layout: pretty/compact JSON, NDJSON, gzip or zstd."""
+    if raw[:2] == GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    elif raw[:4] == ZSTD_MAGIC:
+        raw = zstandard_module().ZstdDecompressor().decompressobj().decompress(raw)
+    return decode_ndjson(raw.splitlines()) if is_ndjson(path) else loads_json(raw)
+
+
 def load_feed(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return decode_feed(path, path.read_bytes())
+
+
+@contextmanager
+def open_feed_text(path: Path) -> Iterator[TextIO]:
+    """Open a feed as decompressed UTF-8 text without reading it into memory."""
+    with path.open("rb") as handle:
+        magic = handle.read(4)
+        handle.seek(0)
+        if magic[:2] == GZIP_MAGIC:
+            stream: Any = gzip.GzipFile(fileobj=handle)
+        elif magic == ZSTD_MAGIC:
+            stream = zstandard_module().ZstdDecompressor().stream_reader(handle)
+        else:
+            stream = handle
+        with io.TextIOWrapper(stream, encoding="utf-8") as text:
+            yield text
+
+
+class JsonTextStream:
+    """Pull JSON values out of a text stream chunk by chunk with the stdlib `raw_decode`."""
+
+    def __init__(self, text: TextIO, chunk_size: int = STREAM_CHUNK_SIZE) -> None:
+        self.text = text
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        # Read at least as much as is still unconsumed so one large value costs amortized linear time.
+        chunk = self.text.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"release feed is not valid JSON: expected {char!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may continue in the next chunk.
+            if end < len(self.buffer) or not self.fill():
+                self.pos = end
+                return value
+
+    def separator(self, closing: str) -> bool:
+        """Consume `,` and return True, or consume `closing` and return False."""
+        char = self.peek()
+        self.pos += 1
+        if char == ",":
+            return True
+        if char == closing:
+            return False
+        raise ValueError(f"release feed is not valid JSON: expected ',' or {closing!r}")
+
+
+def iter_feed_fields(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[tuple[str, Any, bool]]:
+    """Yield `(key, value, is_item)` for a feed's top-level fields in file order.
+
+    `releases[]` is streamed one element at a time (`is_item=True`); every other field
+    is decoded whole. Memory stays bounded by the largest single release, not the feed.
+    """
+    with open_feed_text(path) as text:
+        if is_ndjson(path):
+            for line in text:
+                if line.strip():
+                    yield ndjson_field(loads_json(line))
+            return
+        stream = JsonTextStream(text, chunk_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if key == STREAMED_ARRAY and stream.peek() == "[":
+                stream.pos += 1
+                if stream.peek() == "]":
+                    stream.pos += 1
+                else:
+                    while True:
+                        yield key, stream.value(), True
+                        if not stream.separator("]"):
+                            break
+            else:
+                yield key, stream.value(), False
+            if not stream.separator("}"):
+                return
+
+
+def iter_delta_feeds(manifest_path: Path, after_sequence: int = 0) -> Iterator[dict[str, Any]]:
+    """Read the delta feeds listed in a feed-deltas manifest, oldest first, after `after_sequence`."""
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    for entry in manifest.get("deltas") or []:
+        if entry["sequence"] <= after_sequence:
+            continue
+        raw = (manifest_path.parent / entry["path"]).read_bytes()
+        if hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+            raise ValueError(f"feed delta {entry['path']} does not match its manifest hash")
+        yield decode_feed(manifest_path.parent / entry["path"], raw)
 
 
 def _release_value(release: dict[str, Any], *keys: str) -> str:
@@ -81,7 +316,9 @@ def _release_value(release: dict[str, Any], *keys: str) -> str:
     return ""
 
 
-def document_from_release(release: dict[str, Any], feed: dict[str, Any]) -> KnowledgeDocument:
+def document_from_release(
+    release: dict[str, Any], feed: dict[str, Any], markers: tuple[str, ...] = SECRET_MARKERS
+) -> KnowledgeDocument:
     repo = _release_value(release, "repo", "repository")
     tag = _release_value(release, "tag", "tag_name")
     name = _release_value(release, "name", "release_name", "title") or tag
@@ -98,7 +335,7 @@ def document_from_release(release: dict[str, Any], feed: dict[str, Any]) -> Know
             "This Knowledge export is generated from a cached release feed and does not call GitHub live APIs.",
         ]
     )
-    body = redact_secret_like_text(body)
+    body = redact_secret_like_text(body, markers)
     safe_repo = repo.strip("/")
     safe_tag = tag.strip("/")
     return KnowledgeDocument(
@@ -127,34 +364,260 @@ def document_from_release(release: dict[str, Any], feed: dict[str, Any]) -> Know
     )
 
 
-def export_documents(feed_path: Path) -> list[KnowledgeDocument]:
-    feed = load_feed(feed_path)
+def documents_from_feed(feed: dict[str, Any], markers: tuple[str, ...] = SECRET_MARKERS) -> list[KnowledgeDocument]:
     releases = feed.get("releases") or []
     if not isinstance(releases, list):
         raise ValueError("release feed must include releases[]")
-    return [document_from_release(release, feed) for release in releases if isinstance(release, dict)]
+    return [document_from_release(release, feed, markers) for release in releases if isinstance(release, dict)]
 
 
-def write_jsonl(documents: Iterable[KnowledgeDocument], output: Path | None) -> None:
-    lines = [document.to_json() for document in documents]
-    text = "\n".join(lines) + ("\n" if lines else "")
-    if output is None:
-        print(text, end="")
+def iter_feed_documents(
+    feed_path: Path, chunk_size: int = STREAM_CHUNK_SIZE, markers: tuple[str, ...] = SECRET_MARKERS
+) -> Iterator[KnowledgeDocument]:
+    """Stream documents from one feed file in two passes over the file.
+
+    check_release writes keys sorted, so `schema_version` comes after `releases[]`; the
+    first pass collects the other fields and drops releases, the second yields documents.
+    """
+    feed = {key: value for key, value, is_item in iter_feed_fields(feed_path, chunk_size) if not is_item}
+    if not isinstance(feed.get(STREAMED_ARRAY) or [], list):
+        raise ValueError("release feed must include releases[]")
+    for key, value, is_item in iter_feed_fields(feed_path, chunk_size):
+        if is_item and key == STREAMED_ARRAY and isinstance(value, dict):
+            yield document_from_release(value, feed, markers)
+
+
+def iter_documents(
+    feed_path: Path, after_sequence: int = 0, markers: tuple[str, ...] = SECRET_MARKERS
+) -> Iterator[KnowledgeDocument]:
+    """Yield documents from one feed file, or every delta after `after_sequence` from a manifest (or its directory)."""
+    if feed_path.is_dir():
+        feed_path = feed_path / "manifest.json"
+    if feed_path.name == "manifest.json":
+        for feed in iter_delta_feeds(feed_path, after_sequence):
+            yield from documents_from_feed(feed, markers)
         return
+    yield from iter_feed_documents(feed_path, markers=markers)
+
+
+def export_documents(feed_path: Path, after_sequence: int = 0) -> list[KnowledgeDocument]:
+    return list(iter_documents(feed_path, after_sequence))
+
+
+def find_feed_files(sources: Iterable[str]) -> list[Path]:
+    """Expand directories (searched recursively) and glob patterns into feed files, skipping manifests."""
+    paths: set[Path] = set()
+    for source in sources:
+        if Path(source).is_dir():
+            matches = [path for pattern in FEED_FILE_PATTERNS for path in Path(source).rglob(pattern)]
+        else:
+            matches = [Path(match) for match in glob.glob(source, recursive=True)]
+        paths.update(path for path in matches if path.is_file() and path.name != "manifest.json")
+    return sorted(paths)
+
+
+def has_releases_key(feed_path: Path) -> bool:
+    """True when the file's top level is an object with a `releases` key (read only up to that key)."""
+    with closing(iter_feed_fields(feed_path)) as fields:
+        return any(key == STREAMED_ARRAY for key, _, _ in fields)
+
+
+def export_archived_feed(feed_path: Path, markers: tuple[str, ...] = SECRET_MARKERS) -> list[KnowledgeDocument]:
+    """Documents of one file found by `find_feed_files`, or none if it is not a release feed.
+
+    A feeds directory may also hold checkpoints, ETag caches and other JSON; those are
+    reported on stderr and skipped instead of aborting the whole bulk export.
+    """
+    try:
+        if not has_releases_key(feed_path):
+            raise ValueError("no top-level releases[]")
+        return list(iter_feed_documents(feed_path, markers=markers))
+    except (OSError, ValueError) as exc:
+        print(f"WARNING: skipping {feed_path}: not a release feed ({exc})", file=sys.stderr)
+        return []
+
+
+def export_feed_batch(feed_paths: list[Path], markers: tuple[str, ...] = SECRET_MARKERS) -> list[KnowledgeDocument]:
+    """Export a contiguous run of feeds, already deduplicated, so workers ship back less to the parent."""
+    return list(merge_documents(export_archived_feed(path, markers) for path in feed_paths).values())
+
+
+def merge_documents(
+    batches: Iterable[Iterable[KnowledgeDocument]], merged: dict[str, KnowledgeDocument] | None = None
+) -> dict[str, KnowledgeDocument]:
+    """Keep one document per `document_id`: the newest `updated_at`, later batches winning ties."""
+    merged = {} if merged is None else merged
+    for documents in batches:
+        for document in documents:
+            current = merged.get(document.document_id)
+            if current is None or document.updated_at >= current.updated_at:
+                merged[document.document_id] = document
+    return merged
+
+
+def bulk_export_documents(
+    sources: Iterable[str], workers: int | None = None, markers: tuple[str, ...] = SECRET_MARKERS
+) -> list[KnowledgeDocument]:
+    """Export many archived feeds across a process pool and deduplicate them by `document_id`."""
+    paths = find_feed_files(sources)
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        merged = merge_documents(export_archived_feed(path, markers) for path in paths)
+    else:
+        size = -(-len(paths) // (workers * 4))
+        batches = [paths[start : start + size] for start in range(0, len(paths), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Batches are contiguous and come back in order, so ties still go to the later feed path.
+            merged = merge_documents(pool.map(partial(export_feed_batch, markers=markers), batches))
+    return [merged[document_id] for document_id in sorted(merged)]
+
+
+def write_jsonl(documents: Iterable[KnowledgeDocument], output: Path | None) -> int:
+    """Write one line per document as it is produced; a file output is replaced only when complete."""
+    if output is None:
+        return write_lines(documents, sys.stdout)
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(text, encoding="utf-8")
+    temp_path = output.with_name(output.name + ".tmp")
+    with temp_path.open("w", encoding="utf-8") as handle:
+        count = write_lines(documents, handle)
+    temp_path.replace(output)
+    return count
+
+
+def write_lines(documents: Iterable[KnowledgeDocument], handle: TextIO) -> int:
+    count = 0
+    for document in documents:
+        handle.write(document.to_json())
+        handle.write("\n")
+        count += 1
+    return count
+
+
+def load_export_manifest(path: Path) -> dict[str, str]:
+    """Return the `document_id -> content_hash` map recorded by the previous incremental export."""
+    if not path.exists():
+        return {}
+    return dict(json.loads(path.read_text(encoding="utf-8")).get("documents") or {})
+
+
+def save_export_manifest(path: Path, hashes: dict[str, str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {"schema_version": EXPORT_MANIFEST_SCHEMA, "updated_at": utc_now(), "documents": hashes}
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(json.dumps(manifest, ensure_ascii=False, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+    temp_path.replace(path)
+
+
+def tombstone_document(document_id: str, deleted_at: str) -> KnowledgeDocument:
+    return KnowledgeDocument(
+        source_id="github-stars",
+        document_id=document_id,
+        title="",
+        body="",
+        uri="",
+        content_hash=sha256_text(""),
+        created_at=None,
+        updated_at=deleted_at,
+        visibility="public",
+        lifecycle="deleted",
+        deleted_at=deleted_at,
+        indexable=False,
+        metadata={},
+    )
+
+
+def iter_changed_documents(
+    documents: Iterable[KnowledgeDocument],
+    hashes: dict[str, str],
+    tombstone_missing: bool = False,
+    deleted_at: str | None = None,
+) -> Iterator[KnowledgeDocument]:
+    """Yield only documents whose `content_hash` differs from `hashes`, updating `hashes` in place.
+
+    Each feed holds just one run's releases, so a document missing from it is not gone;
+    with `tombstone_missing` (for full-corpus inputs) missing ids get a deleted tombstone
+    and are dropped from `hashes`.
+    """
+    seen: set[str] = set()
+    for document in documents:
+        seen.add(document.document_id)
+        if hashes.get(document.document_id) != document.content_hash:
+            hashes[document.document_id] = document.content_hash
+            yield document
+    if tombstone_missing:
+        deleted_at = deleted_at or utc_now()
+        for document_id in sorted(set(hashes) - seen):
+            del hashes[document_id]
+            yield tombstone_document(document_id, deleted_at)
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Export cached GitHub Stars release feed as Knowledge JSONL")
     parser.add_argument("--feed", type=Path, default=DEFAULT_FEED, help=f"Release feed path (default: {DEFAULT_FEED})")
     parser.add_argument("--output", type=Path, default=None, help="Write JSONL to this file instead of stdout")
+    parser.add_argument(
+        "--after-sequence",
+        type=int,
+        default=0,
+        help="With a feed-deltas manifest as --feed, export only deltas after this sequence",
+    )
+    parser.add_argument(
+        "--feeds",
+        nargs="+",
+        default=None,
+        help="Bulk mode: directories or glob patterns of archived feeds, merged by document_id (overrides --feed)",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Bulk mode worker processes (default: CPU count)")
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help="Incremental mode: emit only documents whose content hash changed since the export recorded here",
+    )
+    parser.add_argument(
+        "--tombstone-missing",
+        action="store_true",
+        help="With --manifest, emit deleted tombstones for documents absent from this input",
+    )
+    parser.add_argument(
+        "--redaction-markers",
+        type=Path,
+        default=None,
+        help="Replace the built-in secret markers with the regexes in this file (one per line)",
+    )
+    parser.add_argument(
+        "--redaction-marker",
+        action="append",
+        default=[],
+        help="Extra secret marker regex (repeatable), added to the active marker set",
+    )
     return parser
 
 
 def main() -> int:
-    args = build_parser().parse_args()
-    write_jsonl(export_documents(args.feed), args.output)
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.tombstone_missing and args.manifest is None:
+        parser.error("--tombstone-missing requires --manifest")
+    if args.feeds and args.after_sequence:
+        parser.error("--after-sequence cannot be combined with --feeds")
+    markers = load_marker_set(args.redaction_markers) if args.redaction_markers else SECRET_MARKERS
+    markers += tuple(args.redaction_marker)
+    try:
+        compile_markers(markers)
+    except re.error as exc:
+        parser.error(f"invalid redaction marker: {exc}")
+    if args.feeds:
+        documents: Iterable[KnowledgeDocument] = bulk_export_documents(args.feeds, args.workers, markers)
+    else:
+        documents = iter_documents(args.feed, args.after_sequence, markers)
+    if args.manifest is None:
+        write_jsonl(documents, args.output)
+        return 0
+    hashes = load_export_manifest(args.manifest)
+    write_jsonl(iter_changed_documents(documents, hashes, args.tombstone_missing), args.output)
+    # Saved only after the output is complete, so a failed export is retried in full next time.
+    save_export_manifest(args.manifest, hashes)
     return 0
 
 
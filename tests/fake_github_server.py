@@ -0,0 +1,363 @@
+"""Local stand-in for the GitHub API used by the token-free tests and load benchmarks.
+
+Start it as a context manager and point `GitHubApiClient(api_url=server.url)` (or
+`check_release.py --api-url`) at it. Run this file directly to serve synthetic data
+on a fixed port, e.g. `python tests/fake_github_server.py --repos 5000 --latency-ms 80`.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+REPOSITORY_FIELD = re.compile(r"(\w+): repository\(owner: \$(\w+), name: \$(\w+)\)")
+REPOSITORY_PATH = re.compile(r"^/repos/([^/]+/[^/]+)$")
+LATEST_RELEASE_PATH = re.compile(r"^/repos/([^/]+/[^/]+)/releases/latest$")
+RELEASES_PATH = re.compile(r"^/repos/([^/]+/[^/]+)/releases$")
+RECEIVED_EVENTS_PATH = re.compile(r"^/users/([^/]+)/received_events$")
+USER_STARRED_PATH = re.compile(r"^/users/([^/]+)/starred$")
+USER_SUBSCRIPTIONS_PATH = re.compile(r"^/users/([^/]+)/subscriptions$")
+
+
+class LoadTestHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 makes concurrent clients wait on SYN retries.
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeGitHubServer:
+    """Serve starred lists and REST/GraphQL latest-release lookups from in-memory data.
+
+    Releases use the REST field names (`tag_name`, `name`, `published_at`, `html_url`);
+    `published_at` must be ISO-8601 like the real API returns.
+
+    Realism knobs: `latency` seconds added to every response; `rate_limit` requests per
+    `rate_limit_window` seconds with `X-RateLimit-*` headers and a 403 once exhausted
+    (304s are free, as on GitHub); `fault_rate` answers that share of requests with a
+    random status from `fault_statuses`. `burst()` queues deterministic 403/429/5xx runs.
+    """
+
+    def __init__(
+        self,
+        releases: dict[str, dict[str, Any] | None] | None = None,
+        starred: list[dict[str, Any]] | None = None,
+        latency: float = 0.0,
+        rate_limit: int | None = None,
+        rate_limit_window: float = 3600.0,
+        fault_rate: float = 0.0,
+        fault_statuses: tuple[int, ...] = (502, 503),
+        seed: int = 0,
+        port: int = 0,
+    ) -> None:
+        self.releases: dict[str, dict[str, Any] | None] = dict(releases or {})
+        # `/user/starred` items in star order (oldest first), e.g. `{"full_name", "pushed_at", "archived"}`.
+        self.starred: list[dict[str, Any]] = list(starred or [])
+        # Full `/repos/{repo}/releases` lists, newest first; defaults to the latest release only.
+        self.history: dict[str, list[dict[str, Any]]] = {}
+        # `/users/{login}/subscriptions` items (watched repos), e.g. `{"full_name"}`.
+        self.watched: list[dict[str, Any]] = []
+        # `/users/{login}/received_events` items, newest first.
+        self.events: list[dict[str, Any]] = []
+        self.login = "octocat"
+        self.requests: list[tuple[str, str]] = []
+        # Queued `(status, headers)` responses returned before normal handling, e.g. 429 bursts.
+        self.faults: list[tuple[int, dict[str, str]]] = []
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.remaining = rate_limit or 0
+        self.reset_at = time.time() + rate_limit_window
+        self.fault_rate = fault_rate
+        self.fault_statuses = fault_statuses
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = LoadTestHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FakeGitHubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def burst(self, status: int, count: int, headers: dict[str, str] | None = None) -> None:
+        """Answer the next `count` requests with `status`, e.g. `burst(429, 3, {"Retry-After": "1"})`."""
+        with self._lock:
+            self.faults.extend([(status, dict(headers or {}))] * count)
+
+    def record(self, method: str, path: str) -> tuple[int, dict[str, str]] | None:
+        """Log the request and pop the next queued (or randomly injected) fault, if any."""
+        with self._lock:
+            self.requests.append((method, path))
+            if self.faults:
+                return self.faults.pop(0)
+            if self.fault_rate and self._random.random() < self.fault_rate:
+                return self._random.choice(self.fault_statuses), {}
+            if self.rate_limit is not None:
+                self._roll_rate_limit_window()
+                if self.remaining <= 0:
+                    return 403, {}
+            return None
+
+    def _roll_rate_limit_window(self) -> None:
+        if time.time() >= self.reset_at:
+            self.remaining = self.rate_limit or 0
+            self.reset_at = time.time() + self.rate_limit_window
+
+    def rate_limit_headers(self, status: int) -> dict[str, str]:
+        """Charge one request (304s are free) and return the `X-RateLimit-*` headers.
+
+        Without `rate_limit` nothing is enforced and a full 5000/5000 quota is reported.
+        """
+        if self.rate_limit is None:
+            reset = str(int(self.reset_at))
+            return {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "5000", "X-RateLimit-Reset": reset}
+        with self._lock:
+            if status != 304 and self.remaining > 0:
+                self.remaining -= 1
+            return {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(self.remaining),
+                "X-RateLimit-Used": str(self.rate_limit - self.remaining),
+                "X-RateLimit-Reset": str(int(self.reset_at)),
+            }
+
+    def rate_limit_status(self) -> dict[str, Any]:
+        """`/rate_limit` body, which PyGithub reads when no `X-RateLimit-*` header was seen yet."""
+        limit = self.rate_limit or 5000
+        remaining = self.remaining if self.rate_limit is not None else limit
+        core = {"limit": limit, "remaining": remaining, "reset": int(self.reset_at), "used": limit - remaining}
+        return {"resources": {"core": core, "search": core, "graphql": core}, "rate": core}
+
+    def enter_request(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def exit_request(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def repository(self, repo: str) -> tuple[int, dict[str, str], Any]:
+        """`/repos/{repo}` for PyGithub's `get_repo`, which builds later URLs from `url`."""
+        if repo not in self.releases and not any(item.get("full_name") == repo for item in self.starred):
+            return 404, {}, {"message": "Not Found"}
+        owner, name = repo.split("/", 1)
+        return 200, {}, {
+            "id": int(hashlib.sha1(repo.encode("utf-8")).hexdigest()[:8], 16),
+            "name": name,
+            "full_name": repo,
+            "owner": {"login": owner},
+            "url": f"{self.url}/repos/{repo}",
+            "html_url": f"https://github.com/{repo}",
+        }
+
+    def latest_release(self, repo: str, if_none_match: str | None) -> tuple[int, dict[str, str], Any]:
+        release = self.releases.get(repo)
+        if release is None:
+            return 404, {}, {"message": "Not Found"}
+        etag = '"' + hashlib.sha1(json.dumps(release, sort_keys=True).encode("utf-8")).hexdigest() + '"'
+        if if_none_match == etag:
+            return 304, {"ETag": etag}, None
+        return 200, {"ETag": etag}, release
+
+    def starred_page(self, query: str, if_none_match: str | None) -> tuple[int, dict[str, str], Any]:
+        """`/user/starred`; `/users/{login}/starred` serves the same list."""
+        params = parse_qs(query)
+        items = self.starred if params.get("direction", ["desc"])[0] == "asc" else self.starred[::-1]
+        return self.page(items, params, if_none_match)
+
+    def page(
+        self, items: list[dict[str, Any]], params: dict[str, list[str]], if_none_match: str | None
+    ) -> tuple[int, dict[str, str], Any]:
+        per_page = int(params.get("per_page", ["30"])[0])
+        page = int(params.get("page", ["1"])[0])
+        body = items[(page - 1) * per_page : page * per_page]
+        etag = '"' + hashlib.sha1(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest() + '"'
+        if if_none_match == etag:
+            return 304, {"ETag": etag}, None
+        return 200, {"ETag": etag}, body
+
+    def graphql(self, payload: dict[str, Any]) -> dict[str, Any]:
+        variables = payload.get("variables") or {}
+        data: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+        for alias, owner_var, name_var in REPOSITORY_FIELD.findall(payload.get("query", "")):
+            repo = f"{variables[owner_var]}/{variables[name_var]}"
+            if repo not in self.releases:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias], "message": f"Could not resolve {repo}"})
+                continue
+            release = self.releases[repo]
+            data[alias] = {
+                "latestRelease": None
+                if release is None
+                else {
+                    "tagName": release["tag_name"],
+                    "name": release.get("name"),
+                    "publishedAt": release["published_at"],
+                    "url": release.get("html_url"),
+                }
+            }
+        body: dict[str, Any] = {"data": data}
+        if errors:
+            body["errors"] = errors
+        return body
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                fake.enter_request()
+                try:
+                    self.send_json(*self.handle_get())
+                finally:
+                    fake.exit_request()
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                fake.enter_request()
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                    self.send_json(*self.handle_post(payload))
+                finally:
+                    fake.exit_request()
+
+            def fault_response(self, fault: tuple[int, dict[str, str]]) -> tuple[int, Any, dict[str, str]]:
+                status, headers = fault
+                if status in {403, 429}:
+                    message = "API rate limit exceeded" if "Retry-After" not in headers else "secondary rate limit"
+                    if fake.rate_limit is not None and "Retry-After" not in headers:
+                        headers = {**headers, **fake.rate_limit_headers(status)}
+                    return status, {"message": message}, headers
+                if "Content-Type" in headers:
+                    # A proxy-style error page, like the HTML 502s GitHub's edge sometimes returns.
+                    return status, b"<html><body><h1>Bad Gateway</h1></body></html>", headers
+                return status, {"message": "injected fault"}, headers
+
+            def handle_get(self) -> tuple[int, Any, dict[str, str]]:
+                fault = fake.record("GET", self.path)
+                if fault is not None:
+                    return self.fault_response(fault)
+                url = urlsplit(self.path)
+                if_none_match = self.headers.get("If-None-Match")
+                if url.path == "/user/starred" or USER_STARRED_PATH.match(url.path):
+                    status, headers, body = fake.starred_page(url.query, if_none_match)
+                elif USER_SUBSCRIPTIONS_PATH.match(url.path):
+                    status, headers, body = fake.page(fake.watched, parse_qs(url.query), if_none_match)
+                elif url.path == "/rate_limit":
+                    status, headers, body = 200, {}, fake.rate_limit_status()
+                elif url.path == "/user":
+                    status, headers, body = 200, {}, {"login": fake.login}
+                elif RECEIVED_EVENTS_PATH.match(url.path):
+                    status, headers, body = fake.page(fake.events[:300], parse_qs(url.query), if_none_match)
+                elif RELEASES_PATH.match(url.path):
+                    repo = RELEASES_PATH.match(url.path).group(1)
+                    latest = fake.releases.get(repo)
+                    items = fake.history.get(repo, [latest] if latest else [])
+                    status, headers, body = fake.page(items, parse_qs(url.query), None)
+                elif LATEST_RELEASE_PATH.match(url.path):
+                    repo = LATEST_RELEASE_PATH.match(url.path).group(1)
+                    status, headers, body = fake.latest_release(repo, if_none_match)
+                elif REPOSITORY_PATH.match(url.path):
+                    status, headers, body = fake.repository(REPOSITORY_PATH.match(url.path).group(1))
+                else:
+                    status, headers, body = 404, {}, {"message": "Not Found"}
+                return status, body, {**headers, **fake.rate_limit_headers(status)}
+
+            def handle_post(self, payload: dict[str, Any]) -> tuple[int, Any, dict[str, str]]:
+                fault = fake.record("POST", self.path)
+                if fault is not None:
+                    return self.fault_response(fault)
+                if self.path.rstrip("/") != "/graphql":
+                    return 404, {"message": "Not Found"}, {}
+                return 200, fake.graphql(payload), fake.rate_limit_headers(200)
+
+            def send_json(self, status: int, body: Any, headers: dict[str, str] | None = None) -> None:
+                raw = body if isinstance(body, bytes) else b"" if body is None else json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                if "Content-Type" not in (headers or {}):
+                    self.send_header("Content-Type", "application/json")
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                return
+
+        return Handler
+
+
+def synthetic_data(count: int, seed: int = 0) -> tuple[dict[str, dict[str, Any] | None], list[dict[str, Any]]]:
+    """Releases and a star list for `count` repos; one repo in 20 has no release."""
+    rng = random.Random(seed)
+    releases: dict[str, dict[str, Any] | None] = {}
+    starred: list[dict[str, Any]] = []
+    for index in range(count):
+        repo = f"org-{index % 997}/repo-{index}"
+        tag = f"v1.{rng.randrange(50)}.0"
+        releases[repo] = None if index % 20 == 19 else {
+            "tag_name": tag,
+            "name": f"Release {tag}",
+            "published_at": "2026-06-20T10:00:00Z",
+            "html_url": f"https://github.com/{repo}/releases/tag/{tag}",
+        }
+        starred.append({"full_name": repo, "pushed_at": "2026-06-20T10:00:00Z", "archived": False})
+    return releases, starred
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve a fake GitHub API with synthetic starred repos.")
+    parser.add_argument("--repos", type=int, default=1_000)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None, help="Requests per --rate-limit-window")
+    parser.add_argument("--rate-limit-window", type=float, default=3600.0)
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="Share of requests answered with a 5xx")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    releases, starred = synthetic_data(args.repos, args.seed)
+    server = FakeGitHubServer(
+        releases,
+        starred,
+        latency=args.latency_ms / 1000,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        fault_rate=args.fault_rate,
+        seed=args.seed,
+        port=args.port,
+    )
+    print(f"Serving fake GitHub API for {args.repos} repos at {server.url}", flush=True)
+    with server:
+        try:
+            server._thread.join()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
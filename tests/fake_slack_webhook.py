@@ -0,0 +1,79 @@
+"""Local stand-in for a Slack Incoming Webhook used by the delivery tests."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+class FakeSlackWebhook:
+    """Record posted payloads and the number of TCP connections used to send them.
+
+    Queue `(status, headers)` tuples in `faults` to answer the next posts with, e.g.,
+    a 429 carrying `Retry-After`. Queue seconds in `stalls` to hold the next posts that
+    long and then drop the connection without answering (nothing is recorded).
+    """
+
+    def __init__(self) -> None:
+        self.payloads: list[dict[str, Any]] = []
+        self.connections = 0
+        self.faults: list[tuple[int, dict[str, str]]] = []
+        self.stalls: list[float] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/services/T000/B000/XXXX"
+
+    def __enter__(self) -> "FakeSlackWebhook":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with fake._lock:
+                    stall = fake.stalls.pop(0) if fake.stalls else None
+                if stall is not None:
+                    time.sleep(stall)
+                    self.close_connection = True
+                    return
+                with fake._lock:
+                    fault = fake.faults.pop(0) if fake.faults else None
+                    if fault is None:
+                        fake.payloads.append(payload)
+                status, headers = fault or (200, {})
+                body = b"ok" if status == 200 else b"rate_limited"
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                return
+
+        return Handler
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import importlib.util
 import json
+import sqlite3
 import sys
 import tempfile
+import threading
+import time
 import unittest
-from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -16,6 +20,20 @@ assert spec.loader is not None
 sys.modules[spec.name] = check_release
 spec.loader.exec_module(check_release)
 
+fake_spec = importlib.util.spec_from_file_location("fake_github_server", ROOT / "tests" / "fake_github_server.py")
+fake_github_server = importlib.util.module_from_spec(fake_spec)
+assert fake_spec.loader is not None
+sys.modules[fake_spec.name] = fake_github_server
+fake_spec.loader.exec_module(fake_github_server)
+
+slack_spec = importlib.util.spec_from_file_location("fake_slack_webhook", ROOT / "tests" / "fake_slack_webhook.py")
+fake_slack_webhook = importlib.util.module_from_spec(slack_spec)
+assert slack_spec.loader is not None
+sys.modules[slack_spec.name] = fake_slack_webhook
+slack_spec.loader.exec_module(fake_slack_webhook)
+
+NOW = datetime(2026, 6, 22, 0, 0, tzinfo=timezone.utc)
+
 
 class CheckReleaseTest(unittest.TestCase):
     def test_normalize_repo_name_accepts_human_spacing(self) -> None:
@@ -52,6 +70,689 @@ class CheckReleaseTest(unittest.TestCase):
         )
         self.assertEqual(second.releases, [])
 
+    def test_detect_releases_skips_archived_and_unpushed_repos(self) -> None:
+        calls: list[str] = []
+
+        def fetch(repo: str) -> dict[str, str]:
+            calls.append(repo)
+            return {"tag_name": "v2.0.0", "published_at": "2026-06-21 10:00:00"}
+
+        previous_cache = {
+            "owner/idle": {"tag": "v1.0.0", "published": "2026-06-01 10:00:00", "pushed_at": "2026-06-01T09:00:00Z"},
+            "owner/active": {"tag": "v1.0.0", "published": "2026-06-01 10:00:00", "pushed_at": "2026-06-01T09:00:00Z"},
+            "owner/archived": {"tag": "v0.9.0", "published": "2025-01-01 10:00:00"},
+        }
+        starred = [
+            check_release.StarredRepo("owner/idle", pushed_at="2026-06-01T09:00:00Z"),
+            check_release.StarredRepo("owner/active", pushed_at="2026-06-21T09:00:00Z"),
+            check_release.StarredRepo("owner/archived", archived=True),
+            "owner/plain",
+        ]
+
+        result = check_release.detect_releases(
+            starred, fetch, previous_cache=previous_cache, special_projects=set(), first_run=False, sleep_seconds=0
+        )
+
+        self.assertEqual(calls, ["owner/active", "owner/plain"])
+        self.assertEqual(result.skipped_repos, 2)
+        self.assertEqual(result.scanned_repos, 4)
+        self.assertEqual([release.repo for release in result.releases], ["owner/active", "owner/plain"])
+        self.assertEqual(list(result.current_cache), ["owner/idle", "owner/active", "owner/archived", "owner/plain"])
+        self.assertEqual(result.current_cache["owner/idle"], previous_cache["owner/idle"])
+        self.assertEqual(result.current_cache["owner/active"]["pushed_at"], "2026-06-21T09:00:00Z")
+
+    def test_tiered_polling_checks_repos_by_release_cadence(self) -> None:
+        polling = check_release.normalize_config({"polling": {"tiered": True, "full_sweep_days": 7}})["polling"]
+
+        def checked(hours_ago: int) -> str:
+            return (NOW - timedelta(hours=hours_ago)).isoformat().replace("+00:00", "Z")
+
+        def entry(tag: str, release_times: list[str], hours_ago: int) -> dict[str, object]:
+            return {
+                "tag": tag,
+                "published": release_times[-1],
+                "release_times": release_times,
+                "last_checked_at": checked(hours_ago),
+            }
+
+        weekly_times = ["2026-06-01 10:00:00", "2026-06-08 10:00:00", "2026-06-15 10:00:00"]
+        previous_cache = {
+            "owner/weekly-releases": entry("v3", weekly_times, 8),
+            "owner/quarterly": entry("v2", ["2026-01-01 10:00:00", "2026-04-01 10:00:00"], 8),
+            "owner/dormant": entry("v1", ["2023-01-01 10:00:00"], 48),
+            "owner/overdue": entry("v1", ["2023-01-01 10:00:00"], 24 * 8),
+            "grafana/grafana": entry("v1", ["2023-01-01 10:00:00"], 1),
+        }
+        calls: list[str] = []
+
+        def fetch(repo: str) -> dict[str, str]:
+            calls.append(repo)
+            return {"tag_name": previous_cache[repo]["tag"], "published_at": previous_cache[repo]["published"]}
+
+        result = check_release.detect_releases(
+            list(previous_cache),
+            fetch,
+            previous_cache=previous_cache,
+            special_projects={"grafana/grafana"},
+            first_run=False,
+            sleep_seconds=0,
+            polling=polling,
+            now=NOW,
+        )
+
+        self.assertEqual(calls, ["owner/weekly-releases", "owner/overdue", "grafana/grafana"])
+        self.assertEqual(result.skipped_repos, 2)
+        self.assertEqual(result.releases, [])
+        self.assertEqual(result.current_cache["owner/overdue"]["last_checked_at"], "2026-06-22T00:00:00Z")
+        self.assertEqual(result.current_cache["owner/weekly-releases"]["release_times"], weekly_times)
+
+    def test_cache_entries_are_merged_with_ttl_and_freshness_window(self) -> None:
+        def checked(days: float) -> str:
+            return (NOW - timedelta(days=days)).isoformat()
+
+        previous_cache = {
+            "owner/fresh": {"tag": "v1.0.0", "published": "2026-06-01 10:00:00", "last_checked_at": checked(0.1)},
+            "owner/same": {"tag": "v1.0.0", "published": "2026-06-01 10:00:00", "last_changed_at": checked(30)},
+            "owner/gone-404": {"tag": "v2.0.0", "published": "2026-06-01 10:00:00", "last_checked_at": checked(2)},
+            "owner/unstarred-recently": {"tag": "v3.0.0", "last_checked_at": checked(5)},
+            "owner/unstarred-long-ago": {"tag": "v4.0.0", "last_checked_at": checked(40)},
+        }
+        fetched: list[str] = []
+
+        def fetch_release(repo: str) -> dict[str, str] | None:
+            fetched.append(repo)
+            if repo == "owner/gone-404":
+                return None
+            tag = "v1.0.0" if repo == "owner/same" else "v1.1.0"
+            return {"tag_name": tag, "name": tag, "published_at": "2026-06-01 10:00:00"}
+
+        polling = check_release.normalize_config({"polling": {"fresh_within_hours": 6}})["polling"]
+        result = check_release.detect_releases(
+            ["owner/fresh", "owner/same", "owner/gone-404", "owner/new"],
+            fetch_release,
+            previous_cache,
+            special_projects=set(),
+            first_run=False,
+            sleep_seconds=0,
+            polling=polling,
+            now=NOW,
+        )
+
+        self.assertEqual(fetched, ["owner/same", "owner/gone-404", "owner/new"])
+        self.assertEqual(result.current_cache["owner/fresh"], previous_cache["owner/fresh"])
+        self.assertEqual(result.current_cache["owner/same"]["last_changed_at"], checked(30))
+        self.assertEqual(result.current_cache["owner/new"]["last_changed_at"], "2026-06-22T00:00:00Z")
+        self.assertEqual(result.current_cache["owner/gone-404"]["tag"], "v2.0.0")
+        self.assertEqual(result.current_cache["owner/gone-404"]["last_checked_at"], "2026-06-22T00:00:00Z")
+        self.assertIn("owner/unstarred-recently", result.current_cache)
+        self.assertNotIn("owner/unstarred-long-ago", result.current_cache)
+        self.assertEqual(result.retained_repos, 1)
+        self.assertEqual([release.repo for release in result.releases], ["owner/new"])
+
+    def test_kept_tag_counts_as_repo_with_release_however_the_lookup_failed(self) -> None:
+        previous_cache = {"owner/repo": {"tag": "v2.0.0", "published": "2026-06-01 10:00:00"}}
+
+        def empty(repo: str) -> None:
+            return None
+
+        def broken(repo: str) -> None:
+            raise check_release.GitHubApiError(502, "bad gateway")
+
+        counts = []
+        for fetch_release in (empty, broken):
+            result = check_release.detect_releases(
+                ["owner/repo"],
+                fetch_release,
+                previous_cache,
+                special_projects=set(),
+                first_run=False,
+                sleep_seconds=0,
+                now=NOW,
+                faults=check_release.FaultPolicy(retry_attempts=0),
+            )
+            self.assertEqual(result.current_cache["owner/repo"]["tag"], "v2.0.0")
+            counts.append(result.repos_with_release)
+
+        self.assertEqual(counts, [1, 1])
+
+    def test_malformed_release_bodies_land_in_errors_instead_of_aborting_the_scan(self) -> None:
+        fixture = {
+            "owner/ok": [{"tag_name": "v1.0.0", "published_at": "2026-06-20T10:00:00Z"}],
+            "owner/no-date": [{"tag_name": "v2.0.0", "name": "no published_at"}],
+            "owner/bad-catch-up": [
+                {"tag_name": "v3.2.0", "published_at": "2026-06-21T10:00:00Z"},
+                {"tag_name": "v3.1.0"},
+                {"tag_name": "v3.0.0", "published_at": "2026-06-01T10:00:00Z"},
+            ],
+        }
+        previous_cache = {
+            "owner/no-date": {"tag": "v1.9.0", "published": "2026-05-01 10:00:00"},
+            "owner/bad-catch-up": {"tag": "v3.0.0", "published": "2026-06-01 10:00:00"},
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fixture_path = Path(tmp_dir) / "fixture.json"
+            fixture_path.write_text(json.dumps(fixture), encoding="utf-8")
+            result = check_release.detect_releases(
+                list(fixture),
+                check_release.load_fixture_fetcher(fixture_path),
+                previous_cache,
+                special_projects=set(),
+                first_run=False,
+                sleep_seconds=0,
+                now=NOW,
+                fetch_missed=check_release.load_fixture_missed_fetcher(fixture_path),
+                faults=check_release.FaultPolicy(retry_attempts=0),
+            )
+
+        self.assertEqual([release.repo for release in result.releases], ["owner/ok"])
+        self.assertEqual(
+            [(error["repo"], error["error"]) for error in result.errors],
+            [("owner/bad-catch-up", "ValueError"), ("owner/no-date", "ValueError")],
+        )
+        self.assertTrue(result.errors[0]["message"].startswith("catch-up: "))
+        self.assertEqual(result.current_cache["owner/no-date"], previous_cache["owner/no-date"])
+
+    def test_sqlite_cache_imports_json_and_keeps_release_history(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            legacy = {
+                "owner/repo": {"tag": "v1.0.0", "published": "2026-06-01 10:00:00", "name": "", "html_url": ""},
+                "owner/other": {"tag": "v0.1.0", "published": "2026-05-01 10:00:00", "name": "", "html_url": ""},
+            }
+            (tmp / "releases.json").write_text(json.dumps(legacy), encoding="utf-8")
+            store_path = tmp / "releases.sqlite"
+
+            self.assertEqual(check_release.load_cache(store_path), legacy)
+
+            release = check_release.Release("owner/repo", "v1.1.0", "", "2026-06-20 10:00:00", "", is_special=True)
+            updated = {**legacy, "owner/repo": release.cache_entry()}
+            check_release.save_cache(updated, store_path, [release])
+
+            self.assertEqual(check_release.load_cache(store_path), updated)
+            history = check_release.ReleaseHistoryStore(store_path).history("owner/repo")
+            self.assertEqual([(item.tag, item.is_special) for item in history], [("v1.1.0", True), ("v1.0.0", False)])
+            with sqlite3.connect(store_path) as connection:
+                self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_read_starred_repos_accepts_names_and_api_objects(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "repos.txt"
+            path.write_text(
+                "grafana / grafana\n"
+                '{"full_name": "owner/repo", "pushed_at": "2026-06-20T10:00:00Z", "archived": true}\n'
+                "grafana/grafana\n",
+                encoding="utf-8",
+            )
+            starred = check_release.read_starred_repos(path)
+
+        self.assertEqual(
+            starred,
+            [
+                check_release.StarredRepo("grafana/grafana"),
+                check_release.StarredRepo("owner/repo", pushed_at="2026-06-20T10:00:00Z", archived=True),
+            ],
+        )
+
+    def test_starred_lister_streams_pages_and_reuses_unchanged_pages(self) -> None:
+        starred = [
+            {"full_name": f"owner/repo-{index}", "pushed_at": "2026-06-20T10:00:00Z", "archived": False}
+            for index in range(5)
+        ]
+        page_cache: dict[str, object] = {}
+        with fake_github_server.FakeGitHubServer(starred=starred) as server:
+            client = check_release.GitHubApiClient("token", server.url)
+            first = check_release.iter_starred_repos(client, page_cache, per_page=2)
+            self.assertEqual(next(first).full_name, "owner/repo-0")
+            self.assertEqual(len(server.requests), 1)
+            self.assertEqual(len(list(first)), 4)
+
+            server.starred.append({"full_name": "owner/repo-5", "pushed_at": "", "archived": True})
+            second = list(check_release.iter_starred_repos(client, page_cache, per_page=2))
+
+        self.assertEqual([repo.full_name for repo in second], [f"owner/repo-{index}" for index in range(6)])
+        self.assertTrue(second[-1].archived)
+        self.assertEqual(set(page_cache), {"1", "2", "3", "4"})
+
+    def test_event_mode_uses_release_events_since_high_water_mark(self) -> None:
+        def release_event(event_id: int, repo: str, tag: str, prerelease: bool = False) -> dict[str, object]:
+            return {
+                "id": str(event_id),
+                "type": "ReleaseEvent",
+                "repo": {"name": repo},
+                "payload": {
+                    "action": "published",
+                    "release": {
+                        "tag_name": tag,
+                        "name": tag,
+                        "published_at": "2026-06-21T10:00:00Z",
+                        "html_url": f"https://github.com/{repo}/releases/tag/{tag}",
+                        "prerelease": prerelease,
+                    },
+                },
+            }
+
+        starred = ["owner/watched", "owner/quiet", "owner/unwatched", "owner/new-watch"]
+        previous_cache = {
+            "owner/watched": {"tag": "v1.0.0", "published": "2026-06-01 10:00:00", "etag": '"old"'},
+            "owner/quiet": {"tag": "v0.1.0", "published": "2025-01-01 10:00:00"},
+            "owner/unwatched": {"tag": "v3.0.0", "published": "2026-05-01 10:00:00"},
+        }
+        fetched: list[str] = []
+
+        def fetch_release(repo: str) -> dict[str, str] | None:
+            fetched.append(repo)
+            tag = {"owner/unwatched": "v3.1.0", "owner/new-watch": "v0.0.1"}[repo]
+            return {"tag_name": tag, "name": tag, "published_at": "2026-06-21 12:00:00"}
+
+        event_state: dict[str, object] = {}
+        with fake_github_server.FakeGitHubServer() as server:
+            server.events = [{"id": "100", "type": "WatchEvent", "repo": {"name": "owner/watched"}}]
+            server.watched = [{"full_name": repo} for repo in ("owner/watched", "owner/quiet", "owner/new-watch")]
+            client = check_release.GitHubApiClient("token", server.url)
+            watched = [
+                repo.full_name
+                for repo in check_release.iter_starred_repos(client, {}, starred_path="users/octocat/subscriptions")
+            ]
+            self.assertEqual(watched, ["owner/watched", "owner/quiet", "owner/new-watch"])
+            args = (client, "octocat", watched, False, event_state)
+            self.assertIsNone(check_release.collect_release_events(*args))
+            self.assertEqual(event_state["last_event_id"], "100")
+
+            server.events = [
+                release_event(104, "owner/watched", "v1.2.0-rc.1", prerelease=True),
+                release_event(103, "owner/watched", "v1.1.0"),
+                release_event(102, "owner/unstarred", "v9.0.0"),
+                release_event(101, "owner/watched", "v1.0.1"),
+                *server.events,
+            ]
+            event_releases = check_release.collect_release_events(*args)
+            self.assertEqual(event_state["last_event_id"], "104")
+            self.assertEqual(set(event_releases), set(watched))
+            self.assertIsNone(event_releases["owner/quiet"])
+
+            result = check_release.detect_releases(
+                starred,
+                fetch_release,
+                previous_cache,
+                set(),
+                first_run=False,
+                sleep_seconds=0,
+                now=NOW,
+                event_releases=event_releases,
+            )
+
+            server.events = [release_event(200, "owner/watched", "v2.0.0")]
+            self.assertIsNone(check_release.collect_release_events(*args))
+
+        # Unwatched stars and never-checked watched repos are still polled; the rest come from events.
+        self.assertEqual(fetched, ["owner/unwatched", "owner/new-watch"])
+        self.assertEqual(
+            [(release.repo, release.tag) for release in result.releases],
+            [("owner/unwatched", "v3.1.0"), ("owner/new-watch", "v0.0.1"), ("owner/watched", "v1.1.0")],
+        )
+        checked_at = "2026-06-22T00:00:00Z"
+        watched_entry = result.current_cache["owner/watched"]
+        self.assertEqual((watched_entry["tag"], watched_entry["last_changed_at"]), ("v1.1.0", checked_at))
+        self.assertEqual(watched_entry["last_checked_at"], checked_at)
+        self.assertNotIn("etag", watched_entry)
+        quiet_entry = result.current_cache["owner/quiet"]
+        self.assertEqual((quiet_entry["tag"], quiet_entry["last_checked_at"]), ("v0.1.0", checked_at))
+        self.assertEqual((result.scanned_repos, result.skipped_repos, result.repos_with_release), (4, 0, 4))
+
+    def test_resumed_scan_matches_uninterrupted_scan(self) -> None:
+        repos = [f"owner/repo-{index}" for index in range(7)]
+        previous_cache = {"owner/repo-1": {"tag": "v0.9.0", "published": "2026-06-01 10:00:00"}}
+
+        def fetch_release(repo: str) -> dict[str, str] | None:
+            if repo == "owner/repo-3":
+                return None
+            return {"tag_name": f"v1.{repo[-1]}.0", "name": repo, "published_at": f"2026-06-2{repo[-1]} 10:00:00"}
+
+        def detect(fetch: check_release.ReleaseFetcher, repo_list, **kwargs):
+            return check_release.detect_releases(
+                repo_list, fetch, previous_cache, {"owner/repo-2"}, first_run=False, sleep_seconds=0, now=NOW, **kwargs
+            )
+
+        checkpoints: list[dict[str, object]] = []
+
+        def crash_at_repo_5(repo: str) -> dict[str, str] | None:
+            if repo == "owner/repo-5":
+                raise TimeoutError("runner timeout")
+            return fetch_release(repo)
+
+        with self.assertRaises(TimeoutError):
+            detect(
+                crash_at_repo_5,
+                repos,
+                checkpoint=lambda state: checkpoints.append(json.loads(json.dumps(state))),
+                checkpoint_every=2,
+            )
+        self.assertEqual([checkpoint["cursor"] for checkpoint in checkpoints], [2, 4])
+
+        remaining, resume = check_release.resume_repos(repos, checkpoints[-1])
+        resumed = detect(fetch_release, remaining, resume=resume)
+
+        self.assertEqual(resumed, detect(fetch_release, repos))
+        self.assertIsNone(check_release.resume_repos(["owner/other", *repos], checkpoints[-1])[1])
+
+    def test_failed_repos_are_retried_then_keep_previous_cache_entry(self) -> None:
+        previous_cache = {"owner/broken": {"tag": "v0.1.0", "published": "2026-06-01 10:00:00"}}
+        calls: list[str] = []
+
+        def fetch_release(repo: str) -> dict[str, str] | None:
+            calls.append(repo)
+            if repo == "owner/broken" or (repo == "owner/flaky" and calls.count(repo) < 3):
+                raise check_release.GitHubApiError(502, "Bad Gateway")
+            return {"tag_name": "v1.0.0", "name": repo, "published_at": "2026-06-20 10:00:00"}
+
+        sleeps: list[float] = []
+        faults = check_release.FaultPolicy(retry_attempts=2, breaker_threshold=10, sleep=sleeps.append)
+        result = check_release.detect_releases(
+            ["owner/ok", "owner/flaky", "owner/broken"],
+            fetch_release,
+            previous_cache,
+            special_projects=set(),
+            first_run=False,
+            sleep_seconds=0,
+            now=NOW,
+            faults=faults,
+        )
+
+        self.assertEqual([release.repo for release in result.releases], ["owner/ok", "owner/flaky"])
+        self.assertEqual(result.current_cache["owner/broken"], previous_cache["owner/broken"])
+        self.assertEqual(
+            result.errors,
+            [
+                {
+                    "repo": "owner/broken",
+                    "error": "GitHubApiError",
+                    "message": "GitHub API error 502: Bad Gateway",
+                    "attempts": 3,
+                }
+            ],
+        )
+        self.assertEqual(sleeps, [2.0, 4.0])
+
+        clock = [0.0]
+        calls.clear()
+
+        def advance_clock(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        breaker_faults = check_release.FaultPolicy(
+            retry_attempts=1, breaker_threshold=2, breaker_cooldown=30, clock=lambda: clock[0], sleep=advance_clock
+        )
+        result = check_release.detect_releases(
+            [f"owner/broken-{index}" for index in range(6)],
+            lambda repo: fetch_release("owner/broken"),
+            {},
+            special_projects=set(),
+            first_run=False,
+            sleep_seconds=0,
+            now=NOW,
+            faults=breaker_faults,
+        )
+
+        # Two failures open the circuit; the retry round sends one half-open probe after the cooldown.
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(result.errors), 6)
+        self.assertEqual(sleeps[-1], 30)
+
+    def test_concurrent_detection_matches_sequential_result(self) -> None:
+        repos = [f"owner/repo-{index}" for index in range(40)]
+
+        def fetch(repo: str) -> dict[str, str] | None:
+            index = int(repo.rsplit("-", 1)[1])
+            time.sleep(0.001 * (index % 5))
+            if index % 7 == 0:
+                return None
+            return {
+                "tag_name": f"v{index}.0.0",
+                "published_at": f"2026-06-20 10:{index % 3:02d}:00",
+                "html_url": f"https://github.com/{repo}/releases/tag/v{index}.0.0",
+            }
+
+        options = {"previous_cache": {}, "special_projects": set(), "first_run": True, "sleep_seconds": 0, "now": NOW}
+        sequential = check_release.detect_releases(repos, fetch, **options)
+        concurrent = check_release.detect_releases(repos, fetch, concurrency=8, **options)
+        self.assertEqual(concurrent, sequential)
+        self.assertEqual(list(concurrent.current_cache), list(sequential.current_cache))
+
+    def test_graphql_fetcher_resolves_repos_in_batches(self) -> None:
+        releases = {
+            f"owner/repo-{index}": {
+                "tag_name": f"v{index}.0.0",
+                "name": f"Release v{index}.0.0",
+                "published_at": "2026-06-20T10:00:00Z",
+                "html_url": f"https://github.com/owner/repo-{index}/releases/tag/v{index}.0.0",
+            }
+            for index in range(5)
+        }
+        releases["owner/no-release"] = None
+        repos = [*releases, "owner/missing"]
+
+        with fake_github_server.FakeGitHubServer(releases) as server:
+            fetcher = check_release.get_graphql_release_fetcher("token", server.url, batch_size=3)
+            result = check_release.detect_releases(
+                repos, fetcher, previous_cache={}, special_projects=set(), first_run=True, sleep_seconds=0
+            )
+
+        self.assertEqual(server.requests, [("POST", "/graphql")] * 3)
+        self.assertEqual(result.scanned_repos, 7)
+        self.assertEqual(result.repos_with_release, 5)
+        self.assertEqual(result.current_cache["owner/repo-0"]["published"], "2026-06-20 10:00:00")
+        self.assertEqual(result.current_cache["owner/repo-4"]["tag"], "v4.0.0")
+
+    def test_rest_fetcher_reuses_cached_release_on_not_modified(self) -> None:
+        releases = {
+            "owner/repo": {
+                "tag_name": "v1.0.0",
+                "name": "v1.0.0",
+                "published_at": "2026-06-20T10:00:00Z",
+                "html_url": "https://github.com/owner/repo/releases/tag/v1.0.0",
+            }
+        }
+        with fake_github_server.FakeGitHubServer(releases) as server:
+            first = check_release.detect_releases(
+                ["owner/repo"],
+                check_release.get_rest_release_fetcher("token", {}, server.url),
+                previous_cache={},
+                special_projects=set(),
+                first_run=True,
+                sleep_seconds=0,
+                now=NOW,
+            )
+            second = check_release.detect_releases(
+                ["owner/repo"],
+                check_release.get_rest_release_fetcher("token", first.current_cache, server.url),
+                previous_cache=first.current_cache,
+                special_projects=set(),
+                first_run=False,
+                sleep_seconds=0,
+                now=NOW,
+            )
+
+        self.assertTrue(first.current_cache["owner/repo"]["etag"])
+        self.assertEqual(second.releases, [])
+        self.assertEqual(second.current_cache, first.current_cache)
+        self.assertEqual(len(server.requests), 2)
+
+    def test_metrics_count_api_calls_not_modified_and_fetch_latency(self) -> None:
+        releases = {"owner/repo": {"tag_name": "v1.0.0", "name": "v1.0.0", "published_at": "2026-06-20T10:00:00Z"}}
+        metrics = check_release.RunMetrics()
+        cache: dict[str, dict[str, object]] = {}
+        with fake_github_server.FakeGitHubServer(releases) as server:
+            for first_run in (True, False):
+                with metrics.phase("detect_releases"):
+                    cache = check_release.detect_releases(
+                        ["owner/repo"],
+                        check_release.get_rest_release_fetcher("token", cache, server.url, metrics=metrics),
+                        previous_cache=cache,
+                        special_projects=set(),
+                        first_run=first_run,
+                        sleep_seconds=0,
+                        now=NOW,
+                        metrics=metrics,
+                    ).current_cache
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["api"]["calls"], 2)
+        self.assertEqual(snapshot["api"]["not_modified"], 1)
+        self.assertEqual(snapshot["fetch_latency_ms"]["count"], 2)
+        self.assertIn("detect_releases", snapshot["phases_seconds"])
+        self.assertEqual(check_release.percentile([3.0, 1.0, 2.0, 4.0], 0.5), 2.0)
+
+    def test_catch_up_reports_every_release_since_cached_tag(self) -> None:
+        def release(tag: str, day: int, prerelease: bool = False) -> dict[str, object]:
+            return {
+                "tag_name": tag,
+                "name": tag,
+                "published_at": f"2026-06-{day:02d}T10:00:00Z",
+                "html_url": f"https://github.com/owner/repo/releases/tag/{tag}",
+                "prerelease": prerelease,
+            }
+
+        history = [
+            release("v1.3.0", 21),
+            release("v1.3.0-rc.1", 20, prerelease=True),
+            release("v1.2.1", 19),
+            release("v1.2.0", 18),
+            release("v1.1.0", 10),
+            release("v1.0.0", 1),
+        ]
+        previous_cache = {"owner/repo": {"tag": "v1.1.0", "published": "2026-06-10 10:00:00"}}
+        with fake_github_server.FakeGitHubServer({"owner/repo": history[0]}) as server:
+            server.history["owner/repo"] = history
+            result = check_release.detect_releases(
+                ["owner/repo"],
+                check_release.get_rest_release_fetcher("token", {}, server.url),
+                previous_cache=previous_cache,
+                special_projects=set(),
+                first_run=False,
+                sleep_seconds=0,
+                fetch_missed=check_release.get_missed_release_fetcher("token", server.url, per_page=3),
+            )
+
+        self.assertEqual([release.tag for release in result.releases], ["v1.3.0", "v1.2.1", "v1.2.0"])
+        self.assertEqual(result.current_cache["owner/repo"]["tag"], "v1.3.0")
+        # Catch-up releases feed the cadence history, so the repo is promoted to the hot tier.
+        entry = result.current_cache["owner/repo"]
+        self.assertEqual(len(entry["release_times"]), 3)
+        polling = check_release.normalize_config({})["polling"]
+        self.assertEqual(check_release.polling_tier(entry, False, NOW + timedelta(days=30), polling), "hot")
+        self.assertEqual(
+            server.requests,
+            [
+                ("GET", "/repos/owner/repo/releases/latest"),
+                ("GET", "/repos/owner/repo/releases?per_page=3&page=1"),
+                ("GET", "/repos/owner/repo/releases?per_page=3&page=2"),
+            ],
+        )
+
+    def test_scheduler_spreads_low_quota_until_reset(self) -> None:
+        clock = [1_000.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        scheduler = check_release.RateLimitScheduler(
+            max_rate=10, burst=1, reserve=50, clock=lambda: clock[0], sleep=sleep
+        )
+        scheduler.observe({"x-ratelimit-remaining": "4000", "x-ratelimit-limit": "5000", "x-ratelimit-reset": "4600"})
+        self.assertEqual(scheduler.rate, 10)
+
+        scheduler.observe({"x-ratelimit-remaining": "150", "x-ratelimit-limit": "5000", "x-ratelimit-reset": "1100"})
+        self.assertAlmostEqual(scheduler.rate, 1.0)
+        scheduler.acquire()
+        scheduler.acquire()
+        self.assertAlmostEqual(sum(sleeps), 1.0)
+
+        scheduler.observe({"x-ratelimit-remaining": "10", "x-ratelimit-limit": "5000", "x-ratelimit-reset": "1500"})
+        scheduler.acquire()
+        self.assertGreaterEqual(clock[0], 1500)
+
+    def test_client_retries_after_rate_limited_response(self) -> None:
+        clock = [1_000.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        scheduler = check_release.RateLimitScheduler(clock=lambda: clock[0], sleep=sleep)
+        releases = {
+            "owner/repo": {
+                "tag_name": "v1.0.0",
+                "published_at": "2026-06-20T10:00:00Z",
+                "html_url": "https://github.com/owner/repo/releases/tag/v1.0.0",
+            }
+        }
+        with fake_github_server.FakeGitHubServer(releases) as server:
+            server.faults.append((429, {"Retry-After": "7"}))
+            fetch = check_release.get_rest_release_fetcher("token", {}, server.url, scheduler)
+            raw = fetch("owner/repo")
+
+        self.assertEqual(raw["tag_name"], "v1.0.0")
+        self.assertEqual(len(server.requests), 2)
+        self.assertAlmostEqual(sum(sleeps), 7.0)
+
+    def test_fake_server_enforces_rate_limit_and_injects_faults(self) -> None:
+        releases = {"owner/repo": {"tag_name": "v1.0.0", "name": "v1.0.0", "published_at": "2026-06-20T10:00:00Z"}}
+        with fake_github_server.FakeGitHubServer(releases, rate_limit=2, latency=0.01) as server:
+            client = check_release.GitHubApiClient("token", server.url)
+            first = client.request("GET", "repos/owner/repo/releases/latest")
+            etag = first.headers["etag"]
+            not_modified = client.request("GET", "repos/owner/repo/releases/latest", headers={"If-None-Match": etag})
+            second = client.request("GET", "repos/owner/repo/releases/latest")
+            with self.assertRaises(check_release.GitHubApiError) as exhausted:
+                client.request("GET", "repos/owner/repo/releases/latest")
+
+            server.rate_limit = None
+            server.burst(503, 1)
+            with self.assertRaises(check_release.GitHubApiError) as unavailable:
+                client.request("GET", "repos/owner/repo/releases/latest")
+
+        self.assertEqual(first.headers["x-ratelimit-remaining"], "1")
+        self.assertEqual(not_modified.status, 304)
+        self.assertEqual(second.headers["x-ratelimit-remaining"], "0")
+        self.assertEqual(exhausted.exception.status, 403)
+        self.assertEqual(unavailable.exception.status, 503)
+
+    def test_client_wraps_html_and_transport_errors_and_retries_whole_run_calls(self) -> None:
+        sleeps: list[float] = []
+        faults = check_release.FaultPolicy(retry_attempts=2, sleep=sleeps.append)
+        starred = [{"full_name": "owner/repo", "pushed_at": "2026-06-20T00:00:00Z"}]
+        html_502 = (502, {"Content-Type": "text/html"})
+        with fake_github_server.FakeGitHubServer({}, starred) as server:
+            server.faults.append(html_502)
+            with self.assertRaises(check_release.GitHubApiError) as bad_gateway:
+                check_release.GitHubApiClient("token", server.url).request("GET", "user/starred")
+
+            server.faults.extend([html_502, html_502])
+            client = check_release.GitHubApiClient("token", server.url, faults=faults)
+            repos = [repo.full_name for repo in check_release.iter_starred_repos(client, {})]
+
+        self.assertEqual(bad_gateway.exception.status, 502)
+        self.assertEqual(repos, ["owner/repo"])
+        self.assertEqual(sleeps, [2.0, 4.0])
+        # The server is gone: the connection error is a GitHubApiError too, after the retries.
+        with self.assertRaises(check_release.GitHubApiError) as unreachable:
+            client.request("GET", "user/starred")
+        self.assertEqual(unreachable.exception.status, 0)
+        self.assertEqual(sleeps[2:], [2.0, 4.0])
+
+    @unittest.skipUnless(importlib.util.find_spec("github"), "PyGithub is not installed")
+    def test_pygithub_fetcher_against_fake_server(self) -> None:
+        releases = {"owner/repo": {"tag_name": "v1.0.0", "name": "v1.0.0", "published_at": "2026-06-20T10:00:00Z"}}
+        with fake_github_server.FakeGitHubServer(releases) as server:
+            fetch_release = check_release.get_github_release_fetcher("token", api_url=server.url)
+            raw = fetch_release("owner/repo")
+
+        self.assertEqual(raw["tag_name"], "v1.0.0")
+
     def test_policy_notifies_special_project_below_threshold(self) -> None:
         config = check_release.normalize_config(
             {
@@ -74,6 +775,288 @@ class CheckReleaseTest(unittest.TestCase):
         self.assertTrue(decision.should_notify)
         self.assertEqual(decision.reason, "special_project_release")
 
+    def test_slack_payloads_split_within_byte_budget_with_numbered_headers(self) -> None:
+        releases = [
+            check_release.Release(
+                repo=f"조직-{index}/저장소-{index}",
+                tag=f"v{index}.0.0",
+                name="",
+                published="2026-06-20 10:00:00",
+                html_url=f"https://github.com/owner/repo/releases/tag/v{index}.0.0",
+            )
+            for index in range(120)
+        ]
+        decision = check_release.NotificationDecision(True, "threshold_reached")
+
+        for unit, measure in (("chars", len), ("bytes", lambda text: len(text.encode("utf-8")))):
+            config = check_release.normalize_config(
+                {"notification": {"max_slack_text_length": 2_000, "slack_length_unit": unit}}
+            )
+            payloads = check_release.build_slack_payloads(releases, False, config, decision)
+
+            self.assertGreater(len(payloads), 1)
+            self.assertTrue(all(measure(payload["text"]) <= 2_000 for payload in payloads))
+            header = "🚀 *새로운 릴리스 (120개)"
+            for index, payload in enumerate(payloads, start=1):
+                self.assertTrue(payload["text"].startswith(f"{header} - {index}/{len(payloads)}*"))
+            lines = [line for payload in payloads for line in payload["text"].splitlines() if line.startswith("*")]
+            self.assertEqual(lines, [check_release.format_release_line(release) for release in releases])
+
+        blocks_config = check_release.normalize_config({"notification": {"slack_format": "blocks"}})
+        payloads = check_release.build_slack_payloads(releases, False, blocks_config, decision)
+        self.assertEqual(len(payloads), 1)
+        sections = [block["text"]["text"] for block in payloads[0]["blocks"][3:]]
+        self.assertGreater(len(sections), 1)
+        self.assertTrue(all(len(text) <= check_release.SLACK_SECTION_TEXT_LIMIT for text in sections))
+
+    def test_slack_delivery_keeps_order_honors_retry_after_and_skips_receipts(self) -> None:
+        payloads = [{"text": f"message {index}"} for index in range(3)]
+        sleeps: list[float] = []
+        with tempfile.TemporaryDirectory() as tmp_dir, fake_slack_webhook.FakeSlackWebhook() as webhook:
+            receipts = Path(tmp_dir) / "slack-receipts.jsonl"
+            webhook.faults.append((429, {"Retry-After": "4"}))
+
+            sent = check_release.deliver_slack_payloads(payloads[:2], webhook.url, receipts, sleep=sleeps.append)
+            rerun = check_release.deliver_slack_payloads(payloads, webhook.url, receipts, sleep=sleeps.append)
+
+        self.assertEqual((sent, rerun), (2, 1))
+        self.assertEqual(webhook.payloads, payloads)
+        self.assertEqual(webhook.connections, 2)
+        self.assertEqual(sleeps, [4.0, 1.0])
+
+    def test_slack_delivery_retries_a_stalled_response(self) -> None:
+        payloads = [{"text": "message 0"}, {"text": "message 1"}]
+        sleeps: list[float] = []
+        with tempfile.TemporaryDirectory() as tmp_dir, fake_slack_webhook.FakeSlackWebhook() as webhook:
+            receipts = Path(tmp_dir) / "slack-receipts.jsonl"
+            webhook.stalls.append(0.5)
+
+            sent = check_release.deliver_slack_payloads(
+                payloads, webhook.url, receipts, timeout=0.1, sleep=sleeps.append
+            )
+
+            self.assertEqual(sent, 2)
+            self.assertEqual(webhook.payloads, payloads)
+            self.assertEqual(len(receipts.read_text(encoding="utf-8").splitlines()), 2)
+        self.assertEqual(sleeps, [1.0, 1.0])
+
+    def test_slack_receipts_older_than_the_dedup_window_are_trimmed(self) -> None:
+        def receipt(digest: str, days_ago: float) -> str:
+            return json.dumps({"digest": digest, "sent_at": (NOW - timedelta(days=days_ago)).isoformat()}) + "\n"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "slack-receipts.jsonl"
+            path.write_text(receipt("old", 30) + receipt("recent", 1) + receipt("today", 0), encoding="utf-8")
+
+            receipts = check_release.load_slack_receipts(path, now=NOW)
+
+            self.assertEqual(receipts, {"recent", "today"})
+            self.assertEqual(path.read_text(encoding="utf-8"), receipt("recent", 1) + receipt("today", 0))
+
+    def test_accounts_share_release_lookups_but_keep_own_policy(self) -> None:
+        calls: list[str] = []
+
+        def fetch_release(repo: str) -> dict[str, str]:
+            calls.append(repo)
+            return {"tag_name": "v1.0.0", "name": "v1.0.0", "published_at": "2026-06-20 10:00:00"}
+
+        shared = check_release.memoize_fetcher(fetch_release)
+        for repo in ["a/shared", "b/only", "a/shared"]:
+            shared(repo)
+        self.assertEqual(calls, ["a/shared", "b/only"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            (tmp / "alice.txt").write_text("grafana/grafana\nother/repo\n", encoding="utf-8")
+            (tmp / "bob.txt").write_text("other/repo\n", encoding="utf-8")
+            release = {"tag_name": "v1.2.3", "name": "v1.2.3", "published_at": "2026-06-20 09:00:00"}
+            fixture_file = tmp / "fixture.json"
+            fixture_file.write_text(
+                json.dumps({"grafana/grafana": release, "other/repo": release}), encoding="utf-8"
+            )
+            accounts_file = tmp / "accounts.json"
+            accounts_file.write_text(
+                json.dumps(
+                    {
+                        "accounts": [
+                            {
+                                "name": "alice",
+                                "repos_file": str(tmp / "alice.txt"),
+                                "cache_path": str(tmp / "a" / "c.json"),
+                            },
+                            {
+                                "name": "bob",
+                                "repos_file": str(tmp / "bob.txt"),
+                                "cache_path": str(tmp / "bob.json"),
+                                "feed_path": str(tmp / "bob-feed.json"),
+                                "config": {"special_projects": ["other/repo"]},
+                            },
+                        ]
+                    }
+                ),
+                encoding="utf-8",
+            )
+            output_path = tmp / "github-output.txt"
+            # An interrupted earlier run left alice's checkpoint after her first repo.
+            checkpoints: list[dict[str, object]] = []
+            check_release.detect_releases(
+                ["grafana/grafana", "other/repo"],
+                lambda repo: dict(release, tag_name="v1.2.3-resumed"),
+                {},
+                set(),
+                first_run=True,
+                sleep_seconds=0,
+                checkpoint=checkpoints.append,
+                checkpoint_every=1,
+            )
+            check_release.save_checkpoint(tmp / "a" / "scan-checkpoint.json", checkpoints[0])
+
+            exit_code = check_release.run(
+                check_release.build_arg_parser().parse_args(
+                    [
+                        "--accounts-file",
+                        str(accounts_file),
+                        "--config",
+                        str(tmp / "missing-config.yaml"),
+                        "--github-output",
+                        str(output_path),
+                        "--fixture-releases",
+                        str(fixture_file),
+                        "--no-sleep",
+                        "--resume",
+                        "--metrics-textfile",
+                        str(tmp / "metrics.prom"),
+                    ]
+                )
+            )
+
+            self.assertEqual(exit_code, 0)
+            alice_feed = json.loads((tmp / "a" / "release-feed.json").read_text(encoding="utf-8"))
+            self.assertEqual([release["is_special"] for release in alice_feed["releases"]], [False, False])
+            self.assertEqual(sorted(release["tag"] for release in alice_feed["releases"]), ["v1.2.3", "v1.2.3-resumed"])
+            self.assertFalse((tmp / "a" / "scan-checkpoint.json").exists())
+            self.assertIn("detect_releases", alice_feed["metrics"]["phases_seconds"])
+            textfile = (tmp / "metrics.prom").read_text(encoding="utf-8").splitlines()
+            self.assertIn('github_stars_release_new_releases{account="alice"} 2', textfile)
+            self.assertIn('github_stars_release_scanned_repos{account="bob"} 1', textfile)
+            bob_feed = json.loads((tmp / "bob-feed.json").read_text(encoding="utf-8"))
+            self.assertEqual(bob_feed["account"], "bob")
+            self.assertEqual([release["is_special"] for release in bob_feed["releases"]], [True])
+            outputs = output_path.read_text(encoding="utf-8").splitlines()
+            self.assertIn("release_count=3", outputs)
+            accounts = json.loads(next(line for line in outputs if line.startswith("accounts="))[len("accounts="):])
+            self.assertEqual([account["account"] for account in accounts], ["alice", "bob"])
+
+            # Checkpoints, receipts and star pages live next to each cache, so caches can't share a directory.
+            accounts_file.write_text(
+                json.dumps(
+                    {
+                        "accounts": [
+                            {"name": "alice", "repos_file": "a.txt", "cache_path": str(tmp / "alice.json")},
+                            {"name": "bob", "repos_file": "b.txt", "cache_path": str(tmp / "bob.json")},
+                        ]
+                    }
+                ),
+                encoding="utf-8",
+            )
+            with self.assertRaisesRegex(ValueError, "alice and bob must not share a cache directory"):
+                check_release.load_accounts(accounts_file)
+
+    def test_memoized_fetchers_share_in_flight_lookups(self) -> None:
+        calls: list[str] = []
+        started = threading.Event()
+        release_fetch = threading.Event()
+
+        def slow_fetch(repo: str) -> dict[str, str]:
+            calls.append(repo)
+            started.set()
+            release_fetch.wait(5)
+            return {"tag_name": "v1.0.0", "name": "v1.0.0", "published_at": "2026-06-20 10:00:00"}
+
+        shared = check_release.memoize_fetcher(slow_fetch)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(shared, "a/shared")
+            started.wait(5)
+            waiters = [pool.submit(shared, "a/shared") for _ in range(3)]
+            time.sleep(0.05)
+            release_fetch.set()
+            results = [future.result(5) for future in [first, *waiters]]
+        self.assertEqual(calls, ["a/shared"])
+        self.assertTrue(all(result is results[0] for result in results))
+
+        attempts: list[str] = []
+
+        def flaky_fetch(repo: str) -> None:
+            attempts.append(repo)
+            if len(attempts) == 1:
+                raise TimeoutError("first try")
+
+        flaky = check_release.memoize_fetcher(flaky_fetch)
+        with self.assertRaises(TimeoutError):
+            flaky("a/flaky")
+        self.assertIsNone(flaky("a/flaky"))
+        self.assertEqual(attempts, ["a/flaky", "a/flaky"])
+
+        missed_calls: list[tuple[str, str]] = []
+
+        def fetch_missed(repo: str, previous: dict[str, str]) -> list[dict[str, str]]:
+            missed_calls.append((repo, previous["tag"]))
+            return [{"tag_name": "v1.1.0"}]
+
+        shared_missed = check_release.memoize_missed_fetcher(fetch_missed)
+        for tag in ["v1.0.0", "v1.0.0", "v0.9.0"]:
+            shared_missed("a/shared", {"tag": tag, "published": "2026-06-01 10:00:00"})
+        self.assertEqual(missed_calls, [("a/shared", "v1.0.0"), ("a/shared", "v0.9.0")])
+
+    def test_feed_deltas_are_sequenced_partitioned_and_readable_after_a_sequence(self) -> None:
+        def feed(day: int, repos: list[str]) -> dict[str, object]:
+            return {
+                "generated_at": f"2026-06-{day:02d}T08:00:00Z",
+                "releases": [{"repo": repo, "tag": "v1.0.0"} for repo in repos],
+            }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            deltas_dir = Path(tmp_dir) / "feed-deltas"
+            first = check_release.append_feed_delta(deltas_dir, feed(20, ["a/one"]))
+            self.assertIsNone(check_release.append_feed_delta(deltas_dir, feed(21, [])))
+            second = check_release.append_feed_delta(deltas_dir, feed(22, ["b/two", "c/three"]))
+
+            self.assertEqual((first["sequence"], first["path"]), (1, "2026/06/20/00000001.json"))
+            self.assertEqual((second["sequence"], second["path"]), (2, "2026/06/22/00000002.json"))
+            after_first = list(check_release.iter_feed_deltas(deltas_dir, after_sequence=1))
+            self.assertEqual([delta["sequence"] for delta in after_first], [2])
+            self.assertEqual(len(after_first[0]["releases"]), 2)
+
+            (deltas_dir / second["path"]).write_text("{}", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                list(check_release.iter_feed_deltas(deltas_dir, after_sequence=1))
+
+    def test_json_files_round_trip_in_every_serialization_format(self) -> None:
+        feed = {
+            "generated_at": "2026-06-22T00:00:00Z",
+            "releases": [{"repo": "a/one", "tag": "v1.0.0", "name": "릴리스"}, {"repo": "b/two", "tag": "v2"}],
+            "errors": [],
+            "release_count": 2,
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sizes = {}
+            for name in ("feed.json", "feed.min.json", "feed.json.gz", "feed.ndjson", "feed.ndjson.gz"):
+                path = Path(tmp_dir) / name
+                check_release.write_json_file(path, feed)
+                sizes[name] = path.stat().st_size
+                self.assertEqual(check_release.load_json_file(path, None), feed)
+
+            self.assertTrue(json.loads((Path(tmp_dir) / "feed.json").read_text(encoding="utf-8")))
+            self.assertLess(sizes["feed.min.json"], sizes["feed.json"])
+            self.assertEqual(
+                len((Path(tmp_dir) / "feed.ndjson").read_text(encoding="utf-8").splitlines()), 5
+            )
+            # Magic bytes win over a misleading extension.
+            renamed = Path(tmp_dir) / "feed.json"
+            renamed.write_bytes((Path(tmp_dir) / "feed.json.gz").read_bytes())
+            self.assertEqual(check_release.load_json_file(renamed, None), feed)
+            self.assertEqual(check_release.load_json_file(Path(tmp_dir) / "missing.json.gz", {}), {})
+
     def test_run_writes_feed_and_actions_outputs_with_fixture(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp = Path(tmp_dir)
@@ -118,21 +1101,32 @@ feed:
             output_path = tmp / "github-output.txt"
 
             exit_code = check_release.run(
-                Namespace(
-                    repos_file=repos_file,
-                    cache_path=tmp / "cache.json",
-                    config=config_file,
-                    feed_path=feed_path,
-                    github_output=output_path,
-                    fixture_releases=fixture_file,
-                    sleep_seconds=0,
-                    no_sleep=True,
+                check_release.build_arg_parser().parse_args(
+                    [
+                        "--repos-file",
+                        str(repos_file),
+                        "--cache-path",
+                        str(tmp / "cache.json"),
+                        "--config",
+                        str(config_file),
+                        "--feed-path",
+                        str(feed_path),
+                        "--github-output",
+                        str(output_path),
+                        "--fixture-releases",
+                        str(fixture_file),
+                        "--metrics-textfile",
+                        str(tmp / "metrics.prom"),
+                        "--no-sleep",
+                    ]
                 )
             )
 
             self.assertEqual(exit_code, 0)
             feed = json.loads(feed_path.read_text(encoding="utf-8"))
             self.assertEqual(feed["schema_version"], "github-stars-release-feed/v1")
+            self.assertEqual(feed["metrics"]["fetch_latency_ms"]["count"], 2)
+            self.assertIn("github_stars_release_new_releases 2", (tmp / "metrics.prom").read_text(encoding="utf-8"))
             self.assertEqual(feed["release_count"], 2)
             self.assertEqual(feed["special_release_count"], 1)
             self.assertTrue(feed["notify"])
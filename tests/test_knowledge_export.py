@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import contextlib
+import gzip
+import hashlib
 import importlib.util
+import io
 import json
+import re
 import sys
 import tempfile
+import tracemalloc
 import unittest
 from pathlib import Path
 
@@ -50,6 +56,198 @@ class GithubStarsKnowledgeExportTests(unittest.TestCase):
             self.assertEqual(payload["visibility"], "public")
             self.assertTrue(payload["content_hash"].startswith("sha256:"))
 
+    def test_exports_only_deltas_after_sequence_from_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            deltas_dir = Path(tmp_dir)
+            entries = []
+            for sequence, repo in ((1, "old/repo"), (2, "new/repo")):
+                raw = json.dumps(
+                    {
+                        "generated_at": "2026-06-27T00:00:00Z",
+                        "sequence": sequence,
+                        "releases": [{"repo": repo, "tag": "v1.0.0", "published": "2026-06-20 12:00:00"}],
+                    }
+                ).encode("utf-8")
+                path = f"2026/06/27/{sequence:08d}.json"
+                (deltas_dir / path).parent.mkdir(parents=True, exist_ok=True)
+                (deltas_dir / path).write_bytes(raw)
+                entries.append({"sequence": sequence, "path": path, "sha256": hashlib.sha256(raw).hexdigest()})
+            (deltas_dir / "manifest.json").write_text(
+                json.dumps({"latest_sequence": 2, "deltas": entries}), encoding="utf-8"
+            )
+
+            docs = export_knowledge_jsonl.export_documents(deltas_dir, after_sequence=1)
+
+            self.assertEqual([doc.document_id for doc in docs], ["releases/new/repo/v1.0.0"])
+
+    def test_exports_compressed_and_ndjson_feeds(self) -> None:
+        release = {"repo": "a/one", "tag": "v1.0.0", "published": "2026-06-20 12:00:00"}
+        lines = [
+            {"k": "generated_at", "v": "2026-06-27T00:00:00Z"},
+            {"k": "releases", "i": release},
+            {"k": "schema_version", "v": "github-stars-release-feed/v1"},
+        ]
+        ndjson = "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            gz_path = Path(tmp_dir) / "release-feed.json.gz"
+            gz_path.write_bytes(gzip.compress(json.dumps({"releases": [release]}).encode("utf-8")))
+            ndjson_path = Path(tmp_dir) / "release-feed.ndjson.gz"
+            ndjson_path.write_bytes(gzip.compress(ndjson))
+
+            for path in (gz_path, ndjson_path):
+                docs = export_knowledge_jsonl.export_documents(path)
+                self.assertEqual([doc.document_id for doc in docs], ["releases/a/one/v1.0.0"])
+            docs = export_knowledge_jsonl.export_documents(ndjson_path)
+            self.assertEqual(docs[0].metadata["feed_schema_version"], "github-stars-release-feed/v1")
+
+    def test_streaming_export_matches_full_load_with_flat_memory(self) -> None:
+        def feed(count: int) -> dict[str, object]:
+            return {
+                "generated_at": "2026-06-27T00:00:00Z",
+                "notify_reason": "threshold_reached",
+                "releases": [
+                    {"repo": f"org/repo-{index}", "tag": f"v{index}.0.0", "name": 'v1 "릴리스"', "published": 1e3}
+                    for index in range(count)
+                ],
+                "schema_version": "github-stars-release-feed/v1",
+            }
+
+        def export_peak(feed_path: Path, output: Path) -> int:
+            tracemalloc.start()
+            count = export_knowledge_jsonl.write_jsonl(export_knowledge_jsonl.iter_documents(feed_path), output)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.assertGreater(count, 0)
+            return peak
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            peaks = []
+            for count in (2_000, 8_000):
+                feed_path = Path(tmp_dir) / f"release-feed-{count}.json"
+                feed_path.write_text(json.dumps(feed(count), indent=2, ensure_ascii=False), encoding="utf-8")
+                peaks.append(export_peak(feed_path, Path(tmp_dir) / "out.jsonl"))
+
+            expected = [doc.to_json() for doc in export_knowledge_jsonl.documents_from_feed(feed(8_000))]
+            self.assertEqual((Path(tmp_dir) / "out.jsonl").read_text(encoding="utf-8").splitlines(), expected)
+            streamed = export_knowledge_jsonl.iter_feed_documents(feed_path, chunk_size=61)
+            self.assertEqual([doc.to_json() for doc in streamed], expected)
+            self.assertLess(peaks[1], peaks[0] * 1.5)
+
+    def test_incremental_export_emits_only_changed_documents_and_optional_tombstones(self) -> None:
+        def documents(*releases: tuple[str, str]) -> list[object]:
+            feed = {"generated_at": "2026-06-27T00:00:00Z", "releases": [{"repo": r, "tag": t} for r, t in releases]}
+            return export_knowledge_jsonl.documents_from_feed(feed)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manifest_path = Path(tmp_dir) / "export-manifest.json"
+            hashes = export_knowledge_jsonl.load_export_manifest(manifest_path)
+            changed = export_knowledge_jsonl.iter_changed_documents
+            first = list(changed(documents(("a/one", "v1"), ("b/two", "v1")), hashes))
+            export_knowledge_jsonl.save_export_manifest(manifest_path, hashes)
+            self.assertEqual(len(first), 2)
+
+            hashes = export_knowledge_jsonl.load_export_manifest(manifest_path)
+            second = list(changed(documents(("a/one", "v1"), ("c/three", "v2")), hashes))
+            self.assertEqual([doc.document_id for doc in second], ["releases/c/three/v2"])
+            self.assertIn("releases/b/two/v1", hashes)
+
+            deleted_at = "2026-06-28T00:00:00Z"
+            third = list(changed(documents(("a/one", "v1")), hashes, tombstone_missing=True, deleted_at=deleted_at))
+            self.assertEqual([doc.document_id for doc in third], ["releases/b/two/v1", "releases/c/three/v2"])
+            self.assertEqual(
+                {(doc.lifecycle, doc.deleted_at, doc.indexable) for doc in third}, {("deleted", deleted_at, False)}
+            )
+            self.assertEqual(list(hashes), ["releases/a/one/v1"])
+
+    def test_bulk_export_merges_archived_feeds_keeping_newest_document(self) -> None:
+        def write_feed(path: Path, generated_at: str, releases: list[tuple[str, str]], reason: str) -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            feed = {
+                "generated_at": generated_at,
+                "notify_reason": reason,
+                "releases": [{"repo": repo, "tag": tag} for repo, tag in releases],
+            }
+            path.write_text(json.dumps(feed), encoding="utf-8")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            write_feed(root / "run-3" / "release-feed.json", "2026-06-22T00:00:00Z", [("a/one", "v1")], "newest")
+            write_feed(root / "run-1" / "release-feed.json", "2026-06-20T00:00:00Z", [("a/one", "v1")], "oldest")
+            write_feed(root / "run-2" / "release-feed.json", "2026-06-21T00:00:00Z", [("b/two", "v2")], "middle")
+            (root / "run-2" / "manifest.json").write_text("{}", encoding="utf-8")
+            # Other state that lives next to feeds in .cache must be skipped, not abort the export.
+            (root / "scan-checkpoint.json").write_text(json.dumps({"version": 1, "cursor": 500}), encoding="utf-8")
+            (root / "starred-etags.json").write_text(json.dumps([{"etag": "W/1"}]), encoding="utf-8")
+            (root / "broken.json").write_text("{not json", encoding="utf-8")
+
+            for workers in (1, 2):
+                with contextlib.redirect_stderr(io.StringIO()) as warnings:
+                    docs = export_knowledge_jsonl.bulk_export_documents([tmp_dir], workers=workers)
+                if workers == 1:
+                    self.assertEqual(warnings.getvalue().count("WARNING: skipping"), 3)
+                self.assertEqual([doc.document_id for doc in docs], ["releases/a/one/v1", "releases/b/two/v2"])
+                self.assertEqual(docs[0].metadata["notify_reason"], "newest")
+
+            globbed = export_knowledge_jsonl.bulk_export_documents([f"{tmp_dir}/run-[12]/*.json"], workers=2)
+            self.assertEqual([doc.metadata["notify_reason"] for doc in globbed], ["oldest", "middle"])
+
+    def test_compiled_redaction_matches_per_marker_substitution(self) -> None:
+        def sequential(text: str, markers: tuple[str, ...]) -> str:
+            for marker in markers:
+                text = re.sub(marker, "[redacted-sensitive-marker]", text, flags=re.IGNORECASE)
+            return text
+
+        text = "\n".join(
+            [
+                "Authorization:  Bearer abc and API-KEY = 1, api_key:2",
+                "GITHUB_TOKEN=ghp_xyz slack_webhook_url=https://hooks.slack.test XOXB-123",
+                "password: hunter2 / Client_Secret= s / access_token : t",
+                "Bump dependency versions (#12345, @someone)",
+            ]
+        )
+        markers = export_knowledge_jsonl.SECRET_MARKERS
+        redact = export_knowledge_jsonl.redact_secret_like_text
+        self.assertEqual(redact(text), sequential(text, markers))
+        self.assertNotIn("ghp_", redact(text))
+        self.assertIs(export_knowledge_jsonl.compile_markers(markers), export_knowledge_jsonl.compile_markers(markers))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            marker_file = Path(tmp_dir) / "markers.txt"
+            marker_file.write_text("# internal hosts\n\nhooks\\.slack\\.test\n", encoding="utf-8")
+            custom = export_knowledge_jsonl.load_marker_set(marker_file)
+        self.assertEqual(custom, (r"hooks\.slack\.test",))
+        self.assertEqual(redact(text, custom), sequential(text, custom))
+        self.assertIn("ghp_", redact(text, custom))
+        self.assertEqual(redact(text, ()), text)
+        # Markers without a literal first character skip the first-character prefilter.
+        for custom in ((r"(?:ghp|xoxb)[_-]", "password"), ("token|secret",)):
+            self.assertIsNone(export_knowledge_jsonl.marker_first_chars(custom))
+            self.assertEqual(redact(text, custom), sequential(text, custom))
+
+    def test_reads_every_format_check_release_writes(self) -> None:
+        script = ROOT / ".github" / "scripts" / "check_release.py"
+        spec = importlib.util.spec_from_file_location("check_release", script)
+        check_release = importlib.util.module_from_spec(spec)
+        assert spec.loader is not None
+        sys.modules[spec.name] = check_release
+        spec.loader.exec_module(check_release)
+
+        feed = {
+            "generated_at": "2026-06-27T00:00:00Z",
+            "releases": [{"repo": "a/one", "tag": "v1.0.0", "name": "릴리스"}, {"repo": "b/two", "tag": "v2"}],
+            "schema_version": "github-stars-release-feed/v1",
+        }
+        names = ["feed.json", "feed.min.json", "feed.json.gz", "feed.ndjson", "feed.NDJSON.gz", "feed.jsonl"]
+        if check_release.zstandard is not None:
+            names += ["feed.json.zst", "feed.ndjson.zst"]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in names:
+                path = Path(tmp_dir) / name
+                check_release.write_json_file(path, feed)
+                self.assertEqual(export_knowledge_jsonl.load_feed(path), feed, name)
+                streamed = export_knowledge_jsonl.iter_feed_fields(path, chunk_size=16)
+                self.assertEqual([value for key, value, is_item in streamed if is_item], feed["releases"], name)
+
 
 if __name__ == "__main__":
     unittest.main()